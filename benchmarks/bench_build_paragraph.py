@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+SectionXmlParser._build_paragraph 성능 회귀 벤치마크
+
+run마다 findall(".//hp:run"), find(".//hp:equation"), findall(".//hp:t")를 반복하던
+이전 방식과 run 자식을 태그별로 한 번씩 분류하는 현재 방식을 같은 문단으로 비교합니다.
+
+사용법:
+    PYTHONPATH=src python benchmarks/bench_build_paragraph.py [--paragraphs 2000] [--repeat 5]
+"""
+
+import argparse
+import timeit
+from typing import Any, Dict, List
+from xml.etree import ElementTree
+
+from kp_parser.core.section_xml_parser import SectionXmlParser
+
+HP = "http://www.hancom.co.kr/hwpml/2011/paragraph"
+
+STYLE_INFO = {
+    "charPr-0": {"bold": False, "italic": False, "underline": False, "format": 0},
+    "charPr-1": {"bold": True, "italic": False, "underline": False, "format": 0},
+    "charPr-2": {"bold": False, "italic": True, "underline": False, "format": 0},
+    "charPr-3": {"bold": False, "italic": False, "underline": False, "format": 32},
+}
+
+
+def _run(text: str, char_pr: int, extra: str = "") -> str:
+    return f'<hp:run charPrIDRef="{char_pr}"><hp:t>{text}</hp:t>{extra}</hp:run>'
+
+
+def _paragraph(i: int, with_table: bool) -> str:
+    """본문 run 여러 개와 수식, (선택적으로) 3x3 표를 담은 문단"""
+    runs = [_run(f"본문 {i}-{j} 내용", j % 4) for j in range(6)]
+    runs.append(
+        _run(
+            "수식 앞",
+            0,
+            "<hp:equation><hp:script>a over b</hp:script></hp:equation>",
+        )
+    )
+    if with_table:
+        cells = "".join(
+            f"<hp:tc><hp:subList><hp:p>{_run(f'셀 {r}-{c}', c % 4)}</hp:p></hp:subList></hp:tc>"
+            for r in range(3)
+            for c in range(3)
+        )
+        runs.append(
+            f'<hp:run charPrIDRef="0"><hp:tbl><hp:tr>{cells}</hp:tr></hp:tbl></hp:run>'
+        )
+    return (
+        f'<hp:p styleIDRef="0">{"".join(runs)}'
+        '<hp:linesegarray><hp:lineseg textheight="1000"/></hp:linesegarray></hp:p>'
+    )
+
+
+def make_paragraphs(count: int, with_table: bool) -> List[ElementTree.Element]:
+    xml = (
+        f'<hs:sec xmlns:hs="urn:sec" xmlns:hp="{HP}">'
+        + "".join(_paragraph(i, with_table) for i in range(count))
+        + "</hs:sec>"
+    )
+    return list(ElementTree.fromstring(xml))
+
+
+def legacy_build_paragraph(
+    parser: SectionXmlParser, p_elem: ElementTree.Element, style_info: Dict[str, Any]
+) -> Dict[str, Any]:
+    """이전 방식: run마다 하위 요소를 경로 검색으로 다시 찾음 (이미지 제외)"""
+    namespaces = parser.namespaces
+    children: List[Dict[str, Any]] = []
+    for run in p_elem.findall(".//hp:run", namespaces):
+        char_pr_id = run.get("charPrIDRef")
+        style = style_info.get(f"charPr-{char_pr_id}", {}) if char_pr_id else {}
+        if style.get("bold"):
+            format_flag = 1
+        elif style.get("italic"):
+            format_flag = 2
+        elif style.get("underline"):
+            format_flag = 4
+        else:
+            format_flag = style.get("format", 0)
+
+        run.find("./hp:pic", namespaces)
+        equation_tag = run.find(".//hp:equation", namespaces)
+        if equation_tag:
+            children.append(parser._process_equation_in_paragraph(equation_tag))
+        for t in run.findall(".//hp:t", namespaces):
+            if t.text and t.text.strip():
+                children.append(
+                    {
+                        "detail": 0,
+                        "format": format_flag,
+                        "mode": "normal",
+                        "style": "",
+                        "text": t.text,
+                        "type": "text",
+                        "version": 1,
+                    }
+                )
+    return {"children": children}
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="_build_paragraph 벤치마크")
+    arg_parser.add_argument("--paragraphs", type=int, default=2000, help="문단 수")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수")
+    args = arg_parser.parse_args()
+
+    parser = SectionXmlParser()
+    parser._begin(STYLE_INFO, {}, "", None)
+
+    for with_table in (False, True):
+        paragraphs = make_paragraphs(args.paragraphs, with_table)
+
+        if not with_table:
+            # 중첩 run이 없으면 두 방식의 결과가 같아야 함
+            for p in paragraphs:
+                current = parser._build_paragraph(p, parser.style_info, "")["children"]
+                assert (
+                    current == legacy_build_paragraph(parser, p, STYLE_INFO)["children"]
+                )
+
+        legacy = min(
+            timeit.repeat(
+                lambda: [
+                    legacy_build_paragraph(parser, p, STYLE_INFO) for p in paragraphs
+                ],
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        current = min(
+            timeit.repeat(
+                lambda: [
+                    parser._build_paragraph(p, parser.style_info, "")
+                    for p in paragraphs
+                ],
+                number=1,
+                repeat=args.repeat,
+            )
+        )
+        label = "표 포함" if with_table else "본문만"
+        print(
+            f"[{label}] 문단 {args.paragraphs}개: 이전 {legacy * 1000:.1f}ms, "
+            f"현재 {current * 1000:.1f}ms ({legacy / current:.2f}배)"
+        )
+
+
+if __name__ == "__main__":
+    main()
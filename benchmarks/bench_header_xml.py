@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+HeaderXmlParser.parse 성능 회귀 벤치마크
+
+charPr마다 find(".//hh:bold") 등 조건 수만큼 하위 요소를 다시 검색하고 charPr와
+style을 따로 findall하던 이전 방식과, header.xml을 한 번 순회하며 함께 추출하는 현재
+방식을 같은 header.xml로 비교합니다. 같은 header.xml을 다시 파싱할 때(캐시 사용)의
+시간도 함께 출력합니다.
+
+사용법:
+    PYTHONPATH=src python benchmarks/bench_header_xml.py [--char-prs 3000] [--repeat 5]
+"""
+
+import argparse
+import random
+import timeit
+from typing import Any, Dict
+
+from kp_parser.core.header_xml_parser import _HEADER_CACHE, HeaderXmlParser
+from kp_parser.utils.config_utils import get_parsing_rule, to_clark
+
+HH = "http://www.hancom.co.kr/hwpml/2011/head"
+
+
+def _char_pr(i: int, rng: random.Random) -> str:
+    """실제 문서와 비슷한 하위 요소를 가진 charPr"""
+    children = [
+        '<hh:fontRef hangul="0" latin="0"/>',
+        '<hh:ratio hangul="100"/>',
+        '<hh:spacing hangul="0"/>',
+        '<hh:relSz hangul="100"/>',
+        '<hh:offset hangul="0"/>',
+    ]
+    if rng.random() < 0.3:
+        children.append("<hh:bold/>")
+    if rng.random() < 0.2:
+        children.append("<hh:italic/>")
+    underline = rng.choice(["NONE", "BOTTOM"])
+    children.append(f'<hh:underline type="{underline}" shape="SOLID" color="#000000"/>')
+    children.append(
+        '<hh:strikeout shape="NONE"/><hh:outline type="NONE"/><hh:shadow type="NONE"/>'
+    )
+    if rng.random() < 0.1:
+        children.append("<hh:subscript/>")
+    return f'<hh:charPr id="{i}" height="1000">{"".join(children)}</hh:charPr>'
+
+
+def make_header(char_prs: int) -> bytes:
+    """charPr, paraPr, style을 담은 header.xml"""
+    rng = random.Random(0)
+    para_prs = "".join(
+        f'<hh:paraPr id="{i}"><hh:align horizontal="LEFT"/>'
+        f'<hh:margin><hh:left value="0"/></hh:margin></hh:paraPr>'
+        for i in range(char_prs // 2)
+    )
+    styles = "".join(
+        f'<hh:style id="{i}" type="PARA" name="스타일{i}" engName="Style{i}" '
+        f'paraPrIDRef="0" charPrIDRef="{i}" nextStyleIDRef="0" langID="1042" lockForm="0"/>'
+        for i in range(200)
+    )
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?><hh:head xmlns:hh="{HH}"><hh:refList>'
+        f'<hh:charProperties>{"".join(_char_pr(i, rng) for i in range(char_prs))}</hh:charProperties>'
+        f"<hh:paraProperties>{para_prs}</hh:paraProperties>"
+        f"<hh:styles>{styles}</hh:styles></hh:refList></hh:head>"
+    ).encode("utf-8")
+
+
+def legacy_parse(parser: HeaderXmlParser, root: Any) -> Dict[str, Dict[str, Any]]:
+    """이전 방식: charPr마다 조건별로 하위 요소를 검색하고 style은 따로 검색"""
+    rules = get_parsing_rule("header_xml", parser.config_name)
+    namespaces = rules["namespaces"]
+    char_pr_rule = rules["style_extraction"]["charPr"]
+    paths = {
+        name: to_clark(path, namespaces)
+        for name, path in char_pr_rule["conditions"].items()
+    }
+    style_info: Dict[str, Dict[str, Any]] = {}
+    for char_pr in root.findall(to_clark(char_pr_rule["path"], namespaces)):
+        char_pr_id = char_pr.get("id")
+        if not char_pr_id:
+            continue
+        underline_tag = char_pr.find(paths["underline"])
+        style_info[f"charPr-{char_pr_id}"] = {
+            "bold": char_pr.find(paths["bold"]) is not None,
+            "italic": char_pr.find(paths["italic"]) is not None,
+            "underline": underline_tag is not None
+            and underline_tag.get("type", "NONE") != "NONE",
+            "format": (
+                32
+                if char_pr.find(paths["subscript"]) is not None
+                else (64 if char_pr.find(paths["superscript"]) is not None else 0)
+            ),
+        }
+    style_rule = rules["style_extraction"]["style"]
+    attributes = style_rule["attributes"]
+    for style in root.findall(to_clark(style_rule["path"], namespaces)):
+        style_id = style.get("id")
+        if not style_id:
+            continue
+        style_info[f"style-{style_id}"] = {
+            "type": style.get(attributes["type"], ""),
+            "name": style.get(attributes["name"], ""),
+            "engName": style.get(attributes["engName"], ""),
+            "paraPrIDRef": style.get(attributes["paraPrIDRef"], ""),
+            "charPrIDRef": style.get(attributes["charPrIDRef"], ""),
+            "nextStyleIDRef": style.get(attributes["nextStyleIDRef"], ""),
+            "langID": style.get(attributes["langID"], ""),
+            "lockForm": style.get(attributes["lockForm"], "0") == "1",
+        }
+    return style_info
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="HeaderXmlParser.parse 벤치마크")
+    arg_parser.add_argument("--char-prs", type=int, default=3000, help="charPr 수")
+    arg_parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수")
+    args = arg_parser.parse_args()
+
+    parser = HeaderXmlParser()
+    data = make_header(args.char_prs)
+    root = parser.backend.fromstring(data)
+
+    # 두 방식의 결과가 같아야 함
+    assert dict(parser.parse(root)) == legacy_parse(parser, root)
+
+    legacy = min(
+        timeit.repeat(lambda: legacy_parse(parser, root), number=1, repeat=args.repeat)
+    )
+    current = min(
+        timeit.repeat(lambda: parser.parse(root), number=1, repeat=args.repeat)
+    )
+    parser.parse(data)
+    cached = min(
+        timeit.repeat(lambda: parser.parse(data), number=1, repeat=args.repeat)
+    )
+    _HEADER_CACHE.clear()
+
+    print(
+        f"charPr {args.char_prs}개: 이전 {legacy * 1000:.1f}ms, 현재 {current * 1000:.1f}ms "
+        f"({legacy / current:.2f}배), 같은 header.xml 재사용 {cached * 1000:.2f}ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
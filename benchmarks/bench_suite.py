@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+합성 .hwpx 문서 기반 성능 측정 모음 실행기
+
+hwpx_generator로 지정한 크기의 합성 문서를 만든 뒤 ``suite.py``의 측정 항목
+(extract_hwpx_content, 각 파서, save_parsed_data, parse_hwpx_file)을 실행하여
+처리량(의약품/s, MB/s)과 최대 RSS를 출력합니다. 최대 RSS가 다른 항목의 영향을
+받지 않도록 측정 항목마다 새 프로세스에서 실행합니다.
+
+결과를 JSON으로 저장해 두고 ``--compare``로 이전 결과와 비교하면, 최소 시간이
+``--max-slowdown``배를 넘게 늘어난 항목이 있을 때 종료 코드 1로 끝나므로 원본
+문서 없이도 성능 회귀를 확인할 수 있습니다.
+
+사용법:
+    PYTHONPATH=src python benchmarks/bench_suite.py [--drugs 1000] [--sections 4] \\
+        [--repeat 5] [--filter Section] [--json result.json] \\
+        [--compare baseline.json] [--max-slowdown 1.25] [--hwpx data/input/example.hwpx]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from hwpx_generator import add_spec_arguments, generate_hwpx, spec_from_args
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+_MB = 1024 * 1024
+
+
+def _peak_rss() -> Optional[int]:
+    """현재 프로세스의 최대 RSS (바이트, 측정할 수 없으면 None)"""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def list_benchmarks(pattern: str = "") -> List[str]:
+    """``클래스.메서드`` 형식의 측정 항목 이름 목록"""
+    import suite
+
+    names = []
+    for cls in suite.BENCHMARKS:
+        for attr in sorted(vars(cls)):
+            name = f"{cls.__name__}.{attr}"
+            if attr.startswith("time_") and pattern.lower() in name.lower():
+                names.append(name)
+    return names
+
+
+def run_worker(name: str, repeat: int) -> Dict[str, Any]:
+    """측정 항목 하나를 현재 프로세스에서 실행 (한 번 미리 실행한 뒤 repeat번 측정)"""
+    import suite
+
+    class_name, method_name = name.split(".")
+    bench = getattr(suite, class_name)()
+    if hasattr(bench, "setup"):
+        bench.setup()
+    setup_rss = _peak_rss()
+    try:
+        fn = getattr(bench, method_name)
+        fn()
+        times = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            times.append(time.perf_counter() - start)
+    finally:
+        if hasattr(bench, "teardown"):
+            bench.teardown()
+    return {
+        "name": name,
+        "times": times,
+        "drugs": bench.drugs,
+        "input_bytes": bench.input_bytes,
+        "setup_rss": setup_rss,
+        "peak_rss": _peak_rss(),
+    }
+
+
+def run_benchmark(name: str, repeat: int, env: Dict[str, str]) -> Dict[str, Any]:
+    """측정 항목 하나를 새 프로세스에서 실행하고 처리량을 계산"""
+    completed = subprocess.run(
+        [
+            sys.executable,
+            os.path.abspath(__file__),
+            "--worker",
+            name,
+            "--repeat",
+            str(repeat),
+        ],
+        env=env,
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    result = json.loads(completed.stdout.decode("utf-8").splitlines()[-1])
+    best = min(result["times"])
+    result["min"] = best
+    result["median"] = statistics.median(result["times"])
+    result["drugs_per_sec"] = result["drugs"] / best if best > 0 else None
+    result["mb_per_sec"] = result["input_bytes"] / _MB / best if best > 0 else None
+    return result
+
+
+def _format_mb(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value / _MB:.1f}"
+
+
+def print_results(results: List[Dict[str, Any]]) -> None:
+    print(
+        f"{'측정 항목':<48} {'최소(ms)':>10} {'중앙값(ms)':>10} {'의약품/s':>10} "
+        f"{'MB/s':>8} {'준비 RSS(MB)':>12} {'최대 RSS(MB)':>12}"
+    )
+    for r in results:
+        print(
+            f"{r['name']:<48} {r['min'] * 1000:>10.1f} {r['median'] * 1000:>10.1f} "
+            f"{r['drugs_per_sec']:>10.0f} {r['mb_per_sec']:>8.1f} "
+            f"{_format_mb(r['setup_rss']):>12} {_format_mb(r['peak_rss']):>12}"
+        )
+
+
+def compare_results(
+    results: List[Dict[str, Any]], baseline: Dict[str, Any], max_slowdown: float
+) -> List[str]:
+    """이전 결과와 최소 시간을 비교하여 느려진 항목 이름 목록을 반환"""
+    previous = {r["name"]: r for r in baseline["results"]}
+    regressions = []
+    print(f"\n이전 결과와 비교 (허용 배율 {max_slowdown:.2f}배)")
+    for r in results:
+        old = previous.get(r["name"])
+        if old is None:
+            continue
+        ratio = r["min"] / old["min"] if old["min"] > 0 else float("inf")
+        mark = ""
+        if ratio > max_slowdown:
+            regressions.append(r["name"])
+            mark = "  <- 성능 저하"
+        print(
+            f"{r['name']:<48} {old['min'] * 1000:>10.1f} -> {r['min'] * 1000:>10.1f}ms ({ratio:.2f}배){mark}"
+        )
+    return regressions
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(
+        description="합성 .hwpx 문서 기반 성능 측정 모음"
+    )
+    add_spec_arguments(arg_parser)
+    arg_parser.add_argument(
+        "--hwpx",
+        default=None,
+        help="합성 문서 대신 측정할 .hwpx 파일 (의약품 수는 한 번 파싱하여 셈)",
+    )
+    arg_parser.add_argument("--repeat", type=int, default=5, help="반복 측정 횟수")
+    arg_parser.add_argument(
+        "--filter", default="", help="이름에 이 문자열이 들어간 측정 항목만 실행"
+    )
+    arg_parser.add_argument("--json", default=None, help="결과를 저장할 JSON 파일 경로")
+    arg_parser.add_argument(
+        "--compare", default=None, help="비교할 이전 결과 JSON 파일 경로"
+    )
+    arg_parser.add_argument(
+        "--max-slowdown",
+        type=float,
+        default=1.25,
+        help="성능 저하로 판단할 최소 시간 배율",
+    )
+    arg_parser.add_argument("--worker", default=None, help=argparse.SUPPRESS)
+    args = arg_parser.parse_args()
+
+    if args.repeat < 1:
+        arg_parser.error("--repeat는 1 이상이어야 합니다.")
+
+    if args.worker:
+        print(json.dumps(run_worker(args.worker, args.repeat)))
+        return
+
+    names = list_benchmarks(args.filter)
+    if not names:
+        arg_parser.error(f"실행할 측정 항목이 없습니다: {args.filter}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        env = dict(os.environ)
+        spec = spec_from_args(args)
+        if args.hwpx:
+            document = {"hwpx": args.hwpx}
+            env["KP_BENCH_HWPX"] = args.hwpx
+            env.pop("KP_BENCH_DRUGS", None)
+            print(f"측정 문서: {args.hwpx}")
+        else:
+            hwpx_path = os.path.join(tmp_dir, "synthetic.hwpx")
+            info = generate_hwpx(hwpx_path, spec)
+            document = {"spec": spec._asdict(), **info}
+            env["KP_BENCH_HWPX"] = hwpx_path
+            env["KP_BENCH_DRUGS"] = str(info["drugs"])
+            print(
+                f"합성 문서: 의약품 {info['drugs']}개, section {spec.sections}개, "
+                f"파일 {info['file_bytes'] / _MB:.2f}MB (section {info['section_bytes'] / _MB:.2f}MB)"
+            )
+
+        results = []
+        for name in names:
+            results.append(run_benchmark(name, args.repeat, env))
+            print(f"  {name} 완료", file=sys.stderr)
+
+    print()
+    print_results(results)
+
+    report = {
+        "python": sys.version.split()[0],
+        "document": document,
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.json}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare_results(results, baseline, args.max_slowdown)
+        if regressions:
+            print(f"\n성능 저하 항목 {len(regressions)}개: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""
+XML 백엔드(stdlib, lxml) 비교 벤치마크
+
+실제 .hwpx 문서의 section 하나를 각 백엔드로 파싱하여 DOM 생성, 스트리밍 문단 순회,
+의약품 레코드 생성(이미지 저장 제외) 시간을 비교합니다.
+
+사용법:
+    PYTHONPATH=src python benchmarks/bench_xml_backend.py data/input/example.hwpx \\
+        [--section Contents/section0.xml] [--repeat 3]
+"""
+
+import argparse
+import io
+import logging
+import tempfile
+import timeit
+from typing import Callable, Dict
+
+from kp_parser.core.section_xml_parser import SectionXmlParser
+from kp_parser.pipeline import load_document_info
+from kp_parser.utils.file_utils import HwpxPackage
+from kp_parser.utils.image_source import PackageImageSource
+from kp_parser.utils.logger import logger
+from kp_parser.utils.xml_backend import BACKEND_LXML, BACKEND_STDLIB, lxml_etree
+
+
+def _measure(fn: Callable[[], object], repeat: int) -> float:
+    return min(timeit.repeat(fn, number=1, repeat=repeat))
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="XML 백엔드 비교 벤치마크")
+    arg_parser.add_argument("hwpx_file", help="측정에 사용할 .hwpx 파일")
+    arg_parser.add_argument(
+        "--section", default=None, help="측정할 section 파일 (기본값: 첫 번째 section)"
+    )
+    arg_parser.add_argument("--repeat", type=int, default=3, help="반복 측정 횟수")
+    args = arg_parser.parse_args()
+
+    if lxml_etree is None:
+        print("lxml이 설치되어 있지 않아 비교할 수 없습니다.")
+        return
+
+    # 파싱 중 로그 출력이 측정에 섞이지 않도록 함
+    logger.setLevel(logging.WARNING)
+
+    package = HwpxPackage(args.hwpx_file)
+    section_name = args.section or package.section_files[0]
+    data = package.read_bytes(section_name)
+    print(f"{args.hwpx_file} {section_name} ({len(data) / 1024 / 1024:.1f}MB)")
+
+    results: Dict[str, Dict[str, float]] = {}
+    with tempfile.TemporaryDirectory() as output_dir:
+        for backend_name in (BACKEND_STDLIB, BACKEND_LXML):
+            parser = SectionXmlParser(xml_backend=backend_name)
+            backend = parser.backend
+            style_info, image_info = load_document_info(package, backend_name)
+
+            def parse_records(stream: bool) -> object:
+                source = io.BytesIO(data) if stream else backend.fromstring(data)
+                return list(
+                    parser.iter_sections(
+                        [source],
+                        style_info,
+                        image_info,
+                        output_dir=output_dir,
+                        image_source=PackageImageSource(package),
+                        stream=stream,
+                    )
+                )
+
+            results[backend_name] = {
+                "DOM 생성": _measure(lambda: backend.fromstring(data), args.repeat),
+                "스트리밍 문단 순회": _measure(
+                    lambda: sum(
+                        1 for _ in parser._iter_stream_paragraphs(io.BytesIO(data))
+                    ),
+                    args.repeat,
+                ),
+                "의약품 레코드 (DOM)": _measure(
+                    lambda: parse_records(False), args.repeat
+                ),
+                "의약품 레코드 (스트리밍)": _measure(
+                    lambda: parse_records(True), args.repeat
+                ),
+            }
+
+    for label in results[BACKEND_STDLIB]:
+        stdlib = results[BACKEND_STDLIB][label]
+        lxml = results[BACKEND_LXML][label]
+        print(
+            f"{label}: stdlib {stdlib * 1000:.1f}ms, lxml {lxml * 1000:.1f}ms "
+            f"({stdlib / lxml:.2f}배)"
+        )
+
+
+if __name__ == "__main__":
+    main()
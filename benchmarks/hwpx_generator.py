@@ -0,0 +1,391 @@
+#!/usr/bin/env python3
+"""
+합성 .hwpx 문서 생성기
+
+원본 문서 없이도 성능을 측정할 수 있도록, 파싱 규칙이 인식하는 구조(분류 문단,
+제목/영문 부제목 문단, 본문 문단, 그림, 수식, 표)를 가진 .hwpx 파일을 만듭니다.
+header.xml, content.hpf, section 파일 N개와 BinData 이미지를 담으며, 의약품 수,
+의약품당 문단 수, 문단당 run 수, 이미지와 수식 빈도를 지정할 수 있습니다.
+같은 설정과 seed로 만들면 항상 같은 파일이 만들어집니다.
+
+사용법:
+    PYTHONPATH=src python benchmarks/hwpx_generator.py out.hwpx \\
+        [--sections 4] [--drugs 1000] [--paragraphs 8] [--runs 3] \\
+        [--images 8] [--image-every 5] [--equation-every 7] [--preface 0] \\
+        [--subtitle-images] [--seed 0]
+"""
+
+import argparse
+import os
+import random
+import struct
+import zipfile
+import zlib
+from typing import Dict, List, NamedTuple
+
+HP = "http://www.hancom.co.kr/hwpml/2011/paragraph"
+HC = "http://www.hancom.co.kr/hwpml/2011/core"
+HH = "http://www.hancom.co.kr/hwpml/2011/head"
+HS = "http://www.hancom.co.kr/hwpml/2011/section"
+OPF = "http://www.idpf.org/2007/opf/"
+
+# 파싱 규칙의 분류 문단 스타일 ID, 제목/본문 글자 높이
+CATEGORY_STYLE_ID = "55"
+TITLE_HEIGHT = "1100"
+BODY_HEIGHT = "1000"
+
+# 본문에 섞어 쓸 단어와 수식
+_WORDS = (
+    "이 약은",
+    "성인",
+    "1일",
+    "1회",
+    "투여한다",
+    "증상에",
+    "따라",
+    "적절히",
+    "증감한다",
+    "다음",
+    "환자에는",
+    "투여하지",
+    "말",
+    "것",
+    "과민증",
+    "신장애",
+    "간장애",
+    "임부",
+    "수유부",
+    "소아",
+    "고령자",
+    "주의",
+    "mg",
+    "mL",
+    "정",
+    "캡슐",
+    "(",
+    ")",
+    "및",
+    "또는",
+)
+_EQUATIONS = (
+    "a over b",
+    "rm{H_2 O}",
+    "x ^{2} + y ^{2} = r ^{2}",
+    "sqrt {b ^{2} - 4ac}",
+    "sum _{i=1} ^{n} x_i",
+    "C_{max} TIMES 0.5",
+)
+
+
+class DocumentSpec(NamedTuple):
+    """합성 문서 설정"""
+
+    sections: int = 2  # section 파일 수
+    drugs: int = 100  # 전체 의약품 수 (section에 고르게 나눔)
+    paragraphs: int = 8  # 의약품당 본문 문단 수
+    runs: int = 3  # 본문 문단당 run 수
+    images: int = 4  # BinData 이미지 수 (마지막 하나는 WMF)
+    image_every: int = 5  # 본문 문단 몇 개마다 그림을 넣을지 (0이면 넣지 않음)
+    equation_every: int = 7  # 본문 문단 몇 개마다 수식을 넣을지 (0이면 넣지 않음)
+    table_every: int = 1  # 의약품 몇 개마다 표 문단을 넣을지 (0이면 넣지 않음)
+    preface: int = 0  # 첫 제목 문단 앞에 넣을 그림 문단 수 (의약품에 속하지 않는 문단)
+    subtitle_images: bool = False  # 영문 부제목을 그림이 있는 본문 높이 문단으로 넣을지
+    seed: int = 0  # 본문 단어 선택에 쓸 난수 seed
+
+
+def png(width: int, height: int) -> bytes:
+    """무늬가 있는 RGB PNG 이미지"""
+    raw = b"".join(
+        b"\x00" + bytes((x * 7 + y) % 256 for x in range(width * 3))
+        for y in range(height)
+    )
+
+    def chunk(tag: bytes, data: bytes) -> bytes:
+        return (
+            struct.pack(">I", len(data))
+            + tag
+            + data
+            + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF)
+        )
+
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(raw))
+        + chunk(b"IEND", b"")
+    )
+
+
+def wmf() -> bytes:
+    """Placeable 헤더만 있는 WMF 이미지 (변환 대상 이미지 형식)"""
+    return b"\xd7\xcd\xc6\x9a" + b"\x00" * 60
+
+
+def _image_names(spec: DocumentSpec) -> List[str]:
+    """BinData 이미지 파일 이름 목록 (마지막 하나는 WMF)"""
+    names = [f"image{i + 1}.png" for i in range(spec.images)]
+    if names:
+        names[-1] = f"image{spec.images}.wmf"
+    return names
+
+
+def build_header() -> str:
+    """본문 run이 참조하는 charPr와 스타일을 담은 header.xml"""
+    char_prs = (
+        '<hh:charPr id="0" height="1000"><hh:underline type="NONE"/></hh:charPr>'
+        '<hh:charPr id="1" height="1000"><hh:bold/><hh:underline type="NONE"/></hh:charPr>'
+        '<hh:charPr id="2" height="1000"><hh:italic/><hh:underline type="BOTTOM"/></hh:charPr>'
+        '<hh:charPr id="3" height="1000"><hh:subscript/><hh:underline type="NONE"/></hh:charPr>'
+        '<hh:charPr id="4" height="1000"><hh:superscript/><hh:underline type="NONE"/></hh:charPr>'
+    )
+    styles = (
+        '<hh:style id="0" type="PARA" name="바탕글" engName="Normal" paraPrIDRef="0" '
+        'charPrIDRef="0" nextStyleIDRef="0" langID="1042" lockForm="0"/>'
+        f'<hh:style id="{CATEGORY_STYLE_ID}" type="PARA" name="분류" engName="Category" '
+        'paraPrIDRef="0" charPrIDRef="1" nextStyleIDRef="0" langID="1042" lockForm="1"/>'
+    )
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?><hh:head xmlns:hh="{HH}"><hh:refList>'
+        f"<hh:charProperties>{char_prs}</hh:charProperties>"
+        f"<hh:styles>{styles}</hh:styles></hh:refList></hh:head>"
+    )
+
+
+def build_content_hpf(spec: DocumentSpec) -> str:
+    """BinData 이미지와 문서 파일 목록을 담은 content.hpf"""
+    items = []
+    for i, name in enumerate(_image_names(spec)):
+        media_type = "image/x-wmf" if name.endswith(".wmf") else "image/png"
+        items.append(
+            f'<opf:item id="image{i + 1}" href="BinData/{name}" media-type="{media_type}"/>'
+        )
+    items.append(
+        '<opf:item id="header" href="Contents/header.xml" media-type="application/xml"/>'
+    )
+    for k in range(spec.sections):
+        items.append(
+            f'<opf:item id="section{k}" href="Contents/section{k}.xml" '
+            'media-type="application/xml"/>'
+        )
+    return (
+        f'<?xml version="1.0" encoding="UTF-8"?><opf:package xmlns:opf="{OPF}">'
+        f'<opf:manifest>{"".join(items)}</opf:manifest></opf:package>'
+    )
+
+
+def _paragraph(runs: str, style: str = "0", height: str = BODY_HEIGHT) -> str:
+    return (
+        f'<hp:p styleIDRef="{style}">{runs}<hp:linesegarray>'
+        f'<hp:lineseg textheight="{height}"/></hp:linesegarray></hp:p>'
+    )
+
+
+def _run(text: str, char_pr: str = "0", extra: str = "") -> str:
+    return f'<hp:run charPrIDRef="{char_pr}"><hp:t>{text}</hp:t>{extra}</hp:run>'
+
+
+def _picture_run(image_id: int) -> str:
+    return _run(
+        "",
+        extra=(
+            f'<hp:pic><hp:sz width="{7200 + image_id * 100}" height="3600"/>'
+            f'<hc:img binaryItemIDRef="image{image_id}"/></hp:pic>'
+        ),
+    )
+
+
+def build_section(index: int, drugs: int, first_drug: int, spec: DocumentSpec) -> str:
+    """분류 문단과 의약품 drugs개를 담은 section XML
+
+    Args:
+        index: section 번호
+        drugs: 이 section에 넣을 의약품 수
+        first_drug: 이 section 첫 의약품의 전체 번호 (제목이 겹치지 않도록 사용)
+        spec: 문서 설정
+
+    Returns:
+        str: section XML
+    """
+    rng = random.Random(spec.seed * 1000003 + index)
+    image_count = spec.images
+    out = [
+        f'<?xml version="1.0" encoding="UTF-8"?>'
+        f'<hs:sec xmlns:hs="{HS}" xmlns:hp="{HP}" xmlns:hc="{HC}">',
+        _paragraph(_run(f"제{index + 1}장 분류{index + 1}"), style=CATEGORY_STYLE_ID),
+    ]
+    if index == 0 and image_count:
+        for i in range(spec.preface):
+            out.append(_paragraph(_run("머리말") + _picture_run(i % image_count + 1)))
+    body_index = 0
+    for d in range(first_drug, first_drug + drugs):
+        out.append(_paragraph(_run(f"의약품{d}"), height=TITLE_HEIGHT))
+        if image_count and spec.subtitle_images:
+            out.append(
+                _paragraph(_run(f"Drug {d}") + _picture_run(d % image_count + 1))
+            )
+        else:
+            out.append(_paragraph(_run(f"Drug {d}"), height=TITLE_HEIGHT))
+        for _ in range(spec.paragraphs):
+            body_index += 1
+            runs = []
+            for r in range(spec.runs):
+                text = " ".join(rng.choice(_WORDS) for _ in range(rng.randint(4, 12)))
+                runs.append(_run(text, str(r % 5)))
+            if image_count and spec.image_every and body_index % spec.image_every == 0:
+                runs.append(_picture_run(rng.randrange(image_count) + 1))
+            if spec.equation_every and body_index % spec.equation_every == 0:
+                script = rng.choice(_EQUATIONS)
+                runs.append(
+                    _run(
+                        "",
+                        extra=f"<hp:equation><hp:script>{script}</hp:script></hp:equation>",
+                    )
+                )
+            out.append(_paragraph("".join(runs)))
+        if spec.table_every and d % spec.table_every == 0:
+            cell = _paragraph(_run("표 셀 내용"))
+            out.append(
+                '<hp:p styleIDRef="0"><hp:run charPrIDRef="0"><hp:tbl><hp:tr><hp:tc>'
+                f"<hp:subList>{cell}</hp:subList></hp:tc></hp:tr></hp:tbl></hp:run></hp:p>"
+            )
+    out.append("</hs:sec>")
+    return "".join(out)
+
+
+def generate_hwpx(path: str, spec: DocumentSpec = DocumentSpec()) -> Dict[str, int]:
+    """합성 .hwpx 파일을 만듭니다.
+
+    Args:
+        path: 저장할 .hwpx 파일 경로
+        spec: 문서 설정
+
+    Returns:
+        Dict[str, int]: 만든 문서 정보
+            - drugs: 의약품 수
+            - file_bytes: .hwpx 파일 크기
+            - header_bytes: header.xml 크기
+            - section_bytes: section 파일 전체 크기 (압축 해제 기준)
+            - image_bytes: BinData 이미지 전체 크기
+    """
+    if spec.sections < 1:
+        raise ValueError(f"section 수는 1 이상이어야 합니다: {spec.sections}")
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    header = build_header().encode("utf-8")
+    info = {
+        "drugs": spec.drugs,
+        "header_bytes": len(header),
+        "section_bytes": 0,
+        "image_bytes": 0,
+    }
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("mimetype", "application/hwp+zip", zipfile.ZIP_STORED)
+        zf.writestr("Contents/header.xml", header)
+        zf.writestr("Contents/content.hpf", build_content_hpf(spec))
+
+        base, extra = divmod(spec.drugs, spec.sections)
+        first_drug = 0
+        for k in range(spec.sections):
+            drugs = base + (1 if k < extra else 0)
+            data = build_section(k, drugs, first_drug, spec).encode("utf-8")
+            zf.writestr(f"Contents/section{k}.xml", data)
+            info["section_bytes"] += len(data)
+            first_drug += drugs
+
+        for i, name in enumerate(_image_names(spec)):
+            data = wmf() if name.endswith(".wmf") else png(32 + i * 8, 24 + i * 4)
+            zf.writestr(f"BinData/{name}", data)
+            info["image_bytes"] += len(data)
+
+    info["file_bytes"] = os.path.getsize(path)
+    return info
+
+
+def add_spec_arguments(arg_parser: argparse.ArgumentParser) -> None:
+    """문서 설정 명령행 인자를 추가합니다."""
+    defaults = DocumentSpec()
+    arg_parser.add_argument(
+        "--sections", type=int, default=defaults.sections, help="section 파일 수"
+    )
+    arg_parser.add_argument(
+        "--drugs", type=int, default=defaults.drugs, help="전체 의약품 수"
+    )
+    arg_parser.add_argument(
+        "--paragraphs",
+        type=int,
+        default=defaults.paragraphs,
+        help="의약품당 본문 문단 수",
+    )
+    arg_parser.add_argument(
+        "--runs", type=int, default=defaults.runs, help="본문 문단당 run 수"
+    )
+    arg_parser.add_argument(
+        "--images", type=int, default=defaults.images, help="BinData 이미지 수"
+    )
+    arg_parser.add_argument(
+        "--image-every",
+        type=int,
+        default=defaults.image_every,
+        help="그림을 넣을 본문 문단 간격 (0이면 없음)",
+    )
+    arg_parser.add_argument(
+        "--equation-every",
+        type=int,
+        default=defaults.equation_every,
+        help="수식을 넣을 본문 문단 간격 (0이면 없음)",
+    )
+    arg_parser.add_argument(
+        "--table-every",
+        type=int,
+        default=defaults.table_every,
+        help="표를 넣을 의약품 간격 (0이면 없음)",
+    )
+    arg_parser.add_argument(
+        "--preface",
+        type=int,
+        default=defaults.preface,
+        help="첫 제목 문단 앞에 넣을 그림 문단 수",
+    )
+    arg_parser.add_argument(
+        "--subtitle-images",
+        action="store_true",
+        help="영문 부제목을 그림이 있는 본문 높이 문단으로 넣음",
+    )
+    arg_parser.add_argument("--seed", type=int, default=defaults.seed, help="난수 seed")
+
+
+def spec_from_args(args: argparse.Namespace) -> DocumentSpec:
+    """명령행 인자로 문서 설정을 만듭니다."""
+    return DocumentSpec(
+        sections=args.sections,
+        drugs=args.drugs,
+        paragraphs=args.paragraphs,
+        runs=args.runs,
+        images=args.images,
+        image_every=args.image_every,
+        equation_every=args.equation_every,
+        table_every=args.table_every,
+        preface=args.preface,
+        subtitle_images=args.subtitle_images,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description="합성 .hwpx 문서 생성기")
+    arg_parser.add_argument("output", help="저장할 .hwpx 파일 경로")
+    add_spec_arguments(arg_parser)
+    args = arg_parser.parse_args()
+
+    info = generate_hwpx(args.output, spec_from_args(args))
+    print(
+        f"{args.output}: 의약품 {info['drugs']}개, 파일 {info['file_bytes'] / 1024 / 1024:.2f}MB "
+        f"(section {info['section_bytes'] / 1024 / 1024:.2f}MB)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+"""
+합성 .hwpx 문서를 사용하는 성능 측정 항목
+
+asv와 같은 형식으로, 측정 항목 클래스마다 ``setup``(측정에서 제외할 준비 작업),
+``time_*``(측정할 작업), ``teardown``(정리)을 정의합니다. 처리량 계산을 위해
+``setup``에서 처리하는 의약품 수(``drugs``)와 입력 바이트 수(``input_bytes``)를
+설정합니다. 실행은 ``bench_suite.py``가 맡습니다.
+
+측정할 문서는 환경 변수로 지정합니다.
+    KP_BENCH_HWPX: .hwpx 파일 경로 (없으면 기본 설정의 합성 문서를 임시 디렉토리에 생성)
+    KP_BENCH_DRUGS: 문서의 의약품 수 (없으면 문서를 한 번 파싱하여 셈)
+"""
+
+import io
+import logging
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, List, Tuple
+
+from hwpx_generator import DocumentSpec, generate_hwpx
+
+from kp_parser.core.content_hpf_parser import ContentHpfParser
+from kp_parser.core.header_xml_parser import _HEADER_CACHE, HeaderXmlParser
+from kp_parser.core.section_xml_parser import SectionXmlParser
+from kp_parser.pipeline import load_document_info, parse_hwpx_file
+from kp_parser.utils.file_utils import HwpxPackage, extract_hwpx_content
+from kp_parser.utils.image_source import PackageImageSource
+from kp_parser.utils.image_store import ImageStore
+from kp_parser.utils.logger import logger
+from kp_parser.utils.output_utils import (
+    OUTPUT_FORMAT_FOLDER,
+    OUTPUT_FORMAT_JSONL,
+    OUTPUT_FORMAT_SQLITE,
+    save_parsed_data,
+)
+from kp_parser.utils.serializer import JsonSerializer
+
+ENV_HWPX = "KP_BENCH_HWPX"
+ENV_DRUGS = "KP_BENCH_DRUGS"
+
+
+def _count_drugs(hwpx_path: str) -> int:
+    """문서를 한 번 파싱하여 의약품 수를 셈"""
+    with tempfile.TemporaryDirectory() as tmp_dir, HwpxPackage(hwpx_path) as package:
+        parser = SectionXmlParser(image_store=ImageStore(tmp_dir))
+        style_info, image_info = load_document_info(package)
+        records = parser.iter_sections(
+            [package.read_bytes(name) for name in package.section_files],
+            style_info,
+            image_info,
+            output_dir=tmp_dir,
+            image_source=PackageImageSource(package),
+        )
+        return sum(1 for _ in records)
+
+
+def document() -> Tuple[str, int]:
+    """측정할 문서 경로와 의약품 수를 반환합니다."""
+    # 파싱 중 로그 출력이 측정에 섞이지 않도록 함
+    logger.setLevel(logging.WARNING)
+
+    hwpx_path = os.environ.get(ENV_HWPX)
+    if not hwpx_path:
+        spec = DocumentSpec()
+        name = "kp_bench_" + "_".join(str(value) for value in spec) + ".hwpx"
+        hwpx_path = os.path.join(tempfile.gettempdir(), name)
+        if not os.path.exists(hwpx_path):
+            generate_hwpx(hwpx_path, spec)
+        return hwpx_path, spec.drugs
+
+    drugs = os.environ.get(ENV_DRUGS)
+    return hwpx_path, int(drugs) if drugs else _count_drugs(hwpx_path)
+
+
+class ExtractHwpxContent:
+    """extract_hwpx_content: zip 해제와 XML 파싱"""
+
+    def setup(self) -> None:
+        self.hwpx_path, self.drugs = document()
+        self.input_bytes = os.path.getsize(self.hwpx_path)
+
+    def time_extract(self) -> None:
+        extract_hwpx_content(self.hwpx_path)
+
+    def time_extract_without_sections(self) -> None:
+        extract_hwpx_content(self.hwpx_path, load_sections=False)
+
+
+class HeaderXmlParse:
+    """HeaderXmlParser.parse: header.xml 스타일 정보 추출"""
+
+    def setup(self) -> None:
+        hwpx_path, self.drugs = document()
+        with HwpxPackage(hwpx_path) as package:
+            self.data = package.read_bytes("Contents/header.xml")
+        self.input_bytes = len(self.data)
+        self.parser = HeaderXmlParser()
+
+    def time_parse(self) -> None:
+        # 캐시를 거치지 않도록 XML 파싱부터 측정
+        self.parser.parse(self.parser.backend.fromstring(self.data))
+
+    def time_parse_cached(self) -> None:
+        self.parser.parse(self.data)
+
+    def teardown(self) -> None:
+        _HEADER_CACHE.clear()
+
+
+class ContentHpfParse:
+    """ContentHpfParser.parse: content.hpf 이미지 정보 추출"""
+
+    def setup(self) -> None:
+        hwpx_path, self.drugs = document()
+        with HwpxPackage(hwpx_path) as package:
+            self.data = package.read_bytes("Contents/content.hpf")
+        self.input_bytes = len(self.data)
+        self.parser = ContentHpfParser()
+
+    def time_parse(self) -> None:
+        self.parser.parse(self.parser.backend.fromstring(self.data))
+
+
+class SectionXmlParse:
+    """SectionXmlParser.iter_sections: 모든 section의 의약품 레코드 생성
+
+    이미지는 이미지 저장소에 저장하므로 첫 실행 뒤에는 이미지 쓰기가 거의 없습니다.
+    """
+
+    def setup(self) -> None:
+        hwpx_path, self.drugs = document()
+        self.package = HwpxPackage(hwpx_path)
+        self.sections = [
+            self.package.read_bytes(name) for name in self.package.section_files
+        ]
+        self.input_bytes = sum(len(data) for data in self.sections)
+        self.style_info, self.image_info = load_document_info(self.package)
+        self.tmp_dir = tempfile.mkdtemp(prefix="kp_bench_")
+        self.parser = SectionXmlParser(image_store=ImageStore(self.tmp_dir))
+
+    def _parse(self, stream: bool) -> None:
+        sources: List[Any] = (
+            [io.BytesIO(data) for data in self.sections] if stream else self.sections
+        )
+        for _ in self.parser.iter_sections(
+            sources,
+            self.style_info,
+            self.image_info,
+            output_dir=self.tmp_dir,
+            image_source=PackageImageSource(self.package),
+            stream=stream,
+        ):
+            pass
+
+    def time_parse_dom(self) -> None:
+        self._parse(stream=False)
+
+    def time_parse_stream(self) -> None:
+        self._parse(stream=True)
+
+    def teardown(self) -> None:
+        self.package.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+
+class SaveParsedData:
+    """save_parsed_data: 출력 형식별 저장 (입력 바이트는 직렬화한 레코드 크기)"""
+
+    def setup(self) -> None:
+        hwpx_path, self.drugs = document()
+        self.tmp_dir = tempfile.mkdtemp(prefix="kp_bench_")
+        with HwpxPackage(hwpx_path) as package:
+            style_info, image_info = load_document_info(package)
+            parser = SectionXmlParser(
+                image_store=ImageStore(os.path.join(self.tmp_dir, "images"))
+            )
+            self.records: List[Dict[str, Any]] = list(
+                parser.iter_sections(
+                    [package.read_bytes(name) for name in package.section_files],
+                    style_info,
+                    image_info,
+                    output_dir=self.tmp_dir,
+                    image_source=PackageImageSource(package),
+                )
+            )
+        serializer = JsonSerializer()
+        self.input_bytes = sum(len(serializer.dumps(r)) for r in self.records)
+        self.runs = 0
+
+    def _save(self, output_format: str) -> None:
+        self.runs += 1
+        output_dir = os.path.join(self.tmp_dir, f"{output_format}{self.runs}")
+        save_parsed_data(output_dir, self.records, output_format=output_format)
+
+    def time_save_folder(self) -> None:
+        self._save(OUTPUT_FORMAT_FOLDER)
+
+    def time_save_jsonl(self) -> None:
+        self._save(OUTPUT_FORMAT_JSONL)
+
+    def time_save_sqlite(self) -> None:
+        self._save(OUTPUT_FORMAT_SQLITE)
+
+    def teardown(self) -> None:
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+
+class ParseHwpxFile:
+    """parse_hwpx_file: 문서 하나의 전체 처리 (압축 해제부터 저장까지)"""
+
+    def setup(self) -> None:
+        self.hwpx_path, self.drugs = document()
+        self.input_bytes = os.path.getsize(self.hwpx_path)
+        self.tmp_dir = tempfile.mkdtemp(prefix="kp_bench_")
+        self.runs = 0
+
+    def _run(self, **kwargs: Any) -> None:
+        self.runs += 1
+        output_dir = os.path.join(self.tmp_dir, str(self.runs))
+        result = parse_hwpx_file(self.hwpx_path, output_dir, **kwargs)
+        if result["status"] != "ok":
+            raise RuntimeError(result["error"])
+
+    def time_parse_folder(self) -> None:
+        self._run()
+
+    def time_parse_stream_jsonl(self) -> None:
+        self._run(stream=True, output_format=OUTPUT_FORMAT_JSONL)
+
+    def teardown(self) -> None:
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+
+# bench_suite.py가 실행할 측정 항목 클래스
+BENCHMARKS = (
+    ExtractHwpxContent,
+    HeaderXmlParse,
+    ContentHpfParse,
+    SectionXmlParse,
+    SaveParsedData,
+    ParseHwpxFile,
+)
@@ -4,128 +4,377 @@
 """
 
 import argparse
-import os
 import json
-import re
+import os
+import sys
 from pathlib import Path
-from typing import Dict, Any, List, Union
-from xml.etree import ElementTree
-
-from kp_parser import ContentHpfParser, HeaderXmlParser, SectionXmlParser
-from kp_parser.utils.file_utils import extract_hwpx_content
-from kp_parser.utils.config_utils import get_parsing_rule
-
-
-def sanitize_filename(name: str) -> str:
-    """윈도우나 리눅스에서 파일/폴더 이름에 쓸 수 없는 문자 제거 및 기호 주변 공백 제거"""
-    # 먼저 파일명에 사용할 수 없는 문자를 언더스코어로 변경
-    name = re.sub(r'[\\/*?:"<>|]', "_", name)
-    # 문자 사이의 하이픈과 가운뎃점 주변 공백 제거 (기호는 유지)
-    name = re.sub(r"(\S)\s*([-·])\s*(\S)", r"\1\2\3", name)
-    return name.strip()
 
+from kp_parser.core.section_xml_parser import IMAGE_MODE_INLINE, IMAGE_MODES
+from kp_parser.pipeline import parse_hwpx_file, run_batch
+from kp_parser.utils.file_utils import find_hwpx_files
+from kp_parser.utils.image_normalizer import (
+    DISPLAY_MAX_WIDTH,
+    FORMAT_WEBP,
+    IMAGE_FORMATS,
+)
+from kp_parser.utils.output_utils import (  # 기존 main.save_parsed_data 사용처 호환
+    OUTPUT_FORMAT_FOLDER,
+    OUTPUT_FORMATS,
+    sanitize_filename,
+    save_parsed_data,
+)
+from kp_parser.utils.profiler import combine_reports
+from kp_parser.utils.xml_backend import XML_BACKENDS
 
-def save_parsed_data(output_dir: str, parsed_data: List[Dict[str, Any]]) -> None:
-    """파싱된 데이터를 각 의약품별 폴더에 저장
 
-    Args:
-        output_dir (str): 출력 디렉토리
-        parsed_data (List[Dict[str, Any]]): 파싱된 데이터
-    """
-    for item in parsed_data:
-        # 의약품명으로 폴더명 생성
-        folder_name = sanitize_filename(item.get("title", "untitled"))
-        folder_path = os.path.join(output_dir, folder_name)
-        os.makedirs(folder_path, exist_ok=True)
-
-        # 메타데이터 저장
-        metadata = {
-            "chapter": item.get("chapter"),
-            "section": item.get("section"),
-            "title": item.get("title"),
-            "subtitle": item.get("subtitle"),
-            "order": item.get("order"),
-        }
-        metadata_path = os.path.join(folder_path, "metadata.json")
-        with open(metadata_path, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
-
-        # 내용 저장
-        content = {
-            "root": {
-                "direction": "ltr",
-                "format": "",
-                "indent": 0,
-                "type": "root",
-                "version": 1,
-                "children": item.get("content", []),
-            }
-        }
-        content_path = os.path.join(folder_path, "data.json")
-        with open(content_path, "w", encoding="utf-8") as f:
-            json.dump(content, f, ensure_ascii=False, indent=2)
+def save_profile_report(path: str, results: list, top: int) -> None:
+    """문서별 측정 결과를 합쳐 JSON 파일로 저장 (처리 결과에서는 측정 결과를 뺌)"""
+    report = combine_reports(results, top)
+    for result in results:
+        result.pop("profile", None)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"성능 측정 결과가 {path}에 저장되었습니다.")
 
 
-def main():
+def main() -> int:
+    """명령행 인자에 따라 파싱하고 종료 코드를 반환 (실패한 문서가 있으면 1)"""
     parser = argparse.ArgumentParser(description="HWPX 파일 파싱")
-    parser.add_argument("input_file", help="입력 HWPX 파일 경로")
+    parser.add_argument(
+        "input_file",
+        help="입력 HWPX 파일 경로, 디렉토리 또는 glob 패턴 (예: 'data/input/*.hwpx')",
+    )
     parser.add_argument(
         "--output-dir", default="data/output/result", help="출력 디렉토리 경로"
     )
-    parser.add_argument("--debug", action="store_true", help="디버그 모드 활성화")
+    parser.add_argument(
+        "--debug",
+        action="store_true",
+        help="디버그 모드 활성화 (압축 해제 파일 저장, 결과 JSON 들여쓰기)",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="section XML을 DOM으로 만들지 않고 스트리밍 방식으로 파싱",
+    )
+    parser.add_argument(
+        "--image-store",
+        help="이미지를 내용 해시 기준으로 한 번만 저장할 저장소 디렉토리 "
+        "(지정하지 않으면 의약품별 폴더에 이미지를 복사)",
+    )
+    parser.add_argument(
+        "--image-mode",
+        choices=IMAGE_MODES,
+        default=IMAGE_MODE_INLINE,
+        help="이미지 노드 src 생성 방식 (inline: base64 포함, external: 저장소 파일 참조)",
+    )
+    parser.add_argument(
+        "--image-base-url",
+        default="",
+        help="external 모드에서 이미지 저장소 상대 경로 앞에 붙일 URL/경로",
+    )
+    parser.add_argument(
+        "--inline-max-bytes",
+        type=int,
+        default=0,
+        help="external 모드에서도 이 크기(바이트) 이하의 이미지는 base64로 포함",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="여러 문서를 처리할 때 사용할 작업자 프로세스 수 (기본값: CPU 수)",
+    )
+    parser.add_argument(
+        "--section-workers",
+        type=int,
+        default=1,
+        help="문서 하나를 처리할 때 section을 나누어 파싱할 작업자 프로세스 수 "
+        "(기본값: 1, 순차 파싱. section이 많은 큰 문서에서 2 이상으로 지정)",
+    )
+    parser.add_argument(
+        "--paragraph-workers",
+        type=int,
+        default=1,
+        help="문서 하나를 처리할 때 section 안의 문단을 의약품 경계에서 나누어 파싱할 "
+        "작업자 프로세스 수 (2 이상이면 --section-workers 대신 사용)",
+    )
+    parser.add_argument(
+        "--chunk-paragraphs",
+        type=int,
+        default=500,
+        help="--paragraph-workers 사용 시 작업 하나에 담을 최상위 문단 수의 기준값",
+    )
+    parser.add_argument(
+        "--format",
+        dest="output_format",
+        choices=OUTPUT_FORMATS,
+        default=OUTPUT_FORMAT_FOLDER,
+        help="출력 형식 (folder: 의약품별 폴더, jsonl: drugs.jsonl 한 파일, "
+        "sqlite: drugs.sqlite 데이터베이스 한 파일)",
+    )
+    parser.add_argument(
+        "--xml-backend",
+        choices=XML_BACKENDS,
+        default=None,
+        help="XML 파싱 백엔드 (auto: lxml이 있으면 lxml 사용, "
+        "기본값: 파싱 규칙 설정 파일의 xml_backend 값인 stdlib)",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="이전 실행 결과와 의약품별 지문을 비교하여 바뀐 의약품만 다시 저장하고 "
+        "사라진 의약품의 결과는 삭제",
+    )
+    parser.add_argument(
+        "--write-queue",
+        type=int,
+        default=0,
+        help="결과와 이미지 저장을 백그라운드 스레드에서 처리할 때 대기열에 쌓아 둘 "
+        "최대 작업 수 (기본값: 0, 파싱 중에 바로 저장. CPU가 2개 이상이면 64 정도로 "
+        "지정)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="파싱 결과 캐시 디렉토리. 입력 파일, 파싱 규칙, 버전, 파서 설정이 같은 "
+        "문서는 다시 파싱하지 않고 캐시된 결과를 저장 (기본값: 캐시 사용 안 함)",
+    )
+    parser.add_argument(
+        "--cache-max-mb",
+        type=int,
+        default=1024,
+        help="파싱 결과 캐시 디렉토리 전체 크기 상한 (MB, 넘으면 오래 사용하지 않은 "
+        "항목부터 삭제)",
+    )
+    parser.add_argument(
+        "--convert-vector",
+        metavar="CACHE_DIR",
+        default=None,
+        help="WMF/EMF 이미지를 LibreOffice(soffice)로 PNG로 변환하고 결과를 이 디렉토리에 "
+        "원본 내용 해시 기준으로 캐시 (변환 결과는 <출력 디렉토리>/vector_images.json, "
+        "기본값: 변환 안 함)",
+    )
+    parser.add_argument(
+        "--vector-workers",
+        type=int,
+        default=1,
+        help="WMF/EMF 변환 시 동시에 실행할 soffice 프로세스 수",
+    )
+    parser.add_argument(
+        "--retry-failed",
+        action="store_true",
+        help="--convert-vector 사용 시 이전 실행에서 변환에 실패한 이미지도 다시 변환",
+    )
+    parser.add_argument(
+        "--normalize-images",
+        metavar="CACHE_DIR",
+        default=None,
+        help="이미지를 표시 너비로 줄이고 다시 인코딩하여 이미지 노드에 사용하고 원본도 함께 "
+        "저장 (Pillow 필요). 결과는 이 디렉토리에 원본 해시와 설정 기준으로 캐시 "
+        "(기본값: 정규화 안 함)",
+    )
+    parser.add_argument(
+        "--image-width",
+        type=int,
+        default=DISPLAY_MAX_WIDTH,
+        help="정규화할 이미지의 최대 너비 (픽셀)",
+    )
+    parser.add_argument(
+        "--image-format",
+        choices=IMAGE_FORMATS,
+        default=FORMAT_WEBP,
+        help="정규화한 이미지 형식",
+    )
+    parser.add_argument(
+        "--image-quality",
+        type=int,
+        default=80,
+        help="정규화한 WebP 이미지 품질 (1-100)",
+    )
+    parser.add_argument(
+        "--image-workers",
+        type=int,
+        default=1,
+        help="이미지 정규화 작업자 프로세스 수",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="REPORT",
+        default=None,
+        help="단계별 시간, 계수(문단, run, 이미지, 읽고 쓴 바이트), 가장 느린 의약품을 측정하여 "
+        "이 JSON 파일에 저장 (작업자 프로세스에서 파싱한 section과 문단은 제외)",
+    )
+    parser.add_argument(
+        "--profile-cprofile",
+        action="store_true",
+        help="--profile에 cProfile 상위 함수를 포함하고 문서별 <출력 디렉토리>/profile.prof 저장",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="--profile에 tracemalloc 최대 메모리와 상위 할당 위치를 포함",
+    )
+    parser.add_argument(
+        "--profile-top",
+        type=int,
+        default=20,
+        help="보고서에 남길 가장 느린 의약품, 함수, 할당 위치 수",
+    )
     args = parser.parse_args()
+    if args.incremental and args.output_format != OUTPUT_FORMAT_FOLDER:
+        parser.error("--incremental은 --format folder에서만 사용할 수 있습니다.")
+    if args.cache_max_mb <= 0:
+        parser.error("--cache-max-mb는 0보다 커야 합니다.")
+    if args.write_queue < 0:
+        parser.error("--write-queue는 0 이상이어야 합니다.")
+    if args.inline_max_bytes < 0:
+        parser.error("--inline-max-bytes는 0 이상이어야 합니다.")
+    if args.workers is not None and args.workers < 1:
+        parser.error("--workers는 1 이상이어야 합니다.")
+    if args.section_workers < 1:
+        parser.error("--section-workers는 1 이상이어야 합니다.")
+    if args.paragraph_workers < 1:
+        parser.error("--paragraph-workers는 1 이상이어야 합니다.")
+    if args.chunk_paragraphs < 1:
+        parser.error("--chunk-paragraphs는 1 이상이어야 합니다.")
+    if args.vector_workers < 1:
+        parser.error("--vector-workers는 1 이상이어야 합니다.")
+    if args.image_width < 1:
+        parser.error("--image-width는 1 이상이어야 합니다.")
+    if not 1 <= args.image_quality <= 100:
+        parser.error("--image-quality는 1에서 100 사이여야 합니다.")
+    if args.image_workers < 1:
+        parser.error("--image-workers는 1 이상이어야 합니다.")
+    if (args.profile_cprofile or args.profile_memory) and not args.profile:
+        parser.error(
+            "--profile-cprofile, --profile-memory는 --profile과 함께 사용해야 합니다."
+        )
+    if args.profile_top < 1:
+        parser.error("--profile-top은 1 이상이어야 합니다.")
 
-    # 입력 파일 경로 설정
-    input_file = Path(args.input_file)
-    if not input_file.exists():
-        print(f"입력 파일을 찾을 수 없습니다: {input_file}")
-        return
+    # 입력 파일 목록 설정 (파일, 디렉토리 또는 glob 패턴)
+    input_files = find_hwpx_files(args.input_file)
+    if not input_files:
+        print(f"입력 파일을 찾을 수 없습니다: {args.input_file}")
+        return 1
 
     # 출력 디렉토리 생성
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
 
-    # HWPX 파일 압축 해제 및 내용 로드
-    content_map = extract_hwpx_content(
-        str(input_file),
-        extract_dir=str(output_dir.parent / "tmp"),
-        debug=args.debug,
-    )
-
-    # header.xml 파싱
-    header_parser = HeaderXmlParser()
-    header_xml = content_map.get("Contents/header.xml")
-    style_info: Dict[str, Any] = {}
-    if header_xml is not None:
-        if isinstance(header_xml, (str, ElementTree.Element)):
-            style_info = header_parser.parse(header_xml)
+    # section 파서 설정 (이미지 저장 및 참조 방식)
+    parser_options = {
+        "image_store": args.image_store,
+        "image_mode": args.image_mode,
+        "image_base_url": args.image_base_url,
+        "inline_max_bytes": args.inline_max_bytes,
+        "xml_backend": args.xml_backend,
+        "vector_cache_dir": args.convert_vector,
+        "vector_workers": args.vector_workers,
+        "vector_retry_failed": args.retry_failed,
+        "image_normalizer": (
+            {
+                "cache_dir": args.normalize_images,
+                "max_width": args.image_width,
+                "image_format": args.image_format,
+                "quality": args.image_quality,
+                "workers": args.image_workers,
+            }
+            if args.normalize_images
+            else None
+        ),
+    }
 
-    # section0.xml 파싱
-    section_parser = SectionXmlParser()
-    section0_xml = content_map.get("Contents/section0.xml")
-    if section0_xml is not None and isinstance(
-        section0_xml, (str, ElementTree.Element)
-    ):
-        # content.hpf에서 이미지 정보 가져오기
-        content_parser = ContentHpfParser()
-        content_hpf = content_map.get("Contents/content.hpf")
-        image_info: Dict[str, Any] = {}
-        if content_hpf is not None:
-            if isinstance(content_hpf, (str, ElementTree.Element)):
-                parsed_image_info = content_parser.parse(content_hpf)
-                if isinstance(parsed_image_info, list):
-                    # 이미지 정보를 id를 키로 하는 딕셔너리로 변환
-                    image_info = {img["id"]: img for img in parsed_image_info}
+    # 측정 설정 (문서별 Profiler 생성 인자)
+    profile = None
+    if args.profile:
+        profile = {
+            "cprofile": args.profile_cprofile,
+            "memory": args.profile_memory,
+            "top": args.profile_top,
+        }
 
-        parsed_data = section_parser.parse(
-            section0_xml, style_info, image_info, output_dir=str(output_dir)
+    is_batch = len(input_files) > 1 or not os.path.isfile(args.input_file)
+    if is_batch and (args.section_workers > 1 or args.paragraph_workers > 1):
+        # 문서 단위로 이미 프로세스 풀에서 나누어 파싱하므로 문서 안은 순차 파싱
+        parser.error(
+            "--section-workers, --paragraph-workers는 문서 하나를 파싱할 때만 사용할 수 "
+            "있습니다. 여러 문서는 --workers로 문서 단위로 나누어 파싱합니다."
+        )
+    if not is_batch:
+        # 단일 문서: 파싱하면서 완성된 의약품부터 바로 저장
+        result = parse_hwpx_file(
+            input_files[0],
+            str(output_dir),
+            extract_dir=str(output_dir.parent / "tmp"),
+            debug=args.debug,
+            stream=args.stream,
+            parser_options=parser_options,
+            section_workers=args.section_workers,
+            paragraph_workers=args.paragraph_workers,
+            chunk_paragraphs=args.chunk_paragraphs,
+            incremental=args.incremental,
+            output_format=args.output_format,
+            write_queue=args.write_queue,
+            cache_dir=args.cache_dir,
+            cache_max_bytes=args.cache_max_mb * 1024 * 1024,
+            profile=profile,
         )
+        if args.profile:
+            save_profile_report(args.profile, [result], args.profile_top)
+        if result["status"] != "ok":
+            print(f"파싱에 실패했습니다: {result['error']}")
+            return 1
+        print(f"파싱이 완료되었습니다. 결과가 {output_dir}에 저장되었습니다.")
+        return 0
 
-        # 파싱된 데이터 저장
-        save_parsed_data(str(output_dir), parsed_data)
+    # 여러 문서: 프로세스 풀에서 나누어 파싱하고 문서별 결과를 모아 보고
+    results = run_batch(
+        input_files,
+        str(output_dir),
+        workers=args.workers,
+        debug=args.debug,
+        stream=args.stream,
+        parser_options=parser_options,
+        incremental=args.incremental,
+        output_format=args.output_format,
+        write_queue=args.write_queue,
+        cache_dir=args.cache_dir,
+        cache_max_bytes=args.cache_max_mb * 1024 * 1024,
+        profile=profile,
+    )
+    if args.profile:
+        save_profile_report(args.profile, results, args.profile_top)
+    report_path = output_dir / "batch_report.json"
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(
+            {
+                "total": len(results),
+                "succeeded": sum(r["status"] == "ok" for r in results),
+                "failed": sum(r["status"] != "ok" for r in results),
+                "drugs": sum(r["drugs"] for r in results),
+                "elapsed": round(sum(r["elapsed"] for r in results), 3),
+                "documents": results,
+            },
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
 
-    print(f"파싱이 완료되었습니다. 결과가 {output_dir}에 저장되었습니다.")
+    for r in results:
+        if r["status"] != "ok":
+            print(f"파싱 실패: {r['input_file']} - {r['error']}")
+    print(
+        f"배치 파싱이 완료되었습니다. 문서 {len(results)}개 중 "
+        f"{sum(r['status'] == 'ok' for r in results)}개 성공. "
+        f"처리 결과가 {report_path}에 저장되었습니다."
+    )
+    return 1 if any(r["status"] != "ok" for r in results) else 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
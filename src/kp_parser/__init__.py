@@ -11,6 +11,7 @@ __author__ = "SO&CO"  # 작성자 정보
 from kp_parser.core.content_hpf_parser import ContentHpfParser
 from kp_parser.core.header_xml_parser import HeaderXmlParser
 from kp_parser.core.section_xml_parser import SectionXmlParser
+from kp_parser.pipeline import iter_hwpx_drugs
 
 # from kp_parser import * 사용 시 import될 항목들을 명시
 # 패키지의 공개 API를 정의
@@ -18,5 +19,6 @@ __all__ = [
     "ContentHpfParser",  # content.hpf 파일 파서
     "HeaderXmlParser",  # header.xml 파일 파서
     "SectionXmlParser",  # section{n}.xml 파일 파서
+    "iter_hwpx_drugs",  # 의약품 레코드 생성 파이프라인
     "__version__",  # 버전 정보
 ]
@@ -3,16 +3,21 @@
 
 이 모듈은 다음 기능들을 포함합니다:
 - ContentHpfParser: content.hpf 파일 파싱
+- hwp_to_latex: 한글 수식 스크립트를 LaTeX(KaTeX)로 변환
 - HeaderXmlParser: header.xml 파일 파싱
+- StyleTable: header.xml 스타일 정보 (charPrIDRef별 텍스트 서식)
 - SectionXmlParser: section{n}.xml 파일 파싱
 """
 
 from kp_parser.core.content_hpf_parser import ContentHpfParser
-from kp_parser.core.header_xml_parser import HeaderXmlParser
+from kp_parser.core.equation_converter import hwp_to_latex
+from kp_parser.core.header_xml_parser import HeaderXmlParser, StyleTable
 from kp_parser.core.section_xml_parser import SectionXmlParser
 
 __all__ = [
     "ContentHpfParser",
+    "hwp_to_latex",
     "HeaderXmlParser",
+    "StyleTable",
     "SectionXmlParser",
 ]
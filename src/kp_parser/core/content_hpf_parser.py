@@ -1,21 +1,36 @@
-from typing import Dict, List, Any, Union
+from typing import Any, Dict, List, Optional, Union
 from xml.etree import ElementTree
-from kp_parser.utils.config_utils import get_parsing_rule
+
+from kp_parser.utils.config_utils import (
+    ContentHpfRules,
+    get_compiled_rules,
+    get_parsing_rule,
+)
+from kp_parser.utils.xml_backend import get_xml_backend
 
 
 class ContentHpfParser:
     """content.hpf 파일 파싱을 위한 전용 파서"""
 
-    def __init__(self, config_name: str = "drug_manual_part2/parsing_rules"):
+    def __init__(
+        self,
+        config_name: str = "drug_manual_part2/parsing_rules",
+        xml_backend: Optional[str] = None,
+    ):
         """파서 초기화
 
         Args:
             config_name: 파싱 규칙 설정 파일 이름
+            xml_backend: XML 백엔드 이름 ("auto", "lxml", "stdlib").
+                None이면 설정 파일의 xml_backend 값을 사용
         """
         self.config_name = config_name
-        self.rules = get_parsing_rule("content_hpf", config_name=self.config_name)
-        if not self.rules:
-            raise ValueError(f"content_hpf 파싱 규칙을 찾을 수 없습니다.")
+        self.rules: ContentHpfRules = get_compiled_rules(
+            "content_hpf", config_name=self.config_name
+        )
+        self.backend = get_xml_backend(
+            xml_backend or get_parsing_rule("xml_backend", config_name)
+        )
 
     def parse(
         self, xml_content: Union[str, ElementTree.Element]
@@ -29,38 +44,32 @@ class ContentHpfParser:
             List[Dict[str, Any]]: 추출된 이미지 정보 목록
         """
         # XML 파싱 (문자열인 경우에만)
-        root = (
-            xml_content
-            if isinstance(xml_content, ElementTree.Element)
-            else ElementTree.fromstring(xml_content)
-        )
+        root = self.backend.load_root(xml_content)
 
-        # 네임스페이스 설정
-        namespaces = self.rules["namespaces"]
+        # 컴파일된 규칙 (경로는 Clark 표기법이므로 네임스페이스 인자가 필요 없음)
+        rules = self.rules
 
         # manifest 태그 찾기
-        manifest_path = self.rules["image_extraction"]["manifest"]["path"]
-        manifest = root.find(manifest_path, namespaces)
+        manifest = root.find(rules.manifest_path)
         if manifest is None:
             return []
 
         # 이미지 항목 추출
         images = []
-        item_rules = self.rules["image_extraction"]["item"]
-        for item in manifest.findall(item_rules["path"], namespaces):
+        for item in manifest.findall(rules.item_path):
             # media-type 조건 확인
             media_type = item.get("media-type", "")
-            if not media_type.startswith(item_rules["conditions"]["media_type"]):
+            if not media_type.startswith(rules.media_type_prefix):
                 continue
 
             # 이미지 정보 추출
             image_info = {
-                "type": item_rules["output_format"]["type"],
-                "version": item_rules["output_format"]["version"],
+                "type": rules.output_type,
+                "version": rules.output_version,
             }
 
             # 필드 매핑
-            for field, attr in item_rules["output_format"]["fields"].items():
+            for field, attr in rules.fields:
                 image_info[field] = item.get(attr)
 
             images.append(image_info)
@@ -0,0 +1,611 @@
+"""
+한글 수식 스크립트를 LaTeX(KaTeX)로 변환
+
+hp:equation/hp:script에 담긴 한글 수식 편집기 스크립트(예: ``a over b TIMES rm{H_2 O}``)를
+토큰으로 나눈 뒤 재귀 하강 방식으로 파싱하여 KaTeX가 렌더링할 수 있는 LaTeX 문자열을
+만듭니다. 지원하는 구문은 다음과 같습니다.
+
+- 분수: ``a over b``, ``a atop b``
+- 첨자: ``x^2``, ``x_i``, ``x sup 2``, ``x sub i``, ``10^-3`` (앞의 부호는 첨자에 포함)
+- 근호: ``sqrt x``, ``root n of x``
+- 글꼴: ``rm``, ``it``, ``bold`` (현재 묶음 ``{}``이 끝날 때까지, 첨자나 명령의 인자
+  자리에서는 다음 항목 하나에 적용)
+- 큰 연산자: ``sum from {i=1} to n``, ``int``, ``prod``, ``lim`` 등
+- 행렬: ``matrix{a & b # c & d}``, ``pmatrix``, ``bmatrix``, ``dmatrix``, ``cases``, ``pile``
+- 괄호: ``left ( ... right )``
+- 기호와 그리스 문자: ``TIMES``, ``DIV``, ``LEQ``, ``INF``, ``alpha``, ``OMEGA`` 등
+  (기호 키워드는 대문자만 인식하므로 ``in``, ``le`` 같은 소문자 단어는 그대로 둠)
+- 강세: ``bar``, ``vec``, ``hat``, ``dot``, ``tilde``, ``under`` 등
+- 따옴표 문자열과 한글은 ``\\text{}``로, ``#``은 줄바꿈, ``&``은 줄 맞춤으로 변환
+
+문서에는 같은 수식이 반복해서 나오므로 변환 결과는 원본 스크립트를 키로 하는 LRU
+캐시(최대 ``EQUATION_CACHE_SIZE``개)에 보관합니다. 잘못된 스크립트도 예외 없이 가능한
+만큼 변환합니다.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+# 변환 결과 형식 버전 (바뀌면 증분 파싱에서 모든 의약품을 다시 빌드)
+EQUATION_CONVERTER_VERSION = 2
+
+# 변환 결과 캐시 최대 항목 수
+EQUATION_CACHE_SIZE = 4096
+
+# 토큰 종류
+_WORD = "word"
+_NUMBER = "number"
+_QUOTE = "quote"
+_TEXT = "text"
+_OP = "op"
+_SYM = "sym"
+_OTHER = "other"
+
+_TOKEN_RE = re.compile(
+    r"""
+    (?P<space>\s+)
+    | (?P<quote>"[^"]*"?)
+    | (?P<word>[A-Za-z]+)
+    | (?P<number>\d+(?:\.\d+)?)
+    | (?P<text>[^\x00-\x7f]+)
+    | (?P<op><=|>=|!=|==|<<|>>|->|<-|\+-|-\+|[-+*/=<>()\[\]|,.;:!'?@])
+    | (?P<sym>[{}^_~`&\#])
+    | (?P<other>.)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+_Token = Tuple[str, str]
+
+# 연산자 토큰
+_OPERATORS = {
+    "<=": r"\leq",
+    ">=": r"\geq",
+    "!=": r"\neq",
+    "==": r"\equiv",
+    "<<": r"\ll",
+    ">>": r"\gg",
+    "->": r"\rightarrow",
+    "<-": r"\leftarrow",
+    "+-": r"\pm",
+    "-+": r"\mp",
+}
+
+# LaTeX에서 이스케이프해야 하는 문자
+_LATEX_ESCAPES = {
+    "#": r"\#",
+    "$": r"\$",
+    "%": r"\%",
+    "&": r"\&",
+    "\\": r"\backslash",
+}
+
+# 기호 키워드 (대문자만, 같은 철자의 소문자 단어는 일반 글자)
+_SYMBOLS = {
+    "TIMES": r"\times",
+    "DIV": r"\div",
+    "CDOT": r"\cdot",
+    "PLUSMINUS": r"\pm",
+    "MINUSPLUS": r"\mp",
+    "LEQ": r"\leq",
+    "LE": r"\leq",
+    "GEQ": r"\geq",
+    "GE": r"\geq",
+    "NEQ": r"\neq",
+    "APPROX": r"\approx",
+    "SIM": r"\sim",
+    "SIMEQ": r"\simeq",
+    "EQUIV": r"\equiv",
+    "CONG": r"\cong",
+    "PROPTO": r"\propto",
+    "INF": r"\infty",
+    "INFTY": r"\infty",
+    "INFINITY": r"\infty",
+    "PARTIAL": r"\partial",
+    "NABLA": r"\nabla",
+    "DEG": r"{}^{\circ}",
+    "CIRC": r"\circ",
+    "BULLET": r"\bullet",
+    "ANGLE": r"\angle",
+    "TRIANGLE": r"\triangle",
+    "PERP": r"\perp",
+    "PARALLEL": r"\parallel",
+    "THEREFORE": r"\therefore",
+    "BECAUSE": r"\because",
+    "IN": r"\in",
+    "NOTIN": r"\notin",
+    "OWNS": r"\ni",
+    "SUBSET": r"\subset",
+    "SUPERSET": r"\supset",
+    "SUBSETEQ": r"\subseteq",
+    "SUPSETEQ": r"\supseteq",
+    "CUP": r"\cup",
+    "CAP": r"\cap",
+    "EMPTYSET": r"\emptyset",
+    "FORALL": r"\forall",
+    "EXIST": r"\exists",
+    "EXISTS": r"\exists",
+    "CDOTS": r"\cdots",
+    "LDOTS": r"\ldots",
+    "VDOTS": r"\vdots",
+    "DDOTS": r"\ddots",
+    "RARROW": r"\rightarrow",
+    "LARROW": r"\leftarrow",
+    "LRARROW": r"\leftrightarrow",
+    "UPARROW": r"\uparrow",
+    "DOWNARROW": r"\downarrow",
+    "PRIME": r"\prime",
+    "HBAR": r"\hbar",
+    "LBRACE": r"\{",
+    "RBRACE": r"\}",
+}
+
+_GREEK = frozenset(
+    (
+        "alpha",
+        "beta",
+        "gamma",
+        "delta",
+        "epsilon",
+        "zeta",
+        "eta",
+        "theta",
+        "iota",
+        "kappa",
+        "lambda",
+        "mu",
+        "nu",
+        "xi",
+        "omicron",
+        "pi",
+        "rho",
+        "sigma",
+        "tau",
+        "upsilon",
+        "phi",
+        "chi",
+        "psi",
+        "omega",
+    )
+)
+_GREEK_VARIANTS = frozenset(
+    ("varepsilon", "vartheta", "varpi", "varrho", "varsigma", "varphi")
+)
+
+# 함수 이름 (소문자만, 단어 하나로 된 첨자는 일반 글자. 예: C_{max})
+_FUNCTIONS = frozenset(
+    (
+        "sin",
+        "cos",
+        "tan",
+        "cot",
+        "sec",
+        "csc",
+        "arcsin",
+        "arccos",
+        "arctan",
+        "sinh",
+        "cosh",
+        "tanh",
+        "coth",
+        "log",
+        "ln",
+        "lg",
+        "exp",
+        "det",
+        "max",
+        "min",
+        "gcd",
+        "arg",
+        "dim",
+        "ker",
+    )
+)
+
+# 큰 연산자 (from/to로 아래/위 범위 지정)
+_BIG_OPERATORS = {
+    "sum": r"\sum",
+    "prod": r"\prod",
+    "coprod": r"\coprod",
+    "int": r"\int",
+    "dint": r"\iint",
+    "tint": r"\iiint",
+    "oint": r"\oint",
+    "bigcup": r"\bigcup",
+    "bigcap": r"\bigcap",
+    "lim": r"\lim",
+}
+
+# 강세 (다음 항목 하나에 적용)
+_ACCENTS = {
+    "bar": r"\overline",
+    "vec": r"\vec",
+    "hat": r"\hat",
+    "dot": r"\dot",
+    "ddot": r"\ddot",
+    "tilde": r"\tilde",
+    "acute": r"\acute",
+    "grave": r"\grave",
+    "check": r"\check",
+    "under": r"\underline",
+    "dyad": r"\overleftrightarrow",
+}
+
+# 글꼴 (현재 묶음 끝까지 적용, 인자 자리에서는 다음 항목 하나에 적용)
+_FONTS = {
+    "rm": r"\mathrm",
+    "it": r"\mathit",
+    "bold": r"\mathbf",
+}
+
+# 행렬 종류별 LaTeX 환경
+_MATRICES = {
+    "matrix": ("matrix", ""),
+    "pmatrix": ("pmatrix", ""),
+    "bmatrix": ("bmatrix", ""),
+    "dmatrix": ("vmatrix", ""),
+    "cases": ("cases", ""),
+    "pile": ("array", "{c}"),
+    "lpile": ("array", "{l}"),
+    "rpile": ("array", "{r}"),
+}
+
+# left/right 괄호
+_DELIMITERS = {
+    "{": r"\{",
+    "}": r"\}",
+    "<": r"\langle",
+    ">": r"\rangle",
+    "lbrace": r"\{",
+    "rbrace": r"\}",
+    "langle": r"\langle",
+    "rangle": r"\rangle",
+    "||": r"\|",
+}
+
+_STOP_GROUP: FrozenSet[str] = frozenset(("}",))
+_STOP_RIGHT: FrozenSet[str] = frozenset(("right",))
+_CELL_STOPS: FrozenSet[str] = frozenset(("&", "#"))
+
+
+def tokenize(script: str) -> List[_Token]:
+    """수식 스크립트를 (종류, 값) 토큰 목록으로 나눕니다. (공백 제외)"""
+    tokens: List[_Token] = []
+    for match in _TOKEN_RE.finditer(script):
+        kind = match.lastgroup
+        if kind is not None and kind != "space":
+            tokens.append((kind, match.group()))
+    return tokens
+
+
+def _escape_text(text: str) -> str:
+    """\\text{} 안에 넣을 문자열 이스케이프"""
+    out = []
+    for ch in text:
+        if ch == "\\":
+            out.append(r"\textbackslash{}")
+        elif ch in "{}#$%&_":
+            out.append("\\" + ch)
+        elif ch == "^":
+            out.append(r"\^{}")
+        elif ch == "~":
+            out.append(r"\~{}")
+        else:
+            out.append(ch)
+    return "".join(out)
+
+
+def _ungroup(latex: str) -> str:
+    """전체가 하나의 ``{...}`` 묶음이면 바깥 중괄호를 제거"""
+    if len(latex) < 2 or latex[0] != "{" or latex[-1] != "}":
+        return latex
+    depth = 0
+    for i, ch in enumerate(latex):
+        if ch == "{" and (i == 0 or latex[i - 1] != "\\"):
+            depth += 1
+        elif ch == "}" and latex[i - 1] != "\\":
+            depth -= 1
+            if depth == 0 and i != len(latex) - 1:
+                return latex
+    return latex[1:-1]
+
+
+def _render_rows(rows: List[List[str]]) -> str:
+    """#(줄바꿈)과 &(줄 맞춤)으로 나뉜 내용을 LaTeX로 변환"""
+    if len(rows) == 1 and len(rows[0]) == 1:
+        return rows[0][0]
+    env = "aligned" if any(len(row) > 1 for row in rows) else "gathered"
+    body = r" \\ ".join(" & ".join(row) for row in rows)
+    return rf"\begin{{{env}}} {body} \end{{{env}}}"
+
+
+class _EquationParser:
+    """토큰 목록을 재귀 하강 방식으로 LaTeX 문자열로 변환"""
+
+    def __init__(self, tokens: List[_Token]):
+        self.tokens = tokens
+        self.pos = 0
+        # 0보다 크면 단어 하나로 된 첨자 안 (함수 이름을 일반 글자로 둠)
+        self._letters_only = 0
+
+    def _peek(self) -> Optional[_Token]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+
+    def _next(self) -> Optional[_Token]:
+        token = self._peek()
+        if token is not None:
+            self.pos += 1
+        return token
+
+    def _peek_word(self) -> str:
+        """다음 토큰이 단어면 소문자로 반환 (아니면 빈 문자열)"""
+        token = self._peek()
+        return token[1].lower() if token is not None and token[0] == _WORD else ""
+
+    def _at_stop(self, stops: FrozenSet[str]) -> bool:
+        token = self._peek()
+        if token is None:
+            return True
+        value = token[1].lower() if token[0] == _WORD else token[1]
+        return value in stops
+
+    def parse(self) -> str:
+        """스크립트 전체를 파싱 (최상위의 짝이 맞지 않는 닫는 중괄호는 무시)"""
+        return _render_rows(self.parse_rows(frozenset()))
+
+    def parse_rows(self, stops: FrozenSet[str]) -> List[List[str]]:
+        """#으로 나뉜 줄과 &로 나뉜 칸을 파싱"""
+        rows: List[List[str]] = [[]]
+        cell_stops = stops | _CELL_STOPS
+        while True:
+            rows[-1].append(self.parse_sequence(cell_stops))
+            token = self._peek()
+            if token is None or token[1] not in _CELL_STOPS:
+                return rows
+            self._next()
+            if token[1] == "#":
+                rows.append([])
+
+    def parse_sequence(self, stops: FrozenSet[str]) -> str:
+        """종료 토큰 전까지의 항목을 파싱 (over/atop과 글꼴 명령 처리)"""
+        items: List[str] = []
+        while not self._at_stop(stops):
+            word = self._peek_word()
+            if word in ("over", "atop"):
+                self._next()
+                numerator = _ungroup(items.pop()) if items else ""
+                denominator = _ungroup(self.parse_item(stops))
+                if word == "over":
+                    items.append(rf"\frac{{{numerator}}}{{{denominator}}}")
+                else:
+                    items.append(
+                        rf"\genfrac{{}}{{}}{{0pt}}{{}}{{{numerator}}}{{{denominator}}}"
+                    )
+            elif word in _FONTS:
+                self._next()
+                rest = self.parse_sequence(stops)
+                items.append(f"{_FONTS[word]}{{{_ungroup(rest)}}}")
+            else:
+                item = self.parse_item(stops)
+                if item:
+                    items.append(item)
+        return " ".join(items)
+
+    def parse_item(self, stops: FrozenSet[str]) -> str:
+        """항목 하나와 뒤따르는 아래/위 첨자를 파싱"""
+        if self._at_stop(stops):
+            return ""
+        base = self.parse_atom()
+        sub = sup = None
+        while True:
+            token = self._peek()
+            if token is None:
+                break
+            value = token[1].lower() if token[0] == _WORD else token[1]
+            if value in ("_", "sub") and sub is None:
+                self._next()
+                sub = self._script_operand()
+            elif value in ("^", "sup") and sup is None:
+                self._next()
+                sup = self._script_operand()
+            else:
+                break
+        if sub is None and sup is None:
+            return base
+        if not base:
+            base = "{}"
+        if sub is not None:
+            base += f"_{{{sub}}}"
+        if sup is not None:
+            base += f"^{{{sup}}}"
+        return base
+
+    def _group(self) -> str:
+        """여는 중괄호 다음부터 닫는 중괄호까지 파싱"""
+        rows = self.parse_rows(_STOP_GROUP)
+        self._next()  # 닫는 중괄호 (없으면 끝)
+        return "{" + _render_rows(rows) + "}"
+
+    def _operand(self) -> str:
+        """명령의 인자 하나 (중괄호 묶음이면 내용만)"""
+        return _ungroup(self.parse_atom())
+
+    def _is_word_ahead(self) -> bool:
+        """다음 인자가 단어 하나인지 확인 (``max``, ``{max}``)"""
+        ahead = self.tokens[self.pos : self.pos + 3]
+        if ahead and ahead[0][0] == _WORD:
+            return True
+        return (
+            len(ahead) == 3
+            and ahead[0][1] == "{"
+            and ahead[1][0] == _WORD
+            and ahead[2][1] == "}"
+        )
+
+    def _script_operand(self) -> str:
+        """첨자 인자 하나 (앞의 부호 포함, 예: ``10^-3``, ``C_{max}``)"""
+        sign = ""
+        token = self._peek()
+        if token is not None and token[0] == _OP and token[1] in ("-", "+"):
+            self._next()
+            sign = token[1]
+        letters_only = self._is_word_ahead()
+        self._letters_only += letters_only
+        try:
+            return sign + self._operand()
+        finally:
+            self._letters_only -= letters_only
+
+    def parse_atom(self) -> str:
+        """기본 항목 하나를 파싱"""
+        token = self._next()
+        if token is None:
+            return ""
+        kind, value = token
+
+        if kind == _SYM:
+            if value == "{":
+                return self._group()
+            if value == "~":
+                return r"\ "
+            if value == "`":
+                return r"\,"
+            if value in ("^", "_"):
+                # 밑이 없는 첨자
+                self.pos -= 1
+                return "{}"
+            if value == "#":
+                return r"\#"
+            if value == "&":
+                return r"\&"
+            # 짝이 맞지 않는 닫는 중괄호는 무시
+            return ""
+        if kind == _NUMBER:
+            return value
+        if kind == _QUOTE:
+            return rf"\text{{{_escape_text(value.strip(chr(34)))}}}"
+        if kind == _TEXT:
+            return rf"\text{{{_escape_text(value)}}}"
+        if kind == _OP:
+            return _OPERATORS.get(value, value)
+        if kind == _OTHER:
+            return _LATEX_ESCAPES.get(value, value)
+        return self._word(value)
+
+    def _word(self, word: str) -> str:
+        """단어 토큰 (키워드 또는 변수 이름)"""
+        lower = word.lower()
+
+        if lower == "sqrt":
+            return rf"\sqrt{{{self._operand()}}}"
+        if lower == "root":
+            degree = self._operand()
+            if self._peek_word() == "of":
+                self._next()
+            return rf"\sqrt[{degree}]{{{self._operand()}}}"
+        if lower in _ACCENTS:
+            return f"{_ACCENTS[lower]}{{{self._operand()}}}"
+        if lower in _FONTS:
+            # 인자 자리의 글꼴은 다음 항목 하나에 적용 (예: x^rm{A}, sqrt rm x)
+            return f"{_FONTS[lower]}{{{self._operand()}}}"
+        if lower in _MATRICES:
+            return self._matrix(*_MATRICES[lower])
+        if lower == "left":
+            return self._left_right()
+        if lower in _BIG_OPERATORS:
+            return self._big_operator(_BIG_OPERATORS[lower])
+        if word in _FUNCTIONS and not self._letters_only:
+            return "\\" + word
+        if lower == "mod":
+            return r"\bmod"
+        if word in _GREEK or word in _GREEK_VARIANTS:
+            return "\\" + word
+        if lower in _GREEK and (word.isupper() or word == word.capitalize()):
+            return "\\" + lower.capitalize()
+        symbol = _SYMBOLS.get(word)
+        if symbol is not None:
+            return symbol
+        if lower == "right":
+            # 짝이 없는 right와 괄호는 무시
+            self._next()
+            return ""
+        return word
+
+    def _matrix(self, env: str, columns: str) -> str:
+        """matrix{a & b # c & d} 형식의 행렬"""
+        token = self._peek()
+        if token is None or token[1] != "{":
+            return self.parse_atom()
+        self._next()
+        rows = self.parse_rows(_STOP_GROUP)
+        self._next()
+        if env == "array":
+            columns = "{" + columns[1] * max(len(row) for row in rows) + "}"
+        body = r" \\ ".join(" & ".join(row) for row in rows)
+        return rf"\begin{{{env}}}{columns} {body} \end{{{env}}}"
+
+    def _delimiter(self) -> str:
+        """left/right 뒤의 괄호 토큰"""
+        token = self._next()
+        if token is None:
+            return "."
+        value = token[1]
+        key = value.lower() if token[0] == _WORD else value
+        if key in _DELIMITERS:
+            return _DELIMITERS[key]
+        if token[0] in (_OP, _OTHER):
+            return value
+        # 괄호가 아닌 토큰은 내용으로 되돌림
+        self.pos -= 1
+        return "."
+
+    def _left_right(self) -> str:
+        """left ( ... right ) 형식의 크기 조절 괄호"""
+        opening = self._delimiter()
+        rows = self.parse_rows(_STOP_RIGHT)
+        closing = "."
+        if self._peek_word() == "right":
+            self._next()
+            closing = self._delimiter()
+        return rf"\left{opening} {_render_rows(rows)} \right{closing}"
+
+    def _big_operator(self, command: str) -> str:
+        """sum from a to b 형식의 큰 연산자"""
+        if self._peek_word() == "from":
+            self._next()
+            command += f"_{{{self._operand()}}}"
+        if self._peek_word() == "to":
+            self._next()
+            command += f"^{{{self._operand()}}}"
+        return command
+
+
+@lru_cache(maxsize=EQUATION_CACHE_SIZE)
+def hwp_to_latex(script: str) -> str:
+    """한글 수식 스크립트를 LaTeX 문자열로 변환합니다.
+
+    결과는 스크립트 문자열을 키로 LRU 캐시에 보관하므로 같은 수식은 한 번만 변환합니다.
+
+    Args:
+        script: hp:script의 수식 스크립트 (예: "a over b TIMES rm{H_2 O}")
+
+    Returns:
+        str: KaTeX로 렌더링할 수 있는 LaTeX 문자열
+    """
+    return _EquationParser(tokenize(script)).parse()
+
+
+def equation_node(script: str) -> Optional[Dict[str, Any]]:
+    """수식 스크립트로 Lexical 수식 노드를 만듭니다.
+
+    Args:
+        script: hp:script의 수식 스크립트
+
+    Returns:
+        Optional[Dict[str, Any]]: 수식 노드. 변환 결과가 비어 있으면 None
+    """
+    latex = hwp_to_latex(script.strip())
+    if not latex:
+        return None
+    return {"equation": latex, "inline": True, "type": "equation", "version": 1}
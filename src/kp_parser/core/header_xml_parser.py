@@ -1,37 +1,146 @@
-from typing import Dict, List, Any, Union
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
 from xml.etree import ElementTree
-from kp_parser.utils.config_utils import get_parsing_rule
+
+from kp_parser.utils.config_utils import (
+    HeaderXmlRules,
+    get_compiled_rules,
+    get_parsing_rule,
+)
+from kp_parser.utils.logger import logger
+from kp_parser.utils.xml_backend import get_xml_backend
+
+# Lexical 텍스트 노드 format 비트
+FORMAT_BOLD = 1
+FORMAT_ITALIC = 2
+FORMAT_STRIKETHROUGH = 4
+FORMAT_UNDERLINE = 8
+FORMAT_CODE = 16
+FORMAT_SUBSCRIPT = 32
+FORMAT_SUPERSCRIPT = 64
+
+# 스타일 정보 키 접두사
+CHAR_PR_PREFIX = "charPr-"
+STYLE_PREFIX = "style-"
+
+
+def _text_format(char_pr: Mapping[str, Any]) -> int:
+    """charPr 스타일 정보를 Lexical 텍스트 format 비트마스크로 변환"""
+    text_format: int = char_pr.get("format", 0)
+    if char_pr.get("bold"):
+        text_format |= FORMAT_BOLD
+    if char_pr.get("italic"):
+        text_format |= FORMAT_ITALIC
+    if char_pr.get("underline"):
+        text_format |= FORMAT_UNDERLINE
+    return text_format
+
+
+class StyleTable(Mapping[str, Dict[str, Any]]):
+    """header.xml 스타일 정보
+
+    ``"charPr-<id>"``, ``"style-<id>"``를 키로 하는 스타일 정보 딕셔너리처럼
+    조회할 수 있고, 추가로 정수 charPrIDRef를 인덱스로 하는 Lexical 텍스트 format
+    비트마스크 목록(``formats``)을 미리 계산해 둡니다. 굵게와 기울임처럼 여러
+    서식이 겹친 글자도 비트를 모두 합친 값을 가집니다.
+    """
+
+    def __init__(self, style_info: Dict[str, Dict[str, Any]]):
+        """초기화
+
+        Args:
+            style_info: 스타일 id를 키로 하는 스타일 정보
+        """
+        self._info = style_info
+        formats: Dict[int, int] = {}
+        for key, value in style_info.items():
+            if not key.startswith(CHAR_PR_PREFIX):
+                continue
+            char_pr_id = key[len(CHAR_PR_PREFIX) :]
+            if char_pr_id.isdigit():
+                formats[int(char_pr_id)] = _text_format(value)
+        # 정의되지 않은 id는 서식 없음(0)
+        self.formats: List[int] = [0] * (max(formats) + 1 if formats else 0)
+        for index, text_format in formats.items():
+            self.formats[index] = text_format
+
+    @classmethod
+    def of(cls, style_info: Mapping[str, Dict[str, Any]]) -> "StyleTable":
+        """스타일 정보를 StyleTable로 반환 (이미 StyleTable이면 그대로)"""
+        if isinstance(style_info, cls):
+            return style_info
+        return cls(dict(style_info))
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        return self._info[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._info)
+
+    def __len__(self) -> int:
+        return len(self._info)
+
+    def text_format(self, char_pr_id: Optional[str]) -> int:
+        """charPrIDRef에 해당하는 Lexical 텍스트 format 비트마스크 (없으면 0)"""
+        try:
+            index = int(char_pr_id)  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return 0
+        if 0 <= index < len(self.formats):
+            return self.formats[index]
+        return 0
+
+
+# header.xml 내용 해시별 스타일 표 (같은 서식 파일로 만든 문서끼리 공유)
+# 키: (설정 파일 이름, SHA-256), 값: (파싱에 사용한 컴파일된 규칙, 스타일 표)
+_HEADER_CACHE: "OrderedDict[Tuple[str, str], Tuple[HeaderXmlRules, StyleTable]]" = (
+    OrderedDict()
+)
+_HEADER_CACHE_SIZE = 32
 
 
 class HeaderXmlParser:
     """header.xml 파일 파싱을 위한 전용 파서"""
 
-    def __init__(self, config_name: str = "drug_manual_part2/parsing_rules"):
+    def __init__(
+        self,
+        config_name: str = "drug_manual_part2/parsing_rules",
+        xml_backend: Optional[str] = None,
+    ):
         """파서 초기화
 
         Args:
             config_name: 파싱 규칙 설정 파일 이름
+            xml_backend: XML 백엔드 이름 ("auto", "lxml", "stdlib").
+                None이면 설정 파일의 xml_backend 값을 사용
         """
         self.config_name = config_name
-        self.rules = get_parsing_rule("header_xml", config_name=self.config_name)
-        if not self.rules:
-            raise ValueError(f"header_xml 파싱 규칙을 찾을 수 없습니다.")
+        self.rules: HeaderXmlRules = get_compiled_rules(
+            "header_xml", config_name=self.config_name
+        )
+        self.backend = get_xml_backend(
+            xml_backend or get_parsing_rule("xml_backend", config_name)
+        )
 
-    def parse(
-        self, xml_content: Union[str, ElementTree.Element]
-    ) -> Dict[str, Dict[str, Union[bool, int, str]]]:
+    def parse(self, xml_content: Union[str, bytes, ElementTree.Element]) -> StyleTable:
         """header.xml 파일을 파싱합니다.
 
+        charPr와 style 요소는 문서를 한 번 순회하며 함께 추출합니다. XML 문자열/바이트가
+        주어지면 내용 해시별로 결과를 캐시하므로, 같은 서식 파일로 만든 문서는 다시
+        파싱하지 않고 같은 스타일 표를 공유합니다. (반환된 스타일 정보는 수정하지 않아야 함)
+
         Args:
-            xml_content: header.xml 파일의 XML 내용 (문자열 또는 ElementTree.Element)
+            xml_content: header.xml 파일의 XML 내용 (문자열, 바이트 또는 ElementTree.Element)
 
         Returns:
-            Dict[str, Dict[str, Union[bool, int, str]]]: 스타일 ID를 키로, 스타일 정보를 값으로 하는 딕셔너리
+            StyleTable: 스타일 ID를 키로, 스타일 정보를 값으로 하는 스타일 표
+                (정수 charPrIDRef별 텍스트 format 비트마스크 포함)
                 - charPr 스타일:
                     - bold: 볼드체 여부
                     - italic: 이탤릭체 여부
                     - underline: 밑줄 여부
-                    - format: 서식 플래그 (0: 기본, 32: 아래첨자, 64: 위첨자)
+                    - format: 첨자 서식 플래그 (0: 기본, 32: 아래첨자, 64: 위첨자)
                 - style 스타일:
                     - type: 스타일 타입 (PARA, CHAR)
                     - name: 스타일 이름
@@ -42,81 +151,97 @@ class HeaderXmlParser:
                     - langID: 언어 ID
                     - lockForm: 잠금 여부
         """
+        # 원본 내용이 주어지면 해시로 이전에 파싱한 스타일 표를 찾음
+        cache_key = None
+        if isinstance(xml_content, (str, bytes)):
+            data = (
+                xml_content.encode("utf-8")
+                if isinstance(xml_content, str)
+                else xml_content
+            )
+            cache_key = (self.config_name, hashlib.sha256(data).hexdigest())
+            cached = _HEADER_CACHE.get(cache_key)
+            # 설정 파일이 바뀌어 규칙을 다시 컴파일한 경우에는 다시 파싱
+            if cached is not None and cached[0] is self.rules:
+                _HEADER_CACHE.move_to_end(cache_key)
+                logger.debug(f"header.xml 스타일 표 캐시 사용: {cache_key[1][:12]}")
+                return cached[1]
+
         # XML 파싱 (문자열인 경우에만)
-        root = (
-            xml_content
-            if isinstance(xml_content, ElementTree.Element)
-            else ElementTree.fromstring(xml_content)
-        )
+        root = self.backend.load_root(xml_content)
+        table = StyleTable(self._parse_root(root))
 
-        # 네임스페이스 설정
-        namespaces = self.rules["namespaces"]
+        if cache_key is not None:
+            _HEADER_CACHE[cache_key] = (self.rules, table)
+            _HEADER_CACHE.move_to_end(cache_key)
+            while len(_HEADER_CACHE) > _HEADER_CACHE_SIZE:
+                _HEADER_CACHE.popitem(last=False)
+        return table
 
-        # 스타일 정보 파싱
-        style_info = {}
+    def _parse_root(self, root: ElementTree.Element) -> Dict[str, Dict[str, Any]]:
+        """header.xml을 한 번 순회하며 charPr와 style 요소의 스타일 정보를 추출
 
-        # charPr 요소 파싱
-        char_pr_rules = self.rules["style_extraction"]["charPr"]
-        for char_pr in root.findall(char_pr_rules["path"], namespaces):
-            char_pr_id = char_pr.get("id")
-            if not char_pr_id:
-                continue
+        Args:
+            root: header.xml 루트 요소
 
-            # underline 태그 찾기
-            underline_tag = char_pr.find(
-                char_pr_rules["conditions"]["underline"], namespaces
-            )
-            is_underline = (
-                underline_tag is not None
-                and underline_tag.get("type", "NONE") != "NONE"
-            )
+        Returns:
+            Dict[str, Dict[str, Any]]: 스타일 ID를 키로 하는 스타일 정보
+        """
+        # 컴파일된 규칙 (태그는 Clark 표기법)
+        rules = self.rules
+        char_pr_tag = rules.char_pr_tag
+        style_tag = rules.style_tag
+        condition_tags = rules.condition_tags
+        attributes = dict(rules.style_attributes)
+
+        style_info: Dict[str, Dict[str, Any]] = {}
+        for elem in root.iter():
+            tag = elem.tag
+            if tag == char_pr_tag:
+                char_pr_id = elem.get("id")
+                if not char_pr_id:
+                    continue
 
-            # 스타일 정보 추출
-            style_info[f"charPr-{char_pr_id}"] = {
-                "bold": char_pr.find(char_pr_rules["conditions"]["bold"], namespaces)
-                is not None,
-                "italic": char_pr.find(
-                    char_pr_rules["conditions"]["italic"], namespaces
+                # 하위 요소를 한 번만 순회하며 조건별 첫 요소를 모음
+                found: Dict[str, ElementTree.Element] = {}
+                for child in elem.iter():
+                    name = condition_tags.get(child.tag)
+                    if name is not None and name not in found:
+                        found[name] = child
+
+                underline_tag = found.get("underline")
+                is_underline = (
+                    underline_tag is not None
+                    and underline_tag.get("type", "NONE") != "NONE"
                 )
-                is not None,
-                "underline": is_underline,
-                "format": (
-                    32
-                    if char_pr.find(
-                        char_pr_rules["conditions"]["subscript"], namespaces
-                    )
-                    is not None
-                    else (
-                        64
-                        if char_pr.find(
-                            char_pr_rules["conditions"]["superscript"], namespaces
-                        )
-                        is not None
-                        else 0
-                    )
-                ),
-            }
-
-        # style 요소 파싱
-        style_rules = self.rules["style_extraction"]["style"]
-        for style in root.findall(style_rules["path"], namespaces):
-            style_id = style.get("id")
-            if not style_id:
-                continue
 
-            # 스타일 정보 추출
-            style_info[f"style-{style_id}"] = {
-                "type": style.get(style_rules["attributes"]["type"], ""),
-                "name": style.get(style_rules["attributes"]["name"], ""),
-                "engName": style.get(style_rules["attributes"]["engName"], ""),
-                "paraPrIDRef": style.get(style_rules["attributes"]["paraPrIDRef"], ""),
-                "charPrIDRef": style.get(style_rules["attributes"]["charPrIDRef"], ""),
-                "nextStyleIDRef": style.get(
-                    style_rules["attributes"]["nextStyleIDRef"], ""
-                ),
-                "langID": style.get(style_rules["attributes"]["langID"], ""),
-                "lockForm": style.get(style_rules["attributes"]["lockForm"], "0")
-                == "1",
-            }
+                # 스타일 정보 추출
+                style_info[f"{CHAR_PR_PREFIX}{char_pr_id}"] = {
+                    "bold": "bold" in found,
+                    "italic": "italic" in found,
+                    "underline": is_underline,
+                    "format": (
+                        FORMAT_SUBSCRIPT
+                        if "subscript" in found
+                        else (FORMAT_SUPERSCRIPT if "superscript" in found else 0)
+                    ),
+                }
+
+            elif tag == style_tag:
+                style_id = elem.get("id")
+                if not style_id:
+                    continue
+
+                # 스타일 정보 추출
+                style_info[f"{STYLE_PREFIX}{style_id}"] = {
+                    "type": elem.get(attributes["type"], ""),
+                    "name": elem.get(attributes["name"], ""),
+                    "engName": elem.get(attributes["engName"], ""),
+                    "paraPrIDRef": elem.get(attributes["paraPrIDRef"], ""),
+                    "charPrIDRef": elem.get(attributes["charPrIDRef"], ""),
+                    "nextStyleIDRef": elem.get(attributes["nextStyleIDRef"], ""),
+                    "langID": elem.get(attributes["langID"], ""),
+                    "lockForm": elem.get(attributes["lockForm"], "0") == "1",
+                }
 
         return style_info
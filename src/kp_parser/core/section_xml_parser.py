@@ -1,27 +1,290 @@
-from typing import Dict, Any, Optional, Union, List
-from xml.etree import ElementTree
-import re
-import os
 import base64
+import io
+import itertools
+import os
+import re
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
+from xml.etree import ElementTree
 
-from kp_parser.utils.config_utils import get_parsing_rule
+from kp_parser.core.equation_converter import equation_node
+from kp_parser.core.header_xml_parser import StyleTable
+from kp_parser.utils.async_writer import AsyncWriter, make_dirs, write_file
+from kp_parser.utils.config_utils import (
+    SectionXmlRules,
+    get_compiled_rules,
+    get_parsing_rule,
+)
+from kp_parser.utils.image_normalizer import (
+    DISPLAY_MAX_WIDTH,
+    ImageNormalizer,
+    normalized_href,
+    read_normalized,
+)
+from kp_parser.utils.image_size import hwpunit_to_pixels, sniff_image_size
+from kp_parser.utils.image_source import EmptyImageSource, ImageSource
+from kp_parser.utils.image_store import ImageStore
 from kp_parser.utils.logger import logger
+from kp_parser.utils.output_utils import drug_folder_name
+from kp_parser.utils.profiler import count, count_paragraph, profiled, timer
+from kp_parser.utils.vector_image import (
+    CONVERTED_EXTENSION,
+    VectorImageConverter,
+    read_converted,
+)
+from kp_parser.utils.xml_backend import get_xml_backend
+
+# 이미지 노드 src 생성 방식
+IMAGE_MODE_INLINE = "inline"  # base64 data URI로 이미지 전체를 포함
+IMAGE_MODE_EXTERNAL = "external"  # 이미지 저장소의 파일을 URL/경로로 참조
+IMAGE_MODES = (IMAGE_MODE_INLINE, IMAGE_MODE_EXTERNAL)
+
+# 브라우저에서 바로 표시 가능한 이미지 확장자
+DISPLAYABLE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp")
+
+
+def _mime_type(extension: str) -> str:
+    """이미지 확장자의 MIME 타입"""
+    return f"image/{extension[1:]}" if extension != ".jpg" else "image/jpeg"
+
+
+# section XML 입력 (XML 문자열/바이트, Element, 파일 경로 또는 바이너리 스트림)
+SectionSource = Union[str, bytes, ElementTree.Element, IO[bytes]]
+
+
+# 의약품 메타데이터와 일반 문단 목록을 받아 빌드 여부를 반환하는 함수
+DrugFilter = Callable[[Dict[str, Any], List[ElementTree.Element]], bool]
+
+
+class ParagraphEvent(NamedTuple):
+    """section 병렬 파싱 시 문단 하나의 처리 결과"""
+
+    category: Optional[str]  # 카테고리 문단이면 그 텍스트
+    is_title: bool  # 의약품 제목 문단 여부
+    text: Optional[str]  # 제목/부제목이 될 수 있는 문단의 텍스트
+    node: Optional[Dict[str, Any]]  # 문단 노드 (제목 문단이면 None)
+    images: List[Dict[str, Any]]  # 문단에서 참조한 이미지 저장소 항목
+    # 병합 단계에서 저장할 (파일명 또는 이미지 저장소 경로, 이미지 데이터)
+    pending_files: List[Tuple[str, bytes]]
+
+
+class _RunParts:
+    """run 하나와 그 run에 속한 텍스트, 그림, 수식"""
+
+    __slots__ = ("run", "texts", "picture", "equation")
+
+    def __init__(self, run: ElementTree.Element):
+        self.run = run
+        self.texts: List[str] = []
+        self.picture: Optional[ElementTree.Element] = None
+        self.equation: Optional[ElementTree.Element] = None
+
+
+class _DrugAssembler:
+    """문단 처리 결과를 의약품 레코드로 묶는 상태 기계
+
+    카테고리가 바뀌면 order를 1부터 다시 매기고, 제목 문단이 나오면 이전 의약품을
+    닫고 새 의약품을 시작합니다.
+    """
+
+    def __init__(self, chapter: str, with_images: bool):
+        self.chapter = chapter
+        self.with_images = with_images
+        self.metadata: Dict[str, Any] = {}
+        self.section: Optional[str] = None
+        self.content: List[Dict[str, Any]] = []
+        self.images: Dict[str, Dict[str, Any]] = {}
+        self.order = 1  # 의약품 순서
+        self.total = 0  # 총 의약품 수
+        self.skipped = 0  # 빌드하지 않고 건너뛴 의약품 수
+
+    @property
+    def title(self) -> str:
+        """현재 의약품 제목 (제목 문단 이전이면 "untitled")"""
+        title: str = self.metadata.get("title", "untitled")
+        return title
+
+    def set_section(self, text: str) -> None:
+        if text and self.section != text:
+            logger.info(f"새로운 섹션 시작: {text}")
+            self.section = text
+            self.order = 1  # 섹션이 바뀔 때마다 order 초기화
+
+    def close_drug(self) -> Optional[Dict[str, Any]]:
+        """현재 의약품을 레코드로 만들어 반환 (없으면 None)"""
+        if not self.metadata:
+            return None
+
+        record = {**self.metadata, "content": self.content}
+        # 이미지 저장소를 사용하는 경우 의약품이 참조한 이미지 목록을 함께 담음
+        if self.with_images:
+            record["images"] = list(self.images.values())
+        self.total += 1
+        logger.info(f"의약품 파싱 완료: {self.metadata.get('title')}")
+        return record
+
+    def start_drug(self, title: str, subtitle: str) -> None:
+        self.metadata = {
+            "chapter": self.chapter,
+            "section": self.section,
+            "title": title,
+            "subtitle": subtitle,
+            "order": self.order,
+        }
+        logger.info(f"새로운 의약품 파싱 시작: {title} (순서: {self.order})")
+        self.content = []
+        self.images = {}
+        self.order += 1
+
+    def add_paragraph(
+        self, node: Optional[Dict[str, Any]], images: List[Dict[str, Any]]
+    ) -> None:
+        for image in images:
+            self.images.setdefault(image["hash"], image)
+        if node is not None and node["children"]:
+            self.content.append(node)
+
+    def skip_drug(self) -> None:
+        """현재 의약품을 빌드하지 않고 건너뜀"""
+        self.skipped += 1
+        logger.debug(f"변경 없는 의약품 건너뜀: {self.metadata.get('title')}")
+
+    def finish(self) -> None:
+        """파싱 결과 요약을 기록"""
+        message = f"파싱 완료: 총 {self.total}개의 의약품 처리됨"
+        if self.skipped:
+            message += f" (변경 없는 의약품 {self.skipped}개 건너뜀)"
+        logger.info(message)
 
 
 class SectionXmlParser:
     """section{n}.xml 파일을 파싱하는 클래스"""
 
-    def __init__(self, config_name: str = "drug_manual_part2/parsing_rules"):
+    # 문서별 파싱 상태 (작업자 프로세스로 보내지 않음)
+    _TRANSIENT_ATTRS = (
+        "style_info",
+        "image_info",
+        "output_dir",
+        "image_source",
+        "_paragraph_images",
+        "_pending_files",
+        "_image_sizes",
+        "_run_child_handlers",
+        "writer",
+    )
+
+    def __init__(
+        self,
+        config_name: str = "drug_manual_part2/parsing_rules",
+        image_store: Optional[ImageStore] = None,
+        image_mode: str = IMAGE_MODE_INLINE,
+        image_base_url: str = "",
+        inline_max_bytes: int = 0,
+        xml_backend: Optional[str] = None,
+        writer: Optional[AsyncWriter] = None,
+        vector_converter: Optional[VectorImageConverter] = None,
+        image_normalizer: Optional[ImageNormalizer] = None,
+    ):
         """초기화
 
         Args:
             config_name (str, optional): 파싱 규칙 설정 파일 이름. Defaults to "drug_manual_part2/parsing_rules".
+            image_store (Optional[ImageStore], optional): 이미지를 내용 해시 기준으로 한 번만
+                저장할 저장소. None이면 의약품별 폴더에 이미지를 복사. Defaults to None.
+            image_mode (str, optional): 이미지 노드 src 생성 방식. "inline"이면 base64 data URI,
+                "external"이면 이미지 저장소의 파일을 참조 (image_store 필요). Defaults to "inline".
+            image_base_url (str, optional): external 모드에서 저장소 상대 경로 앞에 붙일 URL/경로.
+                Defaults to "".
+            inline_max_bytes (int, optional): external 모드에서도 이 크기 이하의 작은 이미지는
+                base64로 포함. 0이면 사용 안 함. Defaults to 0.
+            xml_backend (Optional[str], optional): XML 백엔드 이름 ("auto", "lxml", "stdlib").
+                None이면 설정 파일의 xml_backend 값을 사용. Defaults to None.
+            writer (Optional[AsyncWriter], optional): 이미지 저장과 폴더 생성을 맡길 백그라운드
+                쓰기 단계. None이면 파싱 중에 바로 저장. Defaults to None.
+            vector_converter (Optional[VectorImageConverter], optional): WMF/EMF 이미지를 PNG로
+                변환할 변환 단계. 파이프라인이 section 파싱 전에 문서의 벡터 이미지를 모아
+                변환하며, None이면 원본을 그대로 저장. Defaults to None.
+            image_normalizer (Optional[ImageNormalizer], optional): 이미지를 표시 너비로 줄여
+                다시 인코딩할 정규화 단계. 파이프라인이 section 파싱 전에 문서의 이미지를 모아
+                정규화하며, 이미지 노드는 정규화한 이미지를 사용하고 원본도 함께 저장.
+                None이면 원본만 저장. Defaults to None.
         """
+        if image_mode not in IMAGE_MODES:
+            raise ValueError(f"지원하지 않는 이미지 모드입니다: {image_mode}")
+        if image_mode == IMAGE_MODE_EXTERNAL and image_store is None:
+            raise ValueError("external 이미지 모드에는 이미지 저장소가 필요합니다.")
+
         self.config_name = config_name
-        self.rules = get_parsing_rule("section_xml", config_name)
-        if not self.rules:
-            raise ValueError(f"section_xml 파싱 규칙을 찾을 수 없습니다.")
-        self.namespaces = self.rules["namespaces"]
+        self.image_store = image_store
+        self.image_mode = image_mode
+        self.image_base_url = image_base_url
+        self.inline_max_bytes = inline_max_bytes
+        self.writer = writer
+        self.vector_converter = vector_converter
+        self.image_normalizer = image_normalizer
+        # 현재 문단에서 참조한 이미지 (해시별 저장소 항목)
+        self._paragraph_images: Dict[str, Dict[str, Any]] = {}
+        # None이 아니면 폴더별 이미지 저장을 미루고 (파일명, 데이터)를 모음
+        self._pending_files: Optional[List[Tuple[str, bytes]]] = None
+        # 문서에서 헤더로 확인한 이미지 크기 (이미지 저장소 해시 또는 이미지 경로별)
+        self._image_sizes: Dict[str, Optional[Tuple[int, int]]] = {}
+        self.rules: SectionXmlRules = get_compiled_rules("section_xml", config_name)
+        self.namespaces = self.rules.namespaces
+        self.backend = get_xml_backend(
+            xml_backend or get_parsing_rule("xml_backend", config_name)
+        )
+        self._init_handlers()
+
+    def _init_handlers(self) -> None:
+        """run 자식 요소의 태그별 처리 함수 (태그 비교는 Clark 표기법)"""
+        self._run_child_handlers: Dict[
+            str, Callable[[ElementTree.Element, _RunParts], None]
+        ] = {
+            self.rules.text_tag: self._on_text,
+            self.rules.picture_tag: self._on_picture,
+            self.rules.equation_tag: self._on_equation,
+        }
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """작업자 프로세스로 보낼 때 문서별 파싱 상태는 제외"""
+        state = self.__dict__.copy()
+        for name in self._TRANSIENT_ATTRS:
+            state.pop(name, None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._paragraph_images = {}
+        self._pending_files = None
+        self._image_sizes = {}
+        self.writer = None
+        self._init_handlers()
+
+    def _write_file(self, path: str, data: bytes) -> None:
+        """파일 저장 (쓰기 단계가 있으면 백그라운드에서 저장)"""
+        if self.writer is not None:
+            self.writer.write_file(path, data)
+        else:
+            write_file(path, data)
+
+    def _make_dirs(self, path: str) -> None:
+        """디렉토리 생성 (쓰기 단계가 있으면 백그라운드에서 생성)"""
+        if self.writer is not None:
+            self.writer.make_dirs(path)
+        else:
+            make_dirs(path)
 
     def _extract_text(self, p_elem: ElementTree.Element) -> str:
         """문단에서 텍스트를 추출
@@ -32,11 +295,12 @@ class SectionXmlParser:
         Returns:
             str: 추출된 텍스트
         """
-        # run 태그 내의 모든 t 태그를 찾아서 텍스트 추출
+        # 각 run에 속한 t 태그에서 텍스트 추출
+        text_tag = self.rules.text_tag
         text_parts = []
-        for run in p_elem.findall(".//hp:run", self.namespaces):
-            for t in run.findall(".//hp:t", self.namespaces):
-                if t.text and t.text.strip():
+        for run in p_elem.iter(self.rules.run_tag):
+            for t in run:
+                if t.tag == text_tag and t.text and t.text.strip():
                     text_parts.append(t.text.strip())
         return " ".join(text_parts)
 
@@ -49,31 +313,98 @@ class SectionXmlParser:
         Returns:
             bool: 한글 포함 여부
         """
-        return any("\uac00" <= char <= "\ud7a3" for char in text)
+        return self.rules.korean_pattern.search(text) is not None
+
+    def _read_image(
+        self,
+        image_meta: Dict[str, Any],
+        image_source: ImageSource,
+        original: bool = False,
+    ) -> Optional[Tuple[str, bytes]]:
+        """이미지 경로와 데이터를 읽음
+
+        정규화한 이미지, 벡터 이미지를 변환한 PNG, 이미지 소스의 원본 순으로 사용하며,
+        original이 True면 정규화하기 전의 이미지를 읽습니다.
+        """
+        if not original:
+            normalized = read_normalized(image_meta)
+            if normalized is not None:
+                return normalized
+        converted = read_converted(image_meta)
+        if converted is not None:
+            return converted
+        href = image_meta.get("path")
+        if not href:
+            return None
+        image_data = image_source.read(href)
+        if image_data is None:
+            return None
+        return href, image_data
+
+    def _picture_size(
+        self, size_tag: Optional[ElementTree.Element]
+    ) -> Optional[Tuple[int, int]]:
+        """hp:sz/hp:orgSz의 HWPUNIT 크기를 화면 픽셀 (너비, 높이)로 환산 (없으면 None)"""
+        if size_tag is None:
+            return None
+        try:
+            width = hwpunit_to_pixels(int(size_tag.get("width", 0)))
+            height = hwpunit_to_pixels(int(size_tag.get("height", 0)))
+        except ValueError:
+            return None
+        if width <= 0 or height <= 0:
+            return None
+        return width, height
+
+    def _image_size(self, key: str, image_data: bytes) -> Optional[Tuple[int, int]]:
+        """이미지 헤더에서 픽셀 크기를 확인 (같은 이미지는 한 번만 확인)"""
+        try:
+            return self._image_sizes[key]
+        except KeyError:
+            size = self._image_sizes[key] = sniff_image_size(image_data)
+            return size
+
+    @profiled("images")
+    def _store_image(
+        self, image_store: ImageStore, data: bytes, extension: str
+    ) -> Dict[str, Any]:
+        """이미지 저장소에 이미지를 저장하고 저장소 항목을 반환
+
+        저장을 미루는 중이면 항목만 만들고 병합 단계에서 저장합니다.
+        """
+        if self._pending_files is not None:
+            stored = image_store.entry(data, extension)
+            self._pending_files.append((stored["path"], data))
+            return stored
+        return image_store.put(data, extension, writer=self.writer)
 
     def _process_image_in_paragraph(
-        self, run: ElementTree.Element, image_info: Dict[str, Any], folder_path: str
+        self, pic_tag: ElementTree.Element, image_info: Dict[str, Any], folder_path: str
     ) -> Optional[Dict[str, Any]]:
         """문단 내의 이미지를 처리
 
         Args:
-            run (ElementTree.Element): run 태그
+            pic_tag (ElementTree.Element): run 바로 아래의 pic 태그
             image_info (Dict[str, Any]): 이미지 정보
             folder_path (str): 이미지 저장 경로
 
         Returns:
             Optional[Dict[str, Any]]: 이미지 노드 또는 None
         """
-        pic_tag = run.find("./hp:pic", self.namespaces)
-        if not pic_tag:
+        if not len(pic_tag):
             return None
 
-        # 모든 자식 요소를 순회하면서 img 태그 찾기
+        # 모든 자식 요소를 순회하면서 img 태그와 크기 태그 찾기
+        img_tag = size_tag = original_size_tag = None
         for child in pic_tag:
-            if child.tag.endswith("}img"):
+            tag = child.tag
+            if tag == self.rules.picture_size_tag:
+                size_tag = child
+            elif tag == self.rules.picture_original_size_tag:
+                original_size_tag = child
+            elif img_tag is None and tag.endswith("}img"):
                 img_tag = child
-                break
-        else:
+        if img_tag is None:
             logger.warning(f"이미지 태그를 찾을 수 없습니다: {pic_tag}")
             return None
 
@@ -87,41 +418,81 @@ class SectionXmlParser:
             return None
 
         # href 대신 path 사용
-        href = image_meta.get("path")
-        if not href:
+        if not image_meta.get("path"):
             logger.warning(f"이미지 경로를 찾을 수 없습니다: {image_meta}")
             return None
 
+        # 이미지 데이터 (정규화한 이미지, 변환된 벡터 이미지 또는 이미지 소스의 원본)
+        image = self._read_image(image_meta, self.image_source)
+        if image is None:
+            return None
+        href, image_data = image
         extension = os.path.splitext(href)[-1].lower()
+        logger.debug(f"이미지 데이터 읽기 완료: {len(image_data)} bytes")
+        count("images")
+        count("image_bytes", len(image_data))
 
-        # 원본 이미지 경로 (BinData 폴더에서 찾기)
-        source_path = os.path.join("data/tmp/BinData", os.path.basename(href))
+        # 정규화한 이미지를 사용하면 원본도 함께 저장
+        original = None
+        if image_meta.get("normalized"):
+            original = self._read_image(image_meta, self.image_source, original=True)
 
-        if not os.path.exists(source_path):
-            logger.error(f"이미지 파일을 찾을 수 없습니다: {source_path}")
-            return None
-
-        # 저장 대상 경로 (의약품별 폴더)
-        target_path = os.path.join(folder_path, os.path.basename(href))
+        stored: Optional[Dict[str, Any]] = None
+        if self.image_store is not None:
+            # 내용 해시 기준으로 한 번만 저장하고 의약품에는 참조만 기록
+            stored = self._store_image(self.image_store, image_data, extension)
+            # 변환/정규화한 이미지는 content.hpf의 원본 MIME 타입 대신 저장한 형식의 타입
+            mime_type = (
+                image_meta.get("mime_type")
+                if href == image_meta["path"]
+                else _mime_type(extension)
+            )
+            entry = {"id": img_id, "mime_type": mime_type, **stored}
+            if original is not None:
+                original_extension = os.path.splitext(original[0])[-1].lower()
+                entry["original"] = self._store_image(
+                    self.image_store, original[1], original_extension
+                )["path"]
+            self._paragraph_images.setdefault(stored["hash"], entry)
+        else:
+            files = [(href, image_data)]
+            if original is not None:
+                files.append(original)
+            for file_href, file_data in files:
+                if self._pending_files is not None:
+                    # 의약품 폴더가 정해진 뒤 저장
+                    self._pending_files.append((os.path.basename(file_href), file_data))
+                else:
+                    # 저장 대상 경로 (의약품별 폴더)
+                    target_path = os.path.join(folder_path, os.path.basename(file_href))
 
-        with open(source_path, "rb") as img_f:
-            image_data = img_f.read()
-            logger.debug(f"이미지 데이터 읽기 완료: {len(image_data)} bytes")
+                    # 파일 저장
+                    self._write_file(target_path, file_data)
+                    logger.debug(f"이미지 저장 완료: {target_path}")
 
-        # 파일 저장
-        with open(target_path, "wb") as out_f:
-            out_f.write(image_data)
-            logger.debug(f"이미지 저장 완료: {target_path}")
+        # src 생성 (표시 가능한 포맷만)
+        src = None
+        if extension in DISPLAYABLE_EXTENSIONS:
+            if (
+                stored is not None
+                and self.image_mode == IMAGE_MODE_EXTERNAL
+                and len(image_data) > self.inline_max_bytes
+            ):
+                # 저장소 파일 참조
+                src = f"{self.image_base_url}{stored['path']}"
+            else:
+                # base64 인코딩
+                encoded_data = base64.b64encode(image_data).decode("utf-8")
+                src = f"data:{_mime_type(extension)};base64,{encoded_data}"
 
-        # base64 인코딩 (표시 가능한 포맷만)
-        if extension in [".png", ".jpg", ".jpeg", ".gif", ".bmp"]:
-            mime = f"image/{extension[1:]}" if extension != ".jpg" else "image/jpeg"
-            encoded_data = base64.b64encode(image_data).decode("utf-8")
-            src = f"data:{mime};base64,{encoded_data}"
-        else:
-            src = None
+        # 표시 크기: 문서 내 크기, 원래 크기, 이미지 헤더의 픽셀 크기 순으로 사용
+        size = self._picture_size(size_tag) or self._picture_size(original_size_tag)
+        if size is None:
+            size = self._image_size(
+                stored["hash"] if stored is not None else href, image_data
+            )
 
-        return {
+        image_node = {
             "type": "image",
             "version": 1,
             "altText": img_id,
@@ -137,45 +508,82 @@ class SectionXmlParser:
                     }
                 }
             },
-            "height": 0,
-            "maxWidth": 500,
+            "height": size[1] if size is not None else 0,
+            "maxWidth": DISPLAY_MAX_WIDTH,
             "showCaption": False,
             "src": src,
         }
+        if size is not None:
+            image_node["width"] = size[0]
+            image_node["aspect"] = round(size[0] / size[1], 4)
+        if stored is not None and self.image_mode == IMAGE_MODE_EXTERNAL:
+            image_node["hash"] = stored["hash"]
+        return image_node
 
     def _process_equation_in_paragraph(
-        self, run: ElementTree.Element
+        self, equation_tag: ElementTree.Element
     ) -> Optional[Dict[str, Any]]:
         """문단 내의 수식을 처리
 
+        hp:script의 한글 수식 스크립트를 LaTeX로 변환하여 수식 노드를 만듭니다.
+        같은 스크립트의 변환 결과는 캐시되므로 반복되는 수식은 다시 파싱하지 않습니다.
+
         Args:
-            run (ElementTree.Element): run 태그
+            equation_tag (ElementTree.Element): run 바로 아래의 equation 태그
 
         Returns:
-            Optional[Dict[str, Any]]: 수식 노드 또는 None
+            Optional[Dict[str, Any]]: 수식 노드 또는 None (스크립트가 없거나 비어 있는 경우)
         """
-        equation_tag = run.find(".//hp:equation", self.namespaces)
-        if not equation_tag:
-            return None
+        script_tag = self.rules.equation_script_tag
+        for child in equation_tag:
+            if child.tag == script_tag:
+                return equation_node(child.text or "")
+        return None
 
-        return {
-            "detail": 0,
-            "format": 1,  # 볼드체
-            "mode": "normal",
-            "style": "color: #ff0000;",  # 빨간색
-            "text": "수식",
-            "type": "text",
-            "version": 1,
-        }
+    def _on_text(self, elem: ElementTree.Element, parts: _RunParts) -> None:
+        """run의 텍스트 자식 처리 (공백뿐인 텍스트는 제외)"""
+        if elem.text and elem.text.strip():
+            parts.texts.append(elem.text)
+
+    def _on_picture(self, elem: ElementTree.Element, parts: _RunParts) -> None:
+        """run의 그림 자식 처리 (run마다 첫 번째 그림만 사용)"""
+        if parts.picture is None:
+            parts.picture = elem
+
+    def _on_equation(self, elem: ElementTree.Element, parts: _RunParts) -> None:
+        """run의 수식 자식 처리 (run마다 첫 번째 수식만 사용)"""
+        if parts.equation is None:
+            parts.equation = elem
+
+    def _iter_runs(self, p_elem: ElementTree.Element) -> Iterator[_RunParts]:
+        """문단의 run을 문서 순서대로 한 번씩 순회하며 자식 요소를 태그별로 분류
+
+        표 안의 문단처럼 중첩된 run도 각각 한 번씩 나오며, 텍스트·그림·수식은
+        가장 가까운 run에만 속합니다.
+
+        Args:
+            p_elem (ElementTree.Element): 문단 요소
+
+        Yields:
+            _RunParts: run과 그 run에 속한 텍스트, 그림, 수식
+        """
+        handlers = self._run_child_handlers
+        for run in p_elem.iter(self.rules.run_tag):
+            parts = _RunParts(run)
+            for child in run:
+                handler = handlers.get(child.tag)
+                if handler is not None:
+                    handler(child, parts)
+            yield parts
 
     def _build_paragraph(
-        self, p_elem: ElementTree.Element, style_info: Dict[str, Any], folder_path: str
+        self, p_elem: ElementTree.Element, style_info: StyleTable, folder_path: str
     ) -> Dict[str, Any]:
         """문단을 빌드
 
         Args:
             p_elem (ElementTree.Element): 문단 요소
-            style_info (Dict[str, Any]): 스타일 정보
+            style_info (StyleTable): 스타일 표
             folder_path (str): 이미지 저장 경로
 
         Returns:
@@ -191,171 +599,626 @@ class SectionXmlParser:
             "textStyle": "",
             "children": [],
         }
+        children = paragraph["children"]
 
-        for run in p_elem.findall(".//hp:run", self.namespaces):
-            char_pr_id = run.get("charPrIDRef")
-            style = style_info.get(f"charPr-{char_pr_id}", {}) if char_pr_id else {}
-
-            format_flag = 0
-            if style.get("bold"):
-                format_flag = 1
-            elif style.get("italic"):
-                format_flag = 2
-            elif style.get("underline"):
-                format_flag = 4
-            else:
-                format_flag = style.get("format", 0)
+        runs = 0
+        for parts in self._iter_runs(p_elem):
+            runs += 1
+            # 미리 계산된 굵게/기울임/밑줄/첨자 비트마스크
+            format_flag = style_info.text_format(parts.run.get("charPrIDRef"))
 
             # 이미지 처리
-            image_node = self._process_image_in_paragraph(
-                run, self.image_info, folder_path
-            )
-
-            if image_node:
-                paragraph["children"].append(image_node)
+            if parts.picture is not None:
+                image_node = self._process_image_in_paragraph(
+                    parts.picture, self.image_info, folder_path
+                )
+                if image_node:
+                    children.append(image_node)
 
             # 수식 처리
-            equation_node = self._process_equation_in_paragraph(run)
-            if equation_node:
-                paragraph["children"].append(equation_node)
+            if parts.equation is not None:
+                equation_node = self._process_equation_in_paragraph(parts.equation)
+                if equation_node:
+                    children.append(equation_node)
 
             # 텍스트 처리
-            for t in run.findall(".//hp:t", self.namespaces):
-                if t.text and t.text.strip():
-                    paragraph["children"].append(
-                        {
-                            "detail": 0,
-                            "format": format_flag,
-                            "mode": "normal",
-                            "style": "",
-                            "text": t.text,
-                            "type": "text",
-                            "version": 1,
-                        }
-                    )
+            for text in parts.texts:
+                children.append(
+                    {
+                        "detail": 0,
+                        "format": format_flag,
+                        "mode": "normal",
+                        "style": "",
+                        "text": text,
+                        "type": "text",
+                        "version": 1,
+                    }
+                )
 
+        count_paragraph(runs)
         return paragraph
 
-    def parse(
+    def _is_section_paragraph(self, p_elem: ElementTree.Element) -> bool:
+        """카테고리(섹션) 문단인지 확인 (styleIDRef 조건)"""
+        style_id = p_elem.get("styleIDRef", "").replace("style-", "")
+        return style_id == self.rules.section_style_id
+
+    def _is_title_paragraph(self, p_elem: ElementTree.Element) -> bool:
+        """의약품 제목 문단인지 확인 (textheight가 규칙의 제목 높이(1100)인 경우)"""
+        # 문서 순서상 첫 lineseg (find(".//hp:lineseg")와 같음)
+        lineseg = next(p_elem.iter(self.rules.lineseg_tag), None)
+        return (
+            lineseg is not None and lineseg.get("textheight") == self.rules.title_height
+        )
+
+    def _split_title(self, first_text: str, second_text: str) -> Tuple[str, str]:
+        """제목 문단과 다음 문단의 텍스트를 한글/영문 구분하여 (제목, 부제목)으로 반환"""
+        if self._is_korean(first_text):
+            return first_text, second_text
+        return second_text, first_text
+
+    def _build_paragraph_with_images(
+        self, p_elem: ElementTree.Element, folder_path: str
+    ) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+        """문단을 빌드하고 그 문단에서 참조한 이미지 저장소 항목을 함께 반환
+
+        Args:
+            p_elem (ElementTree.Element): 문단 요소
+            folder_path (str): 이미지 저장 경로
+
+        Returns:
+            Tuple[Dict[str, Any], List[Dict[str, Any]]]: (문단 노드, 이미지 저장소 항목 목록)
+        """
+        self._paragraph_images = {}
+        para = self._build_paragraph(p_elem, self.style_info, folder_path)
+        return para, list(self._paragraph_images.values())
+
+    def _close_drug(
         self,
-        xml_content: Union[str, ElementTree.Element],
-        style_info: Dict[str, Any],
+        assembler: "_DrugAssembler",
+        paragraphs: List[ElementTree.Element],
+        drug_filter: Optional[DrugFilter],
+    ) -> Optional[Dict[str, Any]]:
+        """현재 의약품의 문단을 빌드하여 레코드로 만듦
+
+        Args:
+            assembler (_DrugAssembler): 의약품 상태
+            paragraphs (List[ElementTree.Element]): 현재 의약품의 일반 문단 목록
+            drug_filter (Optional[DrugFilter]): False를 반환하면 빌드하지 않고 건너뜀
+
+        Returns:
+            Optional[Dict[str, Any]]: 의약품 레코드 (의약품이 없거나 건너뛰면 None)
+        """
+        if not assembler.metadata:
+            return None
+
+        if drug_filter is not None and not drug_filter(assembler.metadata, paragraphs):
+            assembler.skip_drug()
+            return None
+
+        # 이미지 저장 경로는 main.py에서 설정한 output_dir을 사용
+        folder_path = os.path.join(self.output_dir, drug_folder_name(assembler.title))
+        if self.image_store is None and paragraphs:
+            self._make_dirs(folder_path)
+        for p in paragraphs:
+            assembler.add_paragraph(*self._build_paragraph_with_images(p, folder_path))
+        return assembler.close_drug()
+
+    def _iter_drug_records(
+        self,
+        paragraphs: Iterator[ElementTree.Element],
+        drug_filter: Optional[DrugFilter] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """문단 스트림에서 의약품 단위의 메타데이터와 내용을 순서대로 생성
+
+        다음 제목 문단이 나타나 이전 의약품이 닫히는 즉시 해당 의약품의 문단을
+        빌드하여 레코드로 내보냅니다.
+
+        Args:
+            paragraphs (Iterator[ElementTree.Element]): 문서 순서의 문단 이터레이터
+            drug_filter (Optional[DrugFilter]): 의약품 메타데이터와 문단 목록을 받아
+                False를 반환하면 해당 의약품을 빌드하지 않고 건너뜀
+
+        Yields:
+            Dict[str, Any]: 의약품별 메타데이터와 내용
+        """
+        paragraphs = iter(paragraphs)
+        assembler = _DrugAssembler(
+            self.rules.chapter,
+            with_images=self.image_store is not None,
+        )
+        drug_paragraphs: List[ElementTree.Element] = []
+
+        for p in paragraphs:
+            # 카테고리 문단 확인
+            if self._is_section_paragraph(p):
+                assembler.set_section(self._extract_text(p))
+
+            # 의약품 제목 문단 확인
+            if self._is_title_paragraph(p):
+                # 이전 의약품이 있으면 내보내기
+                record = self._close_drug(assembler, drug_paragraphs, drug_filter)
+                if record is not None:
+                    yield record
+
+                # 새로운 의약품 시작 (다음 문단은 부제목으로 사용)
+                first_text = self._extract_text(p)
+                next_p = next(paragraphs, None)
+                second_text = self._extract_text(next_p) if next_p is not None else ""
+                assembler.start_drug(*self._split_title(first_text, second_text))
+                drug_paragraphs = []
+                continue
+
+            # 일반 문단은 의약품이 닫힐 때 빌드
+            drug_paragraphs.append(p)
+
+        # 마지막 의약품 내보내기
+        record = self._close_drug(assembler, drug_paragraphs, drug_filter)
+        if record is not None:
+            yield record
+        assembler.finish()
+
+    def _iter_stream_paragraphs(
+        self, source: SectionSource, nested: bool = True
+    ) -> Iterator[ElementTree.Element]:
+        """section XML을 점진적으로 읽으며 문단을 문서 순서대로 생성
+
+        최상위 문단이 닫힐 때마다 해당 문단과 그 하위 문단(표 안의 문단 등)을
+        ``findall(".//hp:p")``와 같은 순서로 내보낸 뒤, 처리한 요소를 트리에서
+        제거하여 메모리에 문단 하나 분량만 남도록 합니다.
+
+        Args:
+            source (SectionSource): 파일 경로, 바이너리 스트림 (zip 멤버 등) 또는 XML 바이트
+            nested (bool): False면 하위 문단 없이 최상위 문단만 생성
+
+        Yields:
+            ElementTree.Element: 문단 요소
+
+        Raises:
+            TypeError: 이미 파싱된 요소가 주어진 경우
+        """
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        elif isinstance(source, ElementTree.Element):
+            raise TypeError("이미 파싱된 요소는 스트리밍 방식으로 읽을 수 없습니다.")
+
+        p_tag = self.rules.paragraph_tag
+        root: Optional[ElementTree.Element] = None
+        depth = 0
+
+        for event, elem in self.backend.iterparse(source, events=("start", "end")):
+            if event == "start":
+                if root is None:
+                    root = elem
+                depth += 1
+                continue
+
+            depth -= 1
+            # 루트 바로 아래의 문단이 닫힌 경우에만 처리
+            if depth == 1 and elem.tag == p_tag and root is not None:
+                if nested:
+                    yield from elem.iter(p_tag)
+                else:
+                    yield elem
+                root.clear()
+
+    def _iter_source_paragraphs(
+        self, source: SectionSource, stream: bool
+    ) -> Iterator[ElementTree.Element]:
+        """section XML 하나의 문단을 문서 순서대로 생성
+
+        Args:
+            source (SectionSource): stream이면 파일 경로 또는 바이너리 스트림,
+                아니면 XML 문자열/바이트, ElementTree.Element 또는 바이너리 스트림
+            stream (bool): True면 DOM을 만들지 않고 점진적으로 파싱
+
+        Yields:
+            ElementTree.Element: 문단 요소
+        """
+        if stream:
+            yield from self._iter_stream_paragraphs(source)
+            return
+
+        # 모든 문단 찾기
+        with timer("section_xml_load"):
+            root = self.backend.load_root(source)
+        yield from root.findall(self.rules.paragraph_path)
+
+    def _begin(
+        self,
+        style_info: Mapping[str, Any],
+        image_info: Dict[str, Any],
+        output_dir: str,
+        image_source: Optional[ImageSource],
+    ) -> None:
+        """파싱에 필요한 문서별 정보를 설정"""
+        self.style_info = StyleTable.of(style_info)
+        self.image_info = image_info
+        self.output_dir = output_dir
+        if image_source is None:
+            # 작업 디렉토리에 따라 엉뚱한 이미지를 읽지 않도록 기본 경로를 가정하지 않음
+            logger.warning("이미지 소스가 지정되지 않아 이미지 없이 파싱합니다.")
+            image_source = EmptyImageSource()
+        self.image_source = image_source
+        self._image_sizes = {}
+
+    def iter_sections(
+        self,
+        sources: Iterable[SectionSource],
+        style_info: Mapping[str, Any],
         image_info: Dict[str, Any],
         output_dir: str = "data/output/result",
-    ) -> List[Dict[str, Any]]:
-        """XML 내용을 파싱하여 메타데이터와 내용을 추출
+        image_source: Optional[ImageSource] = None,
+        stream: bool = False,
+        drug_filter: Optional[DrugFilter] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """여러 section XML을 순서대로 이어서 파싱하여 의약품 레코드를 하나씩 생성
+
+        section 경계에 걸친 의약품은 하나로 이어 붙이고, order는 section을 넘어서도
+        이어서 매깁니다.
 
         Args:
-            xml_content (Union[str, ElementTree.Element]): XML 내용 (문자열 또는 ElementTree.Element)
-            style_info (Dict[str, Any]): 스타일 정보
+            sources (Iterable[SectionSource]): section 번호 순의 section XML 목록
+            style_info (Mapping[str, Any]): 스타일 정보 (HeaderXmlParser.parse 결과 또는 같은 형식의 딕셔너리)
             image_info (Dict[str, Any]): 이미지 정보
             output_dir (str): 출력 디렉토리 경로
+            image_source (Optional[ImageSource]): 이미지 데이터를 읽을 소스.
+                None이면 이미지를 읽지 않음 (이미지 노드를 만들지 않음)
+            stream (bool): True면 각 section을 DOM으로 만들지 않고 점진적으로 파싱
+            drug_filter (Optional[DrugFilter]): 의약품 메타데이터와 문단 목록을 받아
+                False를 반환하면 해당 의약품을 빌드하지 않고 건너뜀 (증분 파싱 등)
 
-        Returns:
-            List[Dict[str, Any]]: 추출된 메타데이터와 내용 목록
+        Yields:
+            Dict[str, Any]: chapter, section, title, subtitle, order, content를 담은 의약품 레코드
         """
-        self.style_info = style_info
-        self.image_info = image_info
-        self.output_dir = output_dir
+        self._begin(style_info, image_info, output_dir, image_source)
 
         logger.info("section_xml 파싱 시작")
+        paragraphs = itertools.chain.from_iterable(
+            self._iter_source_paragraphs(source, stream) for source in sources
+        )
+        yield from self._iter_drug_records(paragraphs, drug_filter)
+
+    def parse_section_events(
+        self,
+        source: SectionSource,
+        style_info: Mapping[str, Any],
+        image_info: Dict[str, Any],
+        output_dir: str = "data/output/result",
+        image_source: Optional[ImageSource] = None,
+        stream: bool = False,
+    ) -> List[ParagraphEvent]:
+        """section 하나를 다른 section과 독립적으로 파싱하여 문단별 처리 결과를 반환
+
+        section 병렬 파싱 시 작업자 프로세스에서 실행됩니다. 이전 section의 상태
+        (현재 의약품, 카테고리, 순서)를 모르므로 의약품으로 묶지 않고 문단 단위의
+        결과만 남기며, ``iter_drugs_from_events``가 section 순서대로 이어 붙입니다.
+
+        Args:
+            source (SectionSource): section XML (``iter_sections``의 sources 항목과 동일)
+            style_info (Mapping[str, Any]): 스타일 정보 (HeaderXmlParser.parse 결과 또는 같은 형식의 딕셔너리)
+            image_info (Dict[str, Any]): 이미지 정보
+            output_dir (str): 출력 디렉토리 경로
+            image_source (Optional[ImageSource]): 이미지 데이터를 읽을 소스
+            stream (bool): True면 DOM을 만들지 않고 점진적으로 파싱
+
+        Returns:
+            List[ParagraphEvent]: 문서 순서의 문단별 처리 결과
+        """
+        self._begin(style_info, image_info, output_dir, image_source)
+
+        events = []
+        # 제목 다음 문단(부제목)인지 여부. 첫 문단은 이전 section 마지막 제목의
+        # 부제목일 수도 있으므로 알 수 없음(None)으로 시작
+        after_title: Optional[bool] = None
+        for p in self._iter_source_paragraphs(source, stream):
+            category = self._extract_text(p) if self._is_section_paragraph(p) else None
+            is_title = self._is_title_paragraph(p)
+            text = None
+            if is_title or after_title is not False:
+                text = category if category is not None else self._extract_text(p)
+
+            node = None
+            images: List[Dict[str, Any]] = []
+            pending_files: List[Tuple[str, bytes]] = []
+            # 부제목 문단은 텍스트만 쓰이므로 순차 파싱처럼 빌드하지 않음
+            if not is_title and not after_title:
+                # 문단이 속할 의약품은 병합 단계에서 정해지므로 이미지 저장은 미룸
+                self._pending_files = pending_files
+                node, images = self._build_paragraph_with_images(p, output_dir)
+                self._pending_files = None
+
+            events.append(
+                ParagraphEvent(category, is_title, text, node, images, pending_files)
+            )
+            # 부제목으로 쓰인 문단은 제목 문단이어도 다음 문단을 부제목으로 만들지 않음
+            if after_title is None:
+                after_title = None if is_title else False
+            else:
+                after_title = is_title and not after_title
+
+        return events
+
+    def iter_drugs_from_events(
+        self,
+        event_lists: Iterable[List[ParagraphEvent]],
+        output_dir: str = "data/output/result",
+    ) -> Iterator[Dict[str, Any]]:
+        """section별 문단 처리 결과를 section 순서대로 이어 붙여 의약품 레코드를 생성
+
+        ``iter_sections``와 같은 규칙으로 의약품을 묶으므로 section 경계에 걸친
+        의약품과 order도 순차 파싱과 동일하게 처리됩니다.
+
+        Args:
+            event_lists (Iterable[List[ParagraphEvent]]): section 번호 순의 ``parse_section_events`` 결과
+            output_dir (str): 출력 디렉토리 경로
 
-        # XML 파싱 (문자열인 경우에만)
-        root = (
-            xml_content
-            if isinstance(xml_content, ElementTree.Element)
-            else ElementTree.fromstring(xml_content)
+        Yields:
+            Dict[str, Any]: chapter, section, title, subtitle, order, content를 담은 의약품 레코드
+        """
+        events = itertools.chain.from_iterable(event_lists)
+        assembler = _DrugAssembler(
+            self.rules.chapter,
+            with_images=self.image_store is not None,
         )
 
-        # 모든 문단 찾기
-        paragraphs = root.findall(".//hp:p", self.namespaces)
-        result = []
-        current_metadata = {}
-        current_section = None
-        current_content = []
-        i = 0
-        order = 1  # 의약품 순서
-        total_drugs = 0  # 총 의약품 수
-
-        while i < len(paragraphs):
-            p = paragraphs[i]
-            style_id = p.get("styleIDRef", "").replace("style-", "")
+        for event in events:
+            if event.category is not None:
+                assembler.set_section(event.category)
 
-            # 카테고리 문단 확인
-            if (
-                style_id
-                == self.rules["metadata_extraction"]["section"]["conditions"][
-                    "styleIDRef"
-                ]
-            ):
-                text = self._extract_text(p)
-                if text:
-                    if current_section != text:
-                        logger.info(f"새로운 섹션 시작: {text}")
-                        current_section = text
-                        order = 1  # 섹션이 바뀔 때마다 order 초기화
-
-            # 의약품 제목 문단 확인 (textheight가 1100인 경우)
-            lineseg = p.find(".//hp:lineseg", self.namespaces)
-            if lineseg is not None and lineseg.get("textheight") == "1100":
-                # 이전 메타데이터와 내용이 있으면 저장
-                if current_metadata:
-                    result.append({**current_metadata, "content": current_content})
-                    total_drugs += 1
-                    logger.info(f"의약품 파싱 완료: {current_metadata.get('title')}")
-
-                # 새로운 메타데이터와 내용 시작
-                first_text = self._extract_text(p)
-                second_text = (
-                    self._extract_text(paragraphs[i + 1])
-                    if i + 1 < len(paragraphs)
-                    else ""
-                )
+            if event.is_title:
+                record = assembler.close_drug()
+                if record is not None:
+                    yield record
 
-                # 한글/영문 구분하여 제목/부제목 설정
-                if self._is_korean(first_text):
-                    current_metadata = {
-                        "chapter": self.rules["metadata_extraction"]["chapter"],
-                        "section": current_section,
-                        "title": first_text,
-                        "subtitle": second_text,
-                        "order": order,
-                    }
-                else:
-                    current_metadata = {
-                        "chapter": self.rules["metadata_extraction"]["chapter"],
-                        "section": current_section,
-                        "title": second_text,
-                        "subtitle": first_text,
-                        "order": order,
-                    }
-                logger.info(
-                    f"새로운 의약품 파싱 시작: {current_metadata.get('title')} (순서: {order})"
-                )
-                current_content = []
-                order += 1
-                i += 2
+                next_event = next(events, None)
+                second_text = (next_event.text or "") if next_event is not None else ""
+                assembler.start_drug(*self._split_title(event.text or "", second_text))
                 continue
 
-            # 일반 문단 처리
-            else:
-                # 이미지 저장 경로는 main.py에서 설정한 output_dir을 사용
-                folder_path = os.path.join(
-                    self.output_dir,
-                    current_metadata.get("title", "untitled"),
+            # 첫 제목 이전의 문단은 순차 파싱처럼 버림
+            if not assembler.metadata:
+                continue
+
+            # 미뤄 둔 이미지를 이미지 저장소 또는 의약품 폴더에 저장
+            if event.pending_files:
+                self._save_pending_files(
+                    event.pending_files,
+                    os.path.join(output_dir, drug_folder_name(assembler.title)),
+                )
+
+            assembler.add_paragraph(event.node, event.images)
+
+        record = assembler.close_drug()
+        if record is not None:
+            yield record
+        assembler.finish()
+
+    def _save_pending_files(
+        self, pending_files: List[Tuple[str, bytes]], folder_path: str
+    ) -> None:
+        """작업자가 미뤄 둔 이미지를 저장
+
+        Args:
+            pending_files (List[Tuple[str, bytes]]): (파일명 또는 이미지 저장소 경로, 이미지 데이터)
+            folder_path (str): 이미지 저장소가 없을 때 저장할 의약품 폴더
+        """
+        if self.image_store is not None:
+            for stored_path, image_data in pending_files:
+                extension = os.path.splitext(stored_path)[-1]
+                self.image_store.put(image_data, extension, writer=self.writer)
+            return
+
+        self._make_dirs(folder_path)
+        for file_name, image_data in pending_files:
+            self._write_file(os.path.join(folder_path, file_name), image_data)
+
+    def restore_images(
+        self,
+        record: Dict[str, Any],
+        image_info: Dict[str, Any],
+        image_source: ImageSource,
+        output_dir: str,
+    ) -> int:
+        """이미 만들어진 의약품 레코드가 참조하는 이미지 파일이 없으면 다시 저장
+
+        파싱 결과 캐시에서 가져온 레코드처럼 XML을 파싱하지 않고 만든 레코드에
+        대해, 파싱할 때와 같은 위치(이미지 저장소 또는 의약품별 폴더)에 이미지를
+        저장합니다. 이미 있는 파일은 다시 쓰지 않습니다.
+
+        Args:
+            record (Dict[str, Any]): 의약품 레코드
+            image_info (Dict[str, Any]): 이미지 id별 이미지 정보
+            image_source (ImageSource): 이미지 원본을 읽을 이미지 소스
+            output_dir (str): 출력 디렉토리 경로
+
+        Returns:
+            int: 다시 저장한 이미지 수
+        """
+        restored = 0
+        if self.image_store is not None:
+            for image in record.get("images", []):
+                image_meta = image_info.get(image.get("id"), {})
+                # 정규화한 이미지와 함께 저장한 원본
+                stored = [(image["path"], False)]
+                if image.get("original"):
+                    stored.append((image["original"], True))
+                for stored_path, original in stored:
+                    path = os.path.join(self.image_store.root_dir, stored_path)
+                    if os.path.exists(path):
+                        continue
+                    loaded = self._read_image(
+                        image_meta, image_source, original=original
+                    )
+                    if loaded is not None:
+                        href, image_data = loaded
+                        extension = os.path.splitext(href)[-1].lower()
+                        self.image_store.put(image_data, extension, writer=self.writer)
+                        restored += 1
+            return restored
+
+        folder_path = os.path.join(output_dir, drug_folder_name(record.get("title")))
+        for paragraph in record.get("content", []):
+            for node in paragraph.get("children", []):
+                if node.get("type") != "image":
+                    continue
+                image_meta = image_info.get(node.get("altText"), {})
+                href = image_meta.get("path")
+                if not href:
+                    continue
+                if image_meta.get("converted"):
+                    href = os.path.splitext(href)[0] + CONVERTED_EXTENSION
+                # 정규화한 이미지와 함께 저장한 원본
+                targets = [(href, True)]
+                display_href = normalized_href(image_meta)
+                if display_href is not None:
+                    targets.insert(0, (display_href, False))
+                for target_href, original in targets:
+                    target_path = os.path.join(
+                        folder_path, os.path.basename(target_href)
+                    )
+                    if os.path.exists(target_path):
+                        continue
+                    loaded = self._read_image(
+                        image_meta, image_source, original=original
+                    )
+                    if loaded is not None:
+                        # 변환 결과를 읽지 못해 원본을 사용하는 경우 원본 파일 이름으로 저장
+                        target_path = os.path.join(
+                            folder_path, os.path.basename(loaded[0])
+                        )
+                        self._make_dirs(folder_path)
+                        self._write_file(target_path, loaded[1])
+                        restored += 1
+        return restored
+
+    def iter_paragraph_chunks(
+        self,
+        sources: Iterable[SectionSource],
+        chunk_paragraphs: int = 500,
+        stream: bool = False,
+    ) -> Iterator[bytes]:
+        """section XML을 의약품 경계에서 나누어 최상위 문단 묶음을 XML로 생성
+
+        문단을 빌드하지 않고 제목 문단(lineseg textheight 조건)과 카테고리 문단
+        (styleIDRef 조건)만 확인하는 가벼운 1차 탐색입니다. 묶음이 chunk_paragraphs개
+        이상의 최상위 문단을 모은 뒤 다음 경계 문단을 만나면 새 묶음을 시작하므로,
+        각 묶음은 연속된 의약품 범위가 됩니다. 각 묶음은 ``parse_section_events``로
+        독립적으로 파싱한 뒤 ``iter_drugs_from_events``로 순서대로 병합할 수 있습니다.
+
+        Args:
+            sources (Iterable[SectionSource]): section 번호 순의 section XML 목록
+            chunk_paragraphs (int): 묶음당 최상위 문단 수의 기준값
+            stream (bool): True면 각 section을 DOM으로 만들지 않고 점진적으로 파싱
+
+        Yields:
+            bytes: 최상위 문단들을 하나의 루트 요소로 감싼 XML
+        """
+        chunk: List[bytes] = []
+        for source in sources:
+            if stream:
+                paragraphs: Iterable[ElementTree.Element] = (
+                    self._iter_stream_paragraphs(source, nested=False)
                 )
-                os.makedirs(folder_path, exist_ok=True)
-                para = self._build_paragraph(p, style_info, folder_path)
-                if para["children"]:
-                    current_content.append(para)
+            else:
+                root = self.backend.load_root(source)
+                paragraphs = root.findall(self.rules.paragraph_tag)
+
+            for p in paragraphs:
+                # 묶음이 충분히 크면 다음 제목/카테고리 문단 앞에서 나눔
+                if len(chunk) >= chunk_paragraphs and (
+                    self._is_title_paragraph(p) or self._is_section_paragraph(p)
+                ):
+                    yield self._wrap_chunk(chunk)
+                    chunk = []
+                chunk.append(self.backend.tostring(p))
+
+        if chunk:
+            yield self._wrap_chunk(chunk)
+
+    def _wrap_chunk(self, chunk: List[bytes]) -> bytes:
+        """직렬화된 문단들을 하나의 루트 요소로 감쌈"""
+        return b"<chunk>" + b"".join(chunk) + b"</chunk>"
+
+    def iter_parse(
+        self,
+        source: Union[str, IO[bytes]],
+        style_info: Mapping[str, Any],
+        image_info: Dict[str, Any],
+        output_dir: str = "data/output/result",
+        image_source: Optional[ImageSource] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """section XML을 스트리밍 방식으로 파싱하여 의약품 단위로 생성
+
+        전체 DOM을 만들지 않고 zip 멤버 스트림에서 직접 읽으므로, 최대 메모리
+        사용량이 문서 전체가 아닌 의약품 하나의 크기를 따릅니다.
+
+        Args:
+            source (Union[str, IO[bytes]]): section XML 파일 경로 또는 바이너리 스트림
+            style_info (Mapping[str, Any]): 스타일 정보 (HeaderXmlParser.parse 결과 또는 같은 형식의 딕셔너리)
+            image_info (Dict[str, Any]): 이미지 정보
+            output_dir (str): 출력 디렉토리 경로
+            image_source (Optional[ImageSource]): 이미지 데이터를 읽을 소스.
+                None이면 이미지를 읽지 않음 (이미지 노드를 만들지 않음)
+
+        Yields:
+            Dict[str, Any]: 의약품별 메타데이터와 내용
+        """
+        yield from self.iter_sections(
+            [source], style_info, image_info, output_dir, image_source, stream=True
+        )
+
+    def iter_drugs(
+        self,
+        xml_content: Union[str, ElementTree.Element],
+        style_info: Mapping[str, Any],
+        image_info: Dict[str, Any],
+        output_dir: str = "data/output/result",
+        image_source: Optional[ImageSource] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """XML 내용을 파싱하여 의약품 레코드를 하나씩 생성
+
+        의약품 하나가 완성될 때마다 바로 내보내므로, 저장이나 색인 등 후속 작업을
+        파싱과 겹쳐서 진행할 수 있습니다.
+
+        Args:
+            xml_content (Union[str, ElementTree.Element]): XML 내용 (문자열 또는 ElementTree.Element)
+            style_info (Mapping[str, Any]): 스타일 정보 (HeaderXmlParser.parse 결과 또는 같은 형식의 딕셔너리)
+            image_info (Dict[str, Any]): 이미지 정보
+            output_dir (str): 출력 디렉토리 경로
+            image_source (Optional[ImageSource]): 이미지 데이터를 읽을 소스.
+                None이면 이미지를 읽지 않음 (이미지 노드를 만들지 않음)
+
+        Yields:
+            Dict[str, Any]: chapter, section, title, subtitle, order, content를 담은 의약품 레코드
+        """
+        yield from self.iter_sections(
+            [xml_content], style_info, image_info, output_dir, image_source
+        )
 
-            i += 1
+    def parse(
+        self,
+        xml_content: Union[str, ElementTree.Element],
+        style_info: Mapping[str, Any],
+        image_info: Dict[str, Any],
+        output_dir: str = "data/output/result",
+        image_source: Optional[ImageSource] = None,
+    ) -> List[Dict[str, Any]]:
+        """XML 내용을 파싱하여 메타데이터와 내용을 추출
 
-        # 마지막 메타데이터와 내용 추가
-        if current_metadata:
-            result.append({**current_metadata, "content": current_content})
-            total_drugs += 1
-            logger.info(f"의약품 파싱 완료: {current_metadata.get('title')}")
+        Args:
+            xml_content (Union[str, ElementTree.Element]): XML 내용 (문자열 또는 ElementTree.Element)
+            style_info (Mapping[str, Any]): 스타일 정보 (HeaderXmlParser.parse 결과 또는 같은 형식의 딕셔너리)
+            image_info (Dict[str, Any]): 이미지 정보
+            output_dir (str): 출력 디렉토리 경로
+            image_source (Optional[ImageSource]): 이미지 데이터를 읽을 소스.
+                None이면 이미지를 읽지 않음 (이미지 노드를 만들지 않음)
 
-        logger.info(f"파싱 완료: 총 {total_drugs}개의 의약품 처리됨")
-        return result
+        Returns:
+            List[Dict[str, Any]]: 추출된 메타데이터와 내용 목록
+        """
+        return list(
+            self.iter_drugs(
+                xml_content, style_info, image_info, output_dir, image_source
+            )
+        )
@@ -0,0 +1,774 @@
+"""
+.hwpx 문서 파싱 파이프라인
+
+header.xml, content.hpf, section XML 파싱을 하나로 묶어 의약품 레코드를
+하나씩 생성하고, 여러 문서를 프로세스 풀에서 나누어 처리합니다.
+"""
+
+import os
+import time
+import traceback
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+from itertools import repeat
+from typing import (
+    IO,
+    Any,
+    Callable,
+    ContextManager,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+from xml.etree import ElementTree
+
+from kp_parser.core.content_hpf_parser import ContentHpfParser
+from kp_parser.core.equation_converter import EQUATION_CONVERTER_VERSION
+from kp_parser.core.header_xml_parser import HeaderXmlParser, StyleTable
+from kp_parser.core.section_xml_parser import ParagraphEvent, SectionXmlParser
+from kp_parser.utils.async_writer import AsyncWriter
+from kp_parser.utils.config_utils import rules_hash
+from kp_parser.utils.file_utils import HwpxPackage
+from kp_parser.utils.image_normalizer import ImageNormalizer
+from kp_parser.utils.image_source import PackageImageSource
+from kp_parser.utils.image_store import ImageStore
+from kp_parser.utils.incremental import IncrementalManifest
+from kp_parser.utils.logger import logger
+from kp_parser.utils.output_utils import OUTPUT_FORMAT_FOLDER, save_parsed_data
+from kp_parser.utils.parse_cache import CacheEntryWriter, ParseCache
+from kp_parser.utils.profiler import Profiler, profiling, timer
+from kp_parser.utils.serializer import JsonSerializer
+from kp_parser.utils.vector_image import REPORT_FILE, VectorImageConverter
+
+# 배치 디버그 모드에서 문서별로 압축 해제할 폴더 (문서 폴더 이름으로 쓰지 않음)
+BATCH_EXTRACT_DIR = ".extract"
+
+
+def load_document_info(
+    content_map: Mapping[str, Any], xml_backend: Optional[str] = None
+) -> Tuple[StyleTable, Dict[str, Any]]:
+    """header.xml과 content.hpf에서 스타일 정보와 이미지 정보를 추출합니다.
+
+    Args:
+        content_map: 파일 경로를 키로 하는 .hwpx 내용
+        xml_backend: XML 백엔드 이름 (None이면 설정 파일의 값)
+
+    Returns:
+        Tuple[StyleTable, Dict[str, Any]]: (스타일 표, 이미지 id별 이미지 정보)
+    """
+    # header.xml 파싱
+    style_info = StyleTable({})
+    with timer("header_xml"):
+        if (
+            isinstance(content_map, HwpxPackage)
+            and "Contents/header.xml" in content_map
+        ):
+            # 원본 바이트를 넘겨 같은 header.xml이면 파싱 없이 캐시된 스타일 표 사용
+            header_xml: Any = content_map.read_bytes("Contents/header.xml")
+        else:
+            header_xml = content_map.get("Contents/header.xml")
+        if isinstance(header_xml, (str, bytes)) or ElementTree.iselement(header_xml):
+            style_info = HeaderXmlParser(xml_backend=xml_backend).parse(header_xml)
+
+    # content.hpf 파싱 (이미지 정보)
+    image_info: Dict[str, Any] = {}
+    with timer("content_hpf"):
+        content_hpf = content_map.get("Contents/content.hpf")
+        if isinstance(content_hpf, str) or ElementTree.iselement(content_hpf):
+            parsed_image_info = ContentHpfParser(xml_backend=xml_backend).parse(
+                content_hpf
+            )
+            if isinstance(parsed_image_info, list):
+                # 이미지 정보를 id를 키로 하는 딕셔너리로 변환
+                image_info = {img["id"]: img for img in parsed_image_info}
+
+    return style_info, image_info
+
+
+def _open_sections(
+    package: HwpxPackage, section_names: List[str]
+) -> Iterator[IO[bytes]]:
+    """section 파일을 순서대로 하나씩 열어 스트림으로 제공 (캐시를 거치지 않음)"""
+    for section_name in section_names:
+        with package.open(section_name) as section_stream:
+            yield section_stream
+
+
+def _parse_section_events(
+    section_parser: SectionXmlParser,
+    hwpx_path: str,
+    section_name: str,
+    style_info: Mapping[str, Any],
+    image_info: Dict[str, Any],
+    output_dir: str,
+    stream: bool,
+) -> List[ParagraphEvent]:
+    """작업자 프로세스에서 section 하나를 파싱하여 문단별 처리 결과를 반환"""
+    with HwpxPackage(hwpx_path) as package:
+        with package.open(section_name) as section_stream:
+            events = section_parser.parse_section_events(
+                section_stream,
+                style_info,
+                image_info,
+                output_dir=output_dir,
+                image_source=PackageImageSource(package),
+                stream=stream,
+            )
+    return events
+
+
+# 문단 묶음 작업자 프로세스의 파싱 문맥 (작업자 초기화 시 설정)
+_chunk_context: Dict[str, Any] = {}
+
+
+def _init_chunk_worker(
+    section_parser: SectionXmlParser,
+    hwpx_path: str,
+    style_info: Mapping[str, Any],
+    image_info: Dict[str, Any],
+    output_dir: str,
+    cache_bytes: Optional[int],
+) -> None:
+    """문단 묶음 작업자 프로세스를 초기화 (패키지는 작업자마다 한 번만 엶)"""
+    package = HwpxPackage(hwpx_path, cache_bytes=cache_bytes)
+    _chunk_context.update(
+        section_parser=section_parser,
+        image_source=PackageImageSource(package),
+        style_info=style_info,
+        image_info=image_info,
+        output_dir=output_dir,
+    )
+
+
+def _parse_paragraph_chunk(chunk: bytes) -> List[ParagraphEvent]:
+    """작업자 프로세스에서 문단 묶음 하나를 파싱하여 문단별 처리 결과를 반환"""
+    section_parser: SectionXmlParser = _chunk_context["section_parser"]
+    events = section_parser.parse_section_events(
+        chunk,
+        _chunk_context["style_info"],
+        _chunk_context["image_info"],
+        output_dir=_chunk_context["output_dir"],
+        image_source=_chunk_context["image_source"],
+    )
+    return events
+
+
+def _iter_bounded(
+    executor: Executor, fn: Callable[[Any], Any], items: Iterable[Any], max_pending: int
+) -> Iterator[Any]:
+    """작업을 제출 순서대로 결과를 내보내되, 진행 중인 작업 수를 제한"""
+    pending: Deque["Future[Any]"] = deque()
+    for item in items:
+        pending.append(executor.submit(fn, item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _parser_settings(section_parser: SectionXmlParser) -> Dict[str, Any]:
+    """결과에 영향을 주는 파서 설정 (증분 파싱 지문에 포함)"""
+    from kp_parser import __version__
+
+    image_store = section_parser.image_store
+    return {
+        "version": __version__,
+        "config_name": section_parser.config_name,
+        "image_mode": section_parser.image_mode,
+        "image_base_url": section_parser.image_base_url,
+        "inline_max_bytes": section_parser.inline_max_bytes,
+        "image_store": image_store.root_dir if image_store is not None else None,
+        "xml_backend": section_parser.backend.name,
+        "equation_converter": EQUATION_CONVERTER_VERSION,
+        "vector_images": section_parser.vector_converter is not None,
+        "image_normalizer": (
+            section_parser.image_normalizer.settings()
+            if section_parser.image_normalizer is not None
+            else None
+        ),
+    }
+
+
+def _iter_document_drugs(
+    hwpx_path: str,
+    output_dir: str,
+    section_names: Optional[List[str]],
+    extract_dir: str,
+    debug: bool,
+    stream: bool,
+    cache_bytes: Optional[int],
+    section_parser: SectionXmlParser,
+    section_workers: int,
+    paragraph_workers: int,
+    chunk_paragraphs: int,
+    incremental: bool,
+    cache_entry: Optional[CacheEntryWriter],
+) -> Iterator[Dict[str, Any]]:
+    """.hwpx 파일을 파싱하여 의약품 레코드를 생성 (인자는 ``iter_hwpx_drugs`` 참고)
+
+    cache_entry가 주어지면 추출한 스타일 정보와 이미지 정보를 캐시 항목에 기록합니다.
+    """
+    xml_backend = section_parser.backend.name
+    with HwpxPackage(
+        hwpx_path, cache_bytes=cache_bytes, xml_backend=xml_backend
+    ) as package:
+        # 디버그 모드일 경우 추가로 디스크에 저장
+        if debug:
+            package.extract_all(extract_dir)
+
+        style_info, image_info = load_document_info(package, xml_backend)
+        if section_parser.vector_converter is not None:
+            # section 파싱 전에 문서의 WMF/EMF 이미지를 모아 한 번에 변환
+            with timer("vector_images"):
+                image_info, report = section_parser.vector_converter.convert_images(
+                    image_info, PackageImageSource(package), document=hwpx_path
+                )
+            if report.images:
+                report.save(os.path.join(output_dir, REPORT_FILE))
+        if section_parser.image_normalizer is not None:
+            # 변환한 벡터 이미지까지 포함하여 표시 너비로 줄이고 다시 인코딩
+            with timer("normalize_images"):
+                image_info = section_parser.image_normalizer.normalize_images(
+                    image_info, PackageImageSource(package)
+                )
+        if cache_entry is not None:
+            cache_entry.set_document_info(style_info, image_info)
+
+        if section_names is None:
+            section_names = package.section_files
+        missing = [name for name in section_names if name not in package]
+        if missing:
+            logger.warning(f"section 파일을 찾을 수 없습니다: {missing}")
+            section_names = [name for name in section_names if name in package]
+        if not section_names:
+            return
+
+        if paragraph_workers > 1:
+            # 1차 탐색으로 의약품 경계를 찾아 문단 묶음을 작업자에 나누고 순서대로 병합
+            logger.info(
+                f"문단 묶음 병렬 파싱: 묶음당 최상위 문단 {chunk_paragraphs}개 기준, "
+                f"작업자 {paragraph_workers}개"
+            )
+            chunks = section_parser.iter_paragraph_chunks(
+                _open_sections(package, section_names),
+                chunk_paragraphs=chunk_paragraphs,
+                stream=stream,
+            )
+            with ProcessPoolExecutor(
+                max_workers=paragraph_workers,
+                initializer=_init_chunk_worker,
+                initargs=(
+                    section_parser,
+                    hwpx_path,
+                    style_info,
+                    image_info,
+                    output_dir,
+                    cache_bytes,
+                ),
+            ) as executor:
+                event_lists = _iter_bounded(
+                    executor,
+                    _parse_paragraph_chunk,
+                    chunks,
+                    max_pending=paragraph_workers * 2,
+                )
+                yield from section_parser.iter_drugs_from_events(
+                    event_lists, output_dir=output_dir
+                )
+            return
+
+        if section_workers > 1 and len(section_names) > 1:
+            # section별로 작업자 프로세스에서 파싱한 뒤 section 순서대로 병합
+            logger.info(
+                f"section 병렬 파싱: section {len(section_names)}개, "
+                f"작업자 {section_workers}개"
+            )
+            with ProcessPoolExecutor(
+                max_workers=min(section_workers, len(section_names))
+            ) as executor:
+                event_lists = executor.map(
+                    _parse_section_events,
+                    repeat(section_parser),
+                    repeat(hwpx_path),
+                    section_names,
+                    repeat(style_info),
+                    repeat(image_info),
+                    repeat(output_dir),
+                    repeat(stream),
+                )
+                yield from section_parser.iter_drugs_from_events(
+                    event_lists, output_dir=output_dir
+                )
+            return
+
+        # 이미지는 디스크에 풀지 않고 열려 있는 패키지에서 바로 읽음
+        image_source = PackageImageSource(package)
+        manifest = None
+        if incremental:
+            manifest = IncrementalManifest(
+                output_dir,
+                style_info,
+                image_info,
+                image_source,
+                # 저장 형식(들여쓰기 여부)이 바뀌어도 다시 저장
+                settings={**_parser_settings(section_parser), "pretty": debug},
+                backend=section_parser.backend,
+            )
+        yield from section_parser.iter_sections(
+            _open_sections(package, section_names),
+            style_info,
+            image_info,
+            output_dir=output_dir,
+            image_source=image_source,
+            stream=stream,
+            drug_filter=manifest.drug_filter if manifest is not None else None,
+        )
+
+        # 모든 의약품을 내보낸 뒤에만 목록을 갱신 (중간에 실패하면 이전 목록 유지)
+        if manifest is not None:
+            # 목록에 기록하기 전에 백그라운드 쓰기가 모두 성공했는지 확인
+            if section_parser.writer is not None:
+                section_parser.writer.flush()
+            manifest.remove_stale()
+            manifest.save()
+
+
+def _iter_cached_drugs(
+    section_parser: SectionXmlParser,
+    hwpx_path: str,
+    output_dir: str,
+    extract_dir: Optional[str],
+    style_info: Dict[str, Any],
+    image_info: Dict[str, Any],
+    records: Iterator[Dict[str, Any]],
+) -> Iterator[Dict[str, Any]]:
+    """캐시된 의약품 레코드를 내보내며, 레코드가 참조하는 이미지 파일이 없으면 다시 저장"""
+    with HwpxPackage(hwpx_path, xml_backend=section_parser.backend.name) as package:
+        # 디버그 모드일 경우 추가로 디스크에 저장
+        if extract_dir is not None:
+            package.extract_all(extract_dir)
+        image_source = PackageImageSource(package)
+        restored = 0
+        for record in records:
+            restored += section_parser.restore_images(
+                record, image_info, image_source, output_dir
+            )
+            yield record
+    if restored:
+        logger.info(
+            f"캐시된 결과의 이미지 {restored}개를 다시 저장했습니다: {hwpx_path}"
+        )
+
+
+def iter_hwpx_drugs(
+    hwpx_path: str,
+    output_dir: str = "data/output/result",
+    section_names: Optional[List[str]] = None,
+    extract_dir: str = "data/output/tmp",
+    debug: bool = False,
+    stream: bool = False,
+    cache_bytes: Optional[int] = None,
+    section_parser: Optional[SectionXmlParser] = None,
+    section_workers: int = 1,
+    paragraph_workers: int = 1,
+    chunk_paragraphs: int = 500,
+    incremental: bool = False,
+    cache: Optional[ParseCache] = None,
+) -> Iterator[Dict[str, Any]]:
+    """.hwpx 파일을 파싱하여 의약품 레코드를 하나씩 생성합니다.
+
+    zip 멤버는 ``HwpxPackage``를 통해 실제로 필요한 것만 읽습니다. 모든 section
+    파일을 번호 순으로 이어서 파싱하므로, section 경계에 걸친 의약품은 하나로
+    이어지고 order도 section을 넘어 이어집니다.
+
+    Args:
+        hwpx_path: .hwpx 파일 경로
+        output_dir: 출력 디렉토리 경로 (이미지 저장 위치)
+        section_names: 파싱할 section 파일 경로 목록 (None이면 모든 section)
+        extract_dir: 디버그 모드일 때 압축 해제할 디렉토리
+        debug: 디버그 모드 여부
+        stream: True면 section XML을 DOM으로 만들지 않고 스트리밍 방식으로 파싱
+        cache_bytes: 해제된 zip 멤버 캐시의 최대 바이트 수 (None이면 제한 없음)
+        section_parser: section 파싱에 사용할 파서 (이미지 저장소, 이미지 모드 등 설정 포함).
+            None이면 기본 설정의 파서를 사용
+        section_workers: section을 나누어 파싱할 작업자 프로세스 수.
+            1이면 현재 프로세스에서 순서대로 파싱
+        paragraph_workers: section 안의 문단을 의약품 경계에서 나누어 파싱할 작업자
+            프로세스 수. 2 이상이면 section_workers 대신 이 방식을 사용
+        chunk_paragraphs: paragraph_workers 사용 시 작업 하나에 담을 최상위 문단 수의 기준값
+        incremental: True면 output_dir의 manifest.json과 의약품 지문을 비교하여 바뀐
+            의약품만 생성하고, 사라진 의약품의 결과 폴더는 삭제. 순차 파싱으로 진행
+        cache: 파싱 결과 캐시. 입력 파일, 파싱 규칙, 버전, 파서 설정이 모두 같은 이전
+            결과가 있으면 XML을 파싱하지 않고 저장된 레코드를 내보냄 (증분 파싱에서는 사용 안 함)
+
+    Yields:
+        Dict[str, Any]: chapter, section, title, subtitle, order, content를 담은 의약품 레코드
+    """
+    if section_parser is None:
+        section_parser = SectionXmlParser()
+    image_store = section_parser.image_store
+    if incremental and (section_workers > 1 or paragraph_workers > 1):
+        logger.info(
+            "증분 파싱은 의약품 순서대로 지문을 비교하므로 순차 파싱으로 진행합니다."
+        )
+        section_workers = paragraph_workers = 1
+
+    if cache is not None and incremental:
+        logger.info("증분 파싱에서는 파싱 결과 캐시를 사용하지 않습니다.")
+        cache = None
+
+    try:
+        cache_entry = None
+        if cache is not None:
+            cache_key = cache.key(
+                hwpx_path,
+                rules_hash(section_parser.config_name),
+                {
+                    **_parser_settings(section_parser),
+                    # 레코드에는 저장소 기준 상대 경로만 담기므로 저장소 위치는 키에서 제외
+                    "image_store": section_parser.image_store is not None,
+                    "section_names": section_names,
+                },
+            )
+            cached = cache.load(cache_key)
+            if cached is not None:
+                # 바뀌지 않은 문서: XML을 파싱하지 않고 저장된 레코드를 사용
+                yield from _iter_cached_drugs(
+                    section_parser,
+                    hwpx_path,
+                    output_dir,
+                    extract_dir if debug else None,
+                    *cached,
+                )
+                return
+            cache_entry = cache.open_entry(cache_key)
+
+        records = _iter_document_drugs(
+            hwpx_path,
+            output_dir,
+            section_names,
+            extract_dir,
+            debug,
+            stream,
+            cache_bytes,
+            section_parser,
+            section_workers,
+            paragraph_workers,
+            chunk_paragraphs,
+            incremental,
+            cache_entry,
+        )
+        if cache_entry is None:
+            yield from records
+            return
+
+        try:
+            for record in records:
+                cache_entry.add(record)
+                yield record
+        except BaseException:
+            # 중간에 실패하거나 중단된 문서는 캐시에 추가하지 않음
+            cache_entry.discard()
+            raise
+        cache_entry.commit()
+    finally:
+        # 이번 실행에서 저장한 이미지 해시 목록을 기록
+        if image_store is not None:
+            image_store.save()
+
+
+def _iter_profiled_drugs(
+    records: Iterator[Dict[str, Any]], profiler: Profiler
+) -> Iterator[Dict[str, Any]]:
+    """의약품 레코드를 하나씩 만드는 데 걸린 시간을 측정기에 기록"""
+    while True:
+        start = time.perf_counter()
+        try:
+            record = next(records)
+        except StopIteration:
+            return
+        profiler.add_drug(
+            record.get("title"), record.get("order"), time.perf_counter() - start
+        )
+        yield record
+
+
+def parse_hwpx_file(
+    hwpx_path: str,
+    output_dir: str,
+    extract_dir: str = "data/output/tmp",
+    debug: bool = False,
+    stream: bool = False,
+    parser_options: Optional[Dict[str, Any]] = None,
+    section_workers: int = 1,
+    paragraph_workers: int = 1,
+    chunk_paragraphs: int = 500,
+    incremental: bool = False,
+    output_format: str = OUTPUT_FORMAT_FOLDER,
+    write_queue: int = 0,
+    cache_dir: Optional[str] = None,
+    cache_max_bytes: int = 1024 * 1024 * 1024,
+    profile: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """.hwpx 파일 하나를 파싱하여 저장하고 처리 결과를 반환합니다.
+
+    배치 처리 시 작업자 프로세스에서 실행되므로, 예외를 밖으로 던지지 않고
+    처리 결과에 기록합니다.
+
+    Args:
+        hwpx_path: .hwpx 파일 경로
+        output_dir: 출력 디렉토리 경로
+        extract_dir: 디버그 모드일 때 압축 해제할 디렉토리
+        debug: 디버그 모드 여부 (결과 JSON을 들여쓰기 형식으로 저장)
+        stream: True면 section XML을 스트리밍 방식으로 파싱
+        parser_options: SectionXmlParser 생성 인자. image_store에는 저장소 디렉토리
+            경로를 지정 (프로세스 간 전달을 위해 객체 대신 경로 사용). vector_cache_dir를
+            지정하면 WMF/EMF 이미지를 PNG로 변환하여 그 디렉토리에 캐시하고, vector_workers로
+            동시에 실행할 변환 프로세스 수를, vector_retry_failed로 실패 기록이 있는 이미지를
+            다시 변환할지 지정 (변환 결과 보고서는 ``<output_dir>/vector_images.json``).
+            image_normalizer에 ImageNormalizer 생성 인자(dict)를 지정하면 이미지를 표시
+            너비로 줄여 다시 인코딩
+        section_workers: section을 나누어 파싱할 작업자 프로세스 수
+        paragraph_workers: section 안의 문단을 의약품 경계에서 나누어 파싱할 작업자 프로세스 수
+        chunk_paragraphs: paragraph_workers 사용 시 작업 하나에 담을 최상위 문단 수의 기준값
+        incremental: True면 바뀐 의약품만 다시 저장 (``iter_hwpx_drugs`` 참고).
+            의약품별 폴더 출력 형식에서만 사용 가능
+        output_format: 출력 형식 ("folder": 의약품별 폴더, "jsonl": drugs.jsonl,
+            "sqlite": drugs.sqlite). 단일 파일 형식에서 이미지 저장소를 지정하지 않으면
+            ``<output_dir>/images``를 이미지 저장소로 사용
+        write_queue: 결과와 이미지 저장을 백그라운드 스레드에서 처리할 때 대기열에 쌓아 둘
+            최대 작업 수. 0이면 파싱 중에 바로 저장
+        cache_dir: 파싱 결과 캐시 디렉토리 (None이면 캐시 사용 안 함)
+        cache_max_bytes: 파싱 결과 캐시 디렉토리 전체 크기 상한 (바이트)
+        profile: Profiler 생성 인자 (cprofile, memory, top). 지정하면 단계별 시간과 계수,
+            의약품별 파싱 시간을 측정하여 처리 결과의 profile에 담고, cprofile이면
+            cProfile 통계를 ``<output_dir>/profile.prof``에 저장 (None이면 측정 안 함)
+
+    Returns:
+        Dict[str, Any]: 처리 결과
+            - input_file: 입력 파일 경로
+            - output_dir: 출력 디렉토리 경로
+            - status: "ok" 또는 "error"
+            - drugs: 저장한 의약품 수
+            - elapsed: 처리 시간 (초)
+            - error: 오류 메시지 (성공 시 None)
+            - traceback: 오류 추적 정보 (성공 시 None)
+            - profile: 측정 결과 (profile을 지정한 경우만, ``Profiler.report`` 참고)
+    """
+    start_time = time.perf_counter()
+    result: Dict[str, Any] = {
+        "input_file": hwpx_path,
+        "output_dir": output_dir,
+        "status": "ok",
+        "drugs": 0,
+        "elapsed": 0.0,
+        "error": None,
+        "traceback": None,
+    }
+
+    profiler = Profiler(**profile) if profile is not None else None
+    try:
+        with profiling(profiler):
+            if incremental and output_format != OUTPUT_FORMAT_FOLDER:
+                raise ValueError(
+                    "증분 파싱은 의약품별 폴더 출력 형식에서만 사용할 수 있습니다."
+                )
+            options = dict(parser_options or {})
+            store_dir = options.pop("image_store", None)
+            vector_cache_dir = options.pop("vector_cache_dir", None)
+            vector_workers = options.pop("vector_workers", 1)
+            vector_retry_failed = options.pop("vector_retry_failed", False)
+            normalizer_options = options.pop("image_normalizer", None)
+            if not store_dir and output_format != OUTPUT_FORMAT_FOLDER:
+                # 단일 파일 출력 형식에서는 의약품별 이미지 폴더 대신 이미지 저장소 사용
+                store_dir = os.path.join(output_dir, "images")
+            # 디스크 쓰기를 백그라운드 스레드에서 처리하여 파싱과 겹쳐 실행
+            write_stage: ContextManager[Optional[AsyncWriter]] = nullcontext()
+            if write_queue > 0:
+                write_stage = AsyncWriter(write_queue)
+            with write_stage as writer:
+                section_parser = SectionXmlParser(
+                    image_store=ImageStore(store_dir) if store_dir else None,
+                    writer=writer,
+                    vector_converter=(
+                        VectorImageConverter(
+                            vector_cache_dir,
+                            workers=vector_workers,
+                            retry_failed=vector_retry_failed,
+                        )
+                        if vector_cache_dir
+                        else None
+                    ),
+                    image_normalizer=(
+                        ImageNormalizer(**normalizer_options)
+                        if normalizer_options
+                        else None
+                    ),
+                    **options,
+                )
+                parsed_data = iter_hwpx_drugs(
+                    hwpx_path,
+                    output_dir=output_dir,
+                    extract_dir=extract_dir,
+                    debug=debug,
+                    stream=stream,
+                    section_parser=section_parser,
+                    section_workers=section_workers,
+                    paragraph_workers=paragraph_workers,
+                    chunk_paragraphs=chunk_paragraphs,
+                    incremental=incremental,
+                    cache=ParseCache(cache_dir, cache_max_bytes) if cache_dir else None,
+                )
+                if profiler is not None:
+                    parsed_data = _iter_profiled_drugs(parsed_data, profiler)
+                # 디버그 모드에서만 사람이 읽기 쉬운 들여쓰기 형식으로 저장
+                result["drugs"] = save_parsed_data(
+                    output_dir,
+                    parsed_data,
+                    JsonSerializer(pretty=debug),
+                    output_format=output_format,
+                    writer=writer,
+                )
+    except Exception as e:
+        logger.error(f"문서 파싱 실패: {hwpx_path} - {e}")
+        result["status"] = "error"
+        result["error"] = f"{type(e).__name__}: {e}"
+        result["traceback"] = traceback.format_exc()
+
+    result["elapsed"] = round(time.perf_counter() - start_time, 3)
+    if profiler is not None:
+        result["profile"] = profiler.report()
+        if profiler.cprofile and os.path.isdir(output_dir):
+            stats_path = os.path.join(output_dir, "profile.prof")
+            profiler.dump_stats(stats_path)
+            result["profile"]["cprofile_stats"] = stats_path
+    return result
+
+
+def _document_dir_names(
+    hwpx_paths: List[str], reserved: Iterable[str] = ()
+) -> List[str]:
+    """문서별 출력 폴더 이름 (파일명이 같은 문서는 뒤에 _2, _3 등을 붙여 구분)
+
+    Args:
+        hwpx_paths: .hwpx 파일 경로 목록
+        reserved: 문서 폴더 이름으로 쓰지 않을 이름 (출력 디렉토리의 다른 용도 폴더)
+
+    Returns:
+        List[str]: 입력 순서의 문서별 출력 폴더 이름
+    """
+    stems = [os.path.splitext(os.path.basename(path))[0] for path in hwpx_paths]
+    all_stems = set(stems)
+    used: Set[str] = set(reserved)
+    names = []
+    for hwpx_path, stem in zip(hwpx_paths, stems):
+        name = stem
+        suffix = 1
+        # 다른 문서의 파일명과도 겹치지 않도록 확인
+        while name in used or (name != stem and name in all_stems):
+            suffix += 1
+            name = f"{stem}_{suffix}"
+        if name != stem:
+            logger.warning(
+                f"파일명이 같은 문서가 있어 출력 폴더 이름을 바꿉니다: {hwpx_path} -> {name}"
+            )
+        used.add(name)
+        names.append(name)
+    return names
+
+
+def run_batch(
+    hwpx_paths: List[str],
+    output_dir: str,
+    workers: Optional[int] = None,
+    debug: bool = False,
+    stream: bool = False,
+    parser_options: Optional[Dict[str, Any]] = None,
+    incremental: bool = False,
+    output_format: str = OUTPUT_FORMAT_FOLDER,
+    write_queue: int = 0,
+    cache_dir: Optional[str] = None,
+    cache_max_bytes: int = 1024 * 1024 * 1024,
+    profile: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """여러 .hwpx 파일을 프로세스 풀에서 나누어 파싱합니다.
+
+    각 문서의 결과는 ``<output_dir>/<파일명>``에 저장되며, 한 문서가 실패해도
+    나머지 문서는 계속 처리합니다. 다른 디렉토리에 파일명이 같은 문서가 있으면 입력
+    순서대로 ``<파일명>_2``, ``<파일명>_3`` 등의 폴더에 저장합니다. 디버그 모드에서
+    압축 해제한 파일은 ``<output_dir>/.extract/<파일명>``에 저장합니다.
+
+    Args:
+        hwpx_paths: .hwpx 파일 경로 목록
+        output_dir: 출력 디렉토리 경로
+        workers: 작업자 프로세스 수 (None이면 CPU 수)
+        debug: 디버그 모드 여부
+        stream: True면 section XML을 스트리밍 방식으로 파싱
+        parser_options: SectionXmlParser 생성 인자 (``parse_hwpx_file`` 참고)
+        incremental: True면 문서마다 바뀐 의약품만 다시 저장
+        output_format: 출력 형식 (``parse_hwpx_file`` 참고)
+        write_queue: 백그라운드 쓰기 대기열 크기 (``parse_hwpx_file`` 참고)
+        cache_dir: 파싱 결과 캐시 디렉토리 (None이면 캐시 사용 안 함, 모든 문서가 공유)
+        cache_max_bytes: 파싱 결과 캐시 디렉토리 전체 크기 상한 (바이트)
+        profile: 문서별 측정 설정 (``parse_hwpx_file`` 참고, None이면 측정 안 함)
+
+    Returns:
+        List[Dict[str, Any]]: 입력 순서대로 정렬된 문서별 처리 결과
+    """
+    logger.info(
+        f"배치 파싱 시작: 문서 {len(hwpx_paths)}개, 작업자 {workers or os.cpu_count()}개"
+    )
+
+    results: Dict[int, Dict[str, Any]] = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {}
+        names = _document_dir_names(hwpx_paths, reserved=[BATCH_EXTRACT_DIR])
+        for i, (hwpx_path, name) in enumerate(zip(hwpx_paths, names)):
+            doc_output_dir = os.path.join(output_dir, name)
+            # 문서 단위로 이미 병렬 처리하므로 문서 안의 section은 순서대로 파싱
+            future = executor.submit(
+                parse_hwpx_file,
+                hwpx_path,
+                doc_output_dir,
+                extract_dir=os.path.join(output_dir, BATCH_EXTRACT_DIR, name),
+                debug=debug,
+                stream=stream,
+                parser_options=parser_options,
+                incremental=incremental,
+                output_format=output_format,
+                write_queue=write_queue,
+                cache_dir=cache_dir,
+                cache_max_bytes=cache_max_bytes,
+                profile=profile,
+            )
+            futures[future] = (i, hwpx_path, doc_output_dir)
+
+        for future in as_completed(futures):
+            i, hwpx_path, doc_output_dir = futures[future]
+            try:
+                results[i] = future.result()
+            except Exception as e:
+                # 작업자 프로세스가 비정상 종료된 경우 등
+                results[i] = {
+                    "input_file": hwpx_path,
+                    "output_dir": doc_output_dir,
+                    "status": "error",
+                    "drugs": 0,
+                    "elapsed": 0.0,
+                    "error": f"{type(e).__name__}: {e}",
+                    "traceback": None,
+                }
+            result = results[i]
+            logger.info(
+                f"문서 처리 {result['status']}: {hwpx_path} "
+                f"(의약품 {result['drugs']}개, {result['elapsed']}초)"
+            )
+
+    return [results[i] for i in range(len(hwpx_paths))]
@@ -2,11 +2,40 @@
 유틸리티 모듈
 """
 
-from kp_parser.utils.file_utils import extract_hwpx_content
-from kp_parser.utils.config_utils import load_parsing_rules, get_parsing_rule
+from kp_parser.utils.config_utils import (
+    get_compiled_rules,
+    get_parsing_rule,
+    load_parsing_rules,
+)
+from kp_parser.utils.file_utils import (
+    HwpxPackage,
+    extract_hwpx_content,
+    find_hwpx_files,
+    get_section_files,
+    open_hwpx_member,
+)
+from kp_parser.utils.image_source import (
+    DirectoryImageSource,
+    EmptyImageSource,
+    ImageSource,
+    PackageImageSource,
+)
+from kp_parser.utils.output_utils import open_sink, sanitize_filename, save_parsed_data
 
 __all__ = [
+    "HwpxPackage",
     "extract_hwpx_content",
+    "find_hwpx_files",
+    "get_section_files",
+    "open_hwpx_member",
+    "ImageSource",
+    "PackageImageSource",
+    "DirectoryImageSource",
+    "EmptyImageSource",
+    "sanitize_filename",
+    "save_parsed_data",
+    "open_sink",
     "load_parsing_rules",
     "get_parsing_rule",
+    "get_compiled_rules",
 ]
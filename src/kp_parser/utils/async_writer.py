@@ -0,0 +1,138 @@
+"""
+백그라운드 쓰기 단계
+
+파서가 의약품 레코드와 이미지 데이터를 만드는 동안 디스크 쓰기(파일 저장,
+디렉토리 생성, 출력 대상 기록)를 별도 스레드에서 처리합니다. 파일 쓰기는 GIL을
+놓고 진행되므로 CPU 위주의 XML 파싱과 겹쳐 실행됩니다.
+
+대기열 크기에 상한이 있어 쓰기가 파싱보다 느리면 작업을 넣는 쪽이 기다리므로
+(back-pressure) 메모리에 쌓이는 레코드와 이미지 수가 제한됩니다. 작업은 넣은
+순서대로 하나의 스레드에서 실행되므로, 디렉토리 생성 뒤 그 안의 파일 쓰기처럼
+순서에 의존하는 작업도 그대로 동작합니다.
+"""
+
+import os
+import queue
+import threading
+from typing import Any, Callable, Optional, Tuple
+
+from kp_parser.utils.logger import logger
+from kp_parser.utils.profiler import count
+
+# 대기열 작업 (함수, 인자)
+_Task = Tuple[Callable[..., Any], Tuple[Any, ...]]
+
+
+def write_file(path: str, data: bytes) -> None:
+    """바이트 데이터를 파일로 저장합니다."""
+    with open(path, "wb") as out_f:
+        out_f.write(data)
+    count("bytes_written", len(data))
+
+
+def make_dirs(path: str) -> None:
+    """디렉토리를 만듭니다. (이미 있으면 그대로 둠)"""
+    os.makedirs(path, exist_ok=True)
+
+
+class AsyncWriter:
+    """크기가 제한된 대기열로 쓰기 작업을 받아 백그라운드 스레드에서 순서대로 실행
+
+    쓰기 작업에서 발생한 예외는 다음 ``submit`` 또는 ``flush``/``close`` 호출에서
+    다시 발생하며, 예외가 발생한 뒤에 남은 작업은 실행하지 않고 버립니다.
+    ``with`` 문으로 사용하면 블록이 끝날 때 남은 작업을 모두 마치고 스레드를 종료합니다.
+    """
+
+    def __init__(self, max_pending: int = 64):
+        """초기화
+
+        Args:
+            max_pending: 대기열에 쌓아 둘 수 있는 최대 작업 수 (가득 차면 submit이 대기)
+
+        Raises:
+            ValueError: max_pending이 1보다 작은 경우
+        """
+        if max_pending < 1:
+            raise ValueError(f"쓰기 대기열 크기는 1 이상이어야 합니다: {max_pending}")
+        self.max_pending = max_pending
+        self._queue: "queue.Queue[Optional[_Task]]" = queue.Queue(maxsize=max_pending)
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="kp-parser-writer", daemon=True
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        """대기열의 작업을 순서대로 실행 (None을 받으면 종료)"""
+        while True:
+            task = self._queue.get()
+            try:
+                if task is None:
+                    return
+                if self._error is None:
+                    fn, args = task
+                    fn(*args)
+            except BaseException as e:
+                logger.error(f"백그라운드 쓰기 실패: {e}")
+                self._error = e
+            finally:
+                self._queue.task_done()
+
+    def _raise_error(self) -> None:
+        """쓰기 작업에서 발생한 예외를 다시 발생시킴"""
+        if self._error is not None:
+            raise self._error
+
+    def submit(self, fn: Callable[..., Any], *args: Any) -> None:
+        """쓰기 작업을 대기열에 넣습니다. 대기열이 가득 차면 빈 자리가 날 때까지 기다립니다.
+
+        Args:
+            fn: 백그라운드 스레드에서 실행할 함수
+            *args: 함수 인자
+
+        Raises:
+            ValueError: 이미 닫힌 경우
+        """
+        if self._closed:
+            raise ValueError("닫힌 쓰기 단계에는 작업을 넣을 수 없습니다.")
+        self._raise_error()
+        self._queue.put((fn, args))
+
+    def write_file(self, path: str, data: bytes) -> None:
+        """파일 저장 작업을 대기열에 넣습니다."""
+        self.submit(write_file, path, data)
+
+    def make_dirs(self, path: str) -> None:
+        """디렉토리 생성 작업을 대기열에 넣습니다."""
+        self.submit(make_dirs, path)
+
+    def wait(self) -> None:
+        """대기열의 작업이 모두 끝날 때까지 기다립니다. (예외는 다시 발생시키지 않음)"""
+        self._queue.join()
+
+    def flush(self) -> None:
+        """대기열의 작업이 모두 끝날 때까지 기다린 뒤, 실패한 작업이 있으면 예외를 발생시킵니다."""
+        self.wait()
+        self._raise_error()
+
+    def close(self) -> None:
+        """남은 작업을 모두 마치고 스레드를 종료합니다. 실패한 작업이 있으면 예외를 발생시킵니다."""
+        if not self._closed:
+            self._closed = True
+            self._queue.put(None)
+            self._thread.join()
+        self._raise_error()
+
+    def __enter__(self) -> "AsyncWriter":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            self.close()
+            return
+        # 이미 예외가 발생한 경우 쓰기 작업의 예외로 덮어쓰지 않음
+        try:
+            self.close()
+        except BaseException:
+            pass
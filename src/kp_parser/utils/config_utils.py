@@ -1,23 +1,52 @@
-import yaml
+import hashlib
+import json
 import os
-from typing import Dict, Any
+import re
+from typing import Any, Dict, NamedTuple, Optional, Pattern, Tuple, Type
+
+import yaml
+
+# 설정 파일 경로별 (수정 시각, 규칙) 캐시
+_RULES_CACHE: Dict[str, Tuple[Optional[int], Dict[str, Any]]] = {}
+# (설정 파일 이름, 규칙 이름)별 (수정 시각, 컴파일된 규칙) 캐시
+_COMPILED_CACHE: Dict[Tuple[str, str], Tuple[Optional[int], Any]] = {}
+
+
+def _rules_path(config_name: str) -> str:
+    """설정 파일 이름에 해당하는 YAML 파일 경로를 반환합니다."""
+    config_dir = os.path.dirname(os.path.dirname(__file__))
+    return os.path.join(config_dir, "config", f"{config_name}.yaml")
+
+
+def _mtime(path: str) -> Optional[int]:
+    """파일 수정 시각을 반환합니다. (파일이 없으면 None)"""
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
 
 
 def load_parsing_rules(config_name: str) -> Dict[str, Any]:
     """YAML 설정 파일을 로드합니다.
 
+    프로세스 안에서 한 번만 읽고, 파일 수정 시각이 바뀐 경우에만 다시 읽습니다.
+    반환된 딕셔너리는 캐시와 공유되므로 수정하지 않아야 합니다.
+
     Args:
         config_name: 설정 파일 이름 (확장자 제외)
 
     Returns:
         Dict[str, Any]: 파싱 규칙 딕셔너리
     """
-    config_dir = os.path.dirname(os.path.dirname(__file__))
-    rules_path = os.path.join(config_dir, "config", f"{config_name}.yaml")
+    rules_path = _rules_path(config_name)
+    mtime = _mtime(rules_path)
+    cached = _RULES_CACHE.get(rules_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
 
     try:
         with open(rules_path, "r", encoding="utf-8") as f:
-            return yaml.safe_load(f)
+            rules = yaml.safe_load(f) or {}
     except FileNotFoundError:
         print(f"Warning: {rules_path} 파일을 찾을 수 없습니다.")
         return {}
@@ -25,6 +54,26 @@ def load_parsing_rules(config_name: str) -> Dict[str, Any]:
         print(f"Error: {rules_path} 파일의 YAML 형식이 올바르지 않습니다.")
         return {}
 
+    _RULES_CACHE[rules_path] = (mtime, rules)
+    return rules
+
+
+def rules_hash(config_name: str) -> str:
+    """설정 파일의 모든 파싱 규칙으로 계산한 SHA-256 해시를 반환합니다.
+
+    규칙이 바뀌면 해시가 바뀌므로, 파싱 결과 캐시 키에 포함하여 이전 규칙으로
+    만든 결과를 사용하지 않도록 합니다.
+
+    Args:
+        config_name: 설정 파일 이름 (확장자 제외)
+
+    Returns:
+        str: 파싱 규칙 해시
+    """
+    rules = load_parsing_rules(config_name)
+    data = json.dumps(rules, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
 
 def get_parsing_rule(
     rule_path: str, config_name: str = "drug_manual_part2_hwpml_rules"
@@ -48,3 +97,287 @@ def get_parsing_rule(
         return rules
     except (KeyError, TypeError):
         return None
+
+
+# 규칙 이름별 스키마 (딕셔너리는 필수 키, 타입은 값의 타입)
+_RULE_SCHEMAS: Dict[str, Dict[str, Any]] = {
+    "content_hpf": {
+        "namespaces": dict,
+        "image_extraction": {
+            "manifest": {"path": str},
+            "item": {
+                "path": str,
+                "conditions": {"media_type": str},
+                "output_format": {"type": str, "version": int, "fields": dict},
+            },
+        },
+    },
+    "header_xml": {
+        "namespaces": dict,
+        "style_extraction": {
+            "charPr": {
+                "path": str,
+                "conditions": {
+                    "bold": str,
+                    "italic": str,
+                    "underline": str,
+                    "subscript": str,
+                    "superscript": str,
+                },
+            },
+            "style": {
+                "path": str,
+                "attributes": {
+                    "type": str,
+                    "name": str,
+                    "engName": str,
+                    "paraPrIDRef": str,
+                    "charPrIDRef": str,
+                    "nextStyleIDRef": str,
+                    "langID": str,
+                    "lockForm": str,
+                },
+            },
+        },
+    },
+    "section_xml": {
+        "namespaces": dict,
+        "elements": {
+            "paragraph": str,
+            "run": str,
+            "text": str,
+            "lineseg": str,
+            "picture": str,
+            "picture_size": str,
+            "picture_original_size": str,
+            "equation": str,
+            "equation_script": str,
+        },
+        "metadata_extraction": {
+            "chapter": str,
+            "section": {"conditions": {"styleIDRef": str}},
+            "title": {
+                "conditions": {"height": str},
+                "language_conditions": {"korean": str, "english": str},
+            },
+        },
+    },
+}
+
+
+def validate_rule(value: Any, schema: Any, path: str) -> None:
+    """파싱 규칙이 스키마를 따르는지 확인합니다.
+
+    Args:
+        value: 확인할 규칙 값
+        schema: 스키마 (딕셔너리면 필수 키별 스키마, 타입이면 값의 타입)
+        path: 오류 메시지에 표시할 규칙 경로
+
+    Raises:
+        ValueError: 필수 키가 없거나 값의 타입이 맞지 않는 경우
+    """
+    if isinstance(schema, dict):
+        if not isinstance(value, dict):
+            raise ValueError(f"파싱 규칙 {path}는 매핑이어야 합니다.")
+        for key, sub_schema in schema.items():
+            if key not in value:
+                raise ValueError(f"파싱 규칙 {path}.{key}가 없습니다.")
+            validate_rule(value[key], sub_schema, f"{path}.{key}")
+    elif not isinstance(value, schema) or (schema is int and isinstance(value, bool)):
+        raise ValueError(
+            f"파싱 규칙 {path}의 형식이 올바르지 않습니다: {schema.__name__} 필요"
+        )
+
+
+def to_clark(path: str, namespaces: Dict[str, str]) -> str:
+    """접두사를 사용한 XPath 경로를 Clark 표기법({uri}tag)으로 변환합니다.
+
+    변환된 경로는 findall 등에서 namespaces 인자 없이 사용할 수 있습니다.
+
+    Args:
+        path: 경로 (예: ".//hp:t")
+        namespaces: 접두사별 네임스페이스 URI
+
+    Returns:
+        str: Clark 표기법 경로 (예: ".//{http://...}t")
+
+    Raises:
+        ValueError: 정의되지 않은 접두사를 사용한 경우
+    """
+
+    def replace(match: "re.Match[str]") -> str:
+        prefix = match.group(1)
+        if prefix not in namespaces:
+            raise ValueError(
+                f"정의되지 않은 네임스페이스 접두사입니다: {prefix} ({path})"
+            )
+        return f"{{{namespaces[prefix]}}}"
+
+    return re.sub(r"([A-Za-z_][\w.-]*):(?=[A-Za-z_*])", replace, path)
+
+
+def _descendant_tag(path: str, namespaces: Dict[str, str]) -> str:
+    """ ".//접두사:태그" 형식의 경로에서 Clark 표기법 태그를 추출합니다.
+
+    Args:
+        path: 경로 (예: ".//hh:bold")
+        namespaces: 접두사별 네임스페이스 URI
+
+    Returns:
+        str: Clark 표기법 태그 (예: "{http://...}bold")
+
+    Raises:
+        ValueError: 하위 요소 전체에서 태그 하나를 찾는 경로가 아닌 경우
+    """
+    tag = path[3:] if path.startswith(".//") else ""
+    if not tag or "/" in tag or "[" in tag:
+        raise ValueError(f"'.//접두사:태그' 형식의 경로여야 합니다: {path}")
+    return to_clark(tag, namespaces)
+
+
+class ContentHpfRules(NamedTuple):
+    """컴파일된 content.hpf 파싱 규칙"""
+
+    namespaces: Dict[str, str]
+    manifest_path: str  # manifest 태그 경로 (Clark 표기법)
+    item_path: str  # 이미지 항목 경로 (Clark 표기법)
+    media_type_prefix: str  # 이미지 항목으로 볼 media-type 접두사
+    output_type: str
+    output_version: int
+    fields: Tuple[Tuple[str, str], ...]  # (출력 필드, 속성 이름)
+
+    @classmethod
+    def compile(cls, rules: Dict[str, Any]) -> "ContentHpfRules":
+        namespaces = rules["namespaces"]
+        item = rules["image_extraction"]["item"]
+        return cls(
+            namespaces=namespaces,
+            manifest_path=to_clark(
+                rules["image_extraction"]["manifest"]["path"], namespaces
+            ),
+            item_path=to_clark(item["path"], namespaces),
+            media_type_prefix=item["conditions"]["media_type"],
+            output_type=item["output_format"]["type"],
+            output_version=item["output_format"]["version"],
+            fields=tuple(item["output_format"]["fields"].items()),
+        )
+
+
+class HeaderXmlRules(NamedTuple):
+    """컴파일된 header.xml 파싱 규칙"""
+
+    namespaces: Dict[str, str]
+    style_attributes: Tuple[Tuple[str, str], ...]  # (출력 필드, 속성 이름)
+    char_pr_tag: str  # charPr 태그 (Clark 표기법, 한 번의 순회로 찾을 때 사용)
+    style_tag: str  # style 태그
+    condition_tags: Dict[
+        str, str
+    ]  # charPr 하위 태그별 조건 이름 (예: "{...}bold" -> "bold")
+
+    @classmethod
+    def compile(cls, rules: Dict[str, Any]) -> "HeaderXmlRules":
+        namespaces = rules["namespaces"]
+        char_pr = rules["style_extraction"]["charPr"]
+        style = rules["style_extraction"]["style"]
+        return cls(
+            namespaces=namespaces,
+            style_attributes=tuple(style["attributes"].items()),
+            char_pr_tag=_descendant_tag(char_pr["path"], namespaces),
+            style_tag=_descendant_tag(style["path"], namespaces),
+            condition_tags={
+                _descendant_tag(path, namespaces): name
+                for name, path in char_pr["conditions"].items()
+            },
+        )
+
+
+class SectionXmlRules(NamedTuple):
+    """컴파일된 section{n}.xml 파싱 규칙"""
+
+    namespaces: Dict[str, str]
+    paragraph_tag: str  # 문단 태그 (Clark 표기법, 예: "{...}p")
+    run_tag: str  # run 태그
+    text_tag: str  # 텍스트 태그 (run의 자식)
+    lineseg_tag: str  # lineseg 태그
+    picture_tag: str  # 그림 태그 (run의 자식)
+    picture_size_tag: str  # 그림 크기 태그 (그림의 자식)
+    picture_original_size_tag: str  # 그림 원래 크기 태그 (그림의 자식)
+    equation_tag: str  # 수식 태그 (run의 자식)
+    equation_script_tag: str  # 수식 스크립트 태그 (수식의 자식)
+    paragraph_path: str  # 모든 하위 문단 경로
+    chapter: str  # 챕터 제목
+    section_style_id: str  # 카테고리 문단의 styleIDRef
+    title_height: str  # 제목 문단 lineseg의 textheight
+    korean_pattern: Pattern[str]  # 한글 포함 여부 (제목/영문 부제목 구분)
+
+    @classmethod
+    def compile(cls, rules: Dict[str, Any]) -> "SectionXmlRules":
+        namespaces = rules["namespaces"]
+        # 경로의 마지막 단계 (문단 순회 시 태그로 바로 비교)
+        tags = {
+            name: to_clark(path.rsplit("/", 1)[-1], namespaces)
+            for name, path in rules["elements"].items()
+        }
+        metadata = rules["metadata_extraction"]
+        language = metadata["title"]["language_conditions"]
+        return cls(
+            namespaces=namespaces,
+            paragraph_tag=tags["paragraph"],
+            run_tag=tags["run"],
+            text_tag=tags["text"],
+            lineseg_tag=tags["lineseg"],
+            picture_tag=tags["picture"],
+            picture_size_tag=tags["picture_size"],
+            picture_original_size_tag=tags["picture_original_size"],
+            equation_tag=tags["equation"],
+            equation_script_tag=tags["equation_script"],
+            paragraph_path=to_clark(rules["elements"]["paragraph"], namespaces),
+            chapter=metadata["chapter"],
+            section_style_id=str(metadata["section"]["conditions"]["styleIDRef"]),
+            title_height=str(metadata["title"]["conditions"]["height"]),
+            korean_pattern=re.compile(language["korean"]),
+        )
+
+
+# 규칙 이름별 컴파일된 규칙 타입
+_RULE_TYPES: Dict[str, Type[Any]] = {
+    "content_hpf": ContentHpfRules,
+    "header_xml": HeaderXmlRules,
+    "section_xml": SectionXmlRules,
+}
+
+
+def get_compiled_rules(rule_name: str, config_name: str) -> Any:
+    """스키마를 확인하고 컴파일한 파싱 규칙을 가져옵니다.
+
+    컴파일 결과는 프로세스 안에서 캐시되며, 설정 파일 수정 시각이 바뀐 경우에만
+    다시 읽고 컴파일합니다. 따라서 파서를 여러 번 생성해도 설정 비용이 거의 없습니다.
+
+    Args:
+        rule_name: 규칙 이름 ("content_hpf", "header_xml", "section_xml")
+        config_name: 설정 파일 이름 (확장자 제외)
+
+    Returns:
+        Any: 규칙 이름에 해당하는 컴파일된 규칙
+            (ContentHpfRules, HeaderXmlRules, SectionXmlRules)
+
+    Raises:
+        ValueError: 규칙을 찾을 수 없거나 스키마에 맞지 않는 경우
+    """
+    if rule_name not in _RULE_TYPES:
+        raise ValueError(f"지원하지 않는 파싱 규칙입니다: {rule_name}")
+
+    key = (config_name, rule_name)
+    mtime = _mtime(_rules_path(config_name))
+    cached = _COMPILED_CACHE.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    rules = get_parsing_rule(rule_name, config_name)
+    if not rules:
+        raise ValueError(f"{rule_name} 파싱 규칙을 찾을 수 없습니다.")
+    validate_rule(rules, _RULE_SCHEMAS[rule_name], rule_name)
+
+    compiled = _RULE_TYPES[rule_name].compile(rules)
+    _COMPILED_CACHE[key] = (mtime, compiled)
+    return compiled
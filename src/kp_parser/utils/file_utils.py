@@ -1,17 +1,85 @@
-import os
-import zipfile
 import fnmatch
+import glob
+import os
 import re
+import zipfile
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import IO, Dict, Iterator, List, Mapping, Optional, Tuple, Union
 from xml.etree import ElementTree
-from typing import Dict, Union, Optional, List, Tuple
+
 from kp_parser.utils.logger import logger
+from kp_parser.utils.profiler import count, profiled
+from kp_parser.utils.xml_backend import get_xml_backend
+
+# section 파일 이름 패턴 (Contents/section{n}.xml)
+SECTION_PATTERN = re.compile(r"Contents/section(\d+)\.xml")
+
+
+def get_section_files(names: List[str]) -> List[str]:
+    """파일 목록에서 section 파일들을 찾아 번호 순으로 정렬합니다.
 
+    Args:
+        names: zip 내부 파일 경로 목록
+
+    Returns:
+        List[str]: section 번호 순으로 정렬된 section 파일 경로 목록
+    """
+    section_files = []
+    for f in names:
+        match = SECTION_PATTERN.match(f)
+        if match:
+            section_files.append((int(match.group(1)), f))
 
+    # section 번호로 정렬
+    section_files.sort(key=lambda x: x[0])
+    return [f[1] for f in section_files]  # 파일 경로만 추출
+
+
+def find_hwpx_files(path_or_pattern: str) -> List[str]:
+    """입력 경로에서 파싱할 .hwpx 파일 목록을 찾습니다.
+
+    Args:
+        path_or_pattern: .hwpx 파일 경로, 디렉토리 경로 또는 glob 패턴
+            (예: "data/input", "data/input/**/*.hwpx")
+
+    Returns:
+        List[str]: 정렬된 .hwpx 파일 경로 목록
+    """
+    if os.path.isdir(path_or_pattern):
+        pattern = os.path.join(path_or_pattern, "*.hwpx")
+    elif any(c in path_or_pattern for c in "*?["):
+        pattern = path_or_pattern
+    else:
+        return [path_or_pattern] if os.path.isfile(path_or_pattern) else []
+
+    return sorted(f for f in glob.glob(pattern, recursive=True) if os.path.isfile(f))
+
+
+@contextmanager
+def open_hwpx_member(hwpx_path: str, name: str) -> Iterator[IO[bytes]]:
+    """.hwpx 파일 내부의 멤버를 압축 해제 없이 스트림으로 엽니다.
+
+    Args:
+        hwpx_path: .hwpx 파일 경로
+        name: zip 내부 파일 경로 (예: "Contents/section0.xml")
+
+    Yields:
+        IO[bytes]: 멤버의 바이너리 스트림
+    """
+    with zipfile.ZipFile(hwpx_path, "r") as zip_ref:
+        with zip_ref.open(name) as member:
+            yield member
+
+
+@profiled("extract_hwpx_content")
 def extract_hwpx_content(
     hwpx_path: str,
     pattern: Optional[str] = None,
     extract_dir: str = "data/output/tmp",
     debug: bool = False,
+    load_sections: bool = True,
+    xml_backend: Optional[str] = None,
 ) -> Dict[str, Union[ElementTree.Element, bytes]]:
     """
     .hwpx 파일의 내용을 추출합니다.
@@ -21,6 +89,8 @@ def extract_hwpx_content(
         pattern: 파일 이름 패턴 (예: "section*.xml")
         extract_dir: 디버그 모드일 때 압축 해제할 디렉토리
         debug: True면 메모리에 저장하고 추가로 디스크에도 저장, False면 메모리에만 저장
+        load_sections: False면 section 파일을 로딩하지 않음 (스트리밍 파싱 시 사용)
+        xml_backend: XML 백엔드 이름 ("auto", "lxml", "stdlib", None이면 "stdlib")
 
     Returns:
         Dict[str, Union[ElementTree.Element, bytes]]: 파일 경로를 키로, XML Element 또는 바이너리 데이터를 값으로 하는 딕셔너리
@@ -29,22 +99,14 @@ def extract_hwpx_content(
 
     # 메모리에 파일 로딩 (Contents/ + BinData/)
     content_map = {}
+    backend = get_xml_backend(xml_backend)
 
     with zipfile.ZipFile(hwpx_path, "r") as zip_ref:
         # 먼저 모든 파일 목록을 가져옵니다
         all_files = zip_ref.namelist()
 
         # section 파일들을 찾고 정렬합니다
-        section_pattern = re.compile(r"Contents/section(\d+)\.xml")
-        section_files = []
-        for f in all_files:
-            match = section_pattern.match(f)
-            if match:
-                section_files.append((int(match.group(1)), f))
-
-        # section 번호로 정렬
-        section_files.sort(key=lambda x: x[0])
-        section_files = [f[1] for f in section_files]  # 파일 경로만 추출
+        section_files = get_section_files(all_files)
 
         logger.debug(f"발견된 section 파일들: {section_files}")
 
@@ -54,15 +116,17 @@ def extract_hwpx_content(
                 # 패턴이 지정된 경우 매칭되는 파일만 처리
                 if pattern and not fnmatch.fnmatch(name, f"Contents/{pattern}"):
                     continue
+                # 스트리밍 파싱 시 section 파일은 DOM으로 만들지 않음
+                if not load_sections and SECTION_PATTERN.match(name):
+                    continue
 
                 logger.debug(f"파일 로딩 중: {name}")
                 with zip_ref.open(name) as file:
                     raw = file.read()
+                    count("bytes_read", len(raw))
                     if name.endswith((".xml", ".hpf")):
                         try:
-                            content_map[name] = ElementTree.fromstring(
-                                raw.decode("utf-8")
-                            )
+                            content_map[name] = backend.fromstring(raw)
                             logger.debug(f"XML 파싱 성공: {name}")
                         except Exception as e:
                             logger.error(f"XML 파싱 실패: {name} - {e}")
@@ -81,3 +145,144 @@ def extract_hwpx_content(
         f"로딩된 파일 수: {len(content_map)}, section 파일 수: {len(section_files)}"
     )
     return content_map
+
+
+class HwpxPackage(Mapping[str, Union[ElementTree.Element, bytes]]):
+    """.hwpx 파일 내용을 필요할 때만 읽어 오는 지연 로딩 패키지
+
+    ``extract_hwpx_content``와 같은 키(Contents/, BinData/ 아래 파일 경로)를
+    제공하지만, zip 파일을 열어 둔 채 ``namelist()``만 색인해 두고 각 멤버는
+    처음 접근할 때 읽습니다. XML(.xml, .hpf)은 XML 백엔드의 요소로, 그 외에는
+    bytes로 반환합니다.
+
+    ``cache_bytes``를 지정하면 해제된 멤버를 원본 크기 기준으로 합산하여 그 한도
+    안에서만 LRU 방식으로 보관합니다. None이면 한 번 읽은 멤버를 모두 보관합니다.
+    """
+
+    def __init__(
+        self,
+        hwpx_path: str,
+        cache_bytes: Optional[int] = None,
+        xml_backend: Optional[str] = None,
+    ):
+        """패키지 초기화
+
+        Args:
+            hwpx_path: .hwpx 파일 경로
+            cache_bytes: 해제된 멤버 캐시의 최대 바이트 수 (None이면 제한 없음)
+            xml_backend: XML 백엔드 이름 ("auto", "lxml", "stdlib", None이면 "stdlib")
+        """
+        self.hwpx_path = hwpx_path
+        self.cache_bytes = cache_bytes
+        self.backend = get_xml_backend(xml_backend)
+        self._zip = zipfile.ZipFile(hwpx_path, "r")
+        self._infos = {
+            info.filename: info
+            for info in self._zip.infolist()
+            if info.filename.startswith(("Contents/", "BinData/"))
+        }
+        self._cache: "OrderedDict[str, Union[ElementTree.Element, bytes]]" = (
+            OrderedDict()
+        )
+        self._cached_bytes = 0
+        self.section_files = get_section_files(list(self._infos))
+
+        logger.info(
+            f"HWPX 패키지 열기: {hwpx_path} "
+            f"(파일 수: {len(self._infos)}, section 파일 수: {len(self.section_files)})"
+        )
+
+    def __getitem__(self, name: str) -> Union[ElementTree.Element, bytes]:
+        if name in self._cache:
+            self._cache.move_to_end(name)
+            return self._cache[name]
+        if name not in self._infos:
+            raise KeyError(name)
+
+        raw = self.read_bytes(name)
+        if name.endswith((".xml", ".hpf")):
+            try:
+                value: Union[ElementTree.Element, bytes] = self.backend.fromstring(raw)
+                logger.debug(f"XML 파싱 성공: {name}")
+            except Exception as e:
+                logger.error(f"XML 파싱 실패: {name} - {e}")
+                raise KeyError(name) from e
+        else:
+            value = raw
+
+        self._store(name, value, self._infos[name].file_size)
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._infos)
+
+    def __len__(self) -> int:
+        return len(self._infos)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._infos
+
+    def __enter__(self) -> "HwpxPackage":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _store(
+        self, name: str, value: Union[ElementTree.Element, bytes], size: int
+    ) -> None:
+        """해제된 멤버를 캐시에 보관하고 한도를 넘으면 오래된 멤버부터 제거"""
+        if self.cache_bytes is not None and size > self.cache_bytes:
+            return
+
+        self._cache[name] = value
+        self._cached_bytes += size
+        if self.cache_bytes is None:
+            return
+
+        while self._cached_bytes > self.cache_bytes:
+            evicted, _ = self._cache.popitem(last=False)
+            self._cached_bytes -= self._infos[evicted].file_size
+            logger.debug(f"캐시에서 제거: {evicted}")
+
+    def read_bytes(self, name: str) -> bytes:
+        """멤버의 원본 바이트를 읽습니다. (캐시를 거치지 않음)
+
+        Args:
+            name: zip 내부 파일 경로
+
+        Returns:
+            bytes: 멤버 데이터
+        """
+        logger.debug(f"파일 로딩 중: {name}")
+        data = self._zip.read(name)
+        count("bytes_read", len(data))
+        return data
+
+    def open(self, name: str) -> IO[bytes]:
+        """멤버를 압축 해제 없이 스트림으로 엽니다.
+
+        Args:
+            name: zip 내부 파일 경로
+
+        Returns:
+            IO[bytes]: 멤버의 바이너리 스트림
+        """
+        count("bytes_read", self._infos[name].file_size)
+        return self._zip.open(name)
+
+    def extract_all(self, extract_dir: str) -> None:
+        """디버그용으로 전체 내용을 디스크에 저장합니다.
+
+        Args:
+            extract_dir: 압축 해제할 디렉토리
+        """
+        os.makedirs(extract_dir, exist_ok=True)
+        self._zip.extractall(extract_dir)
+        logger.info(f"파일이 {extract_dir}에 저장되었습니다.")
+
+    def close(self) -> None:
+        """zip 파일을 닫고 캐시를 비웁니다."""
+        self._cache.clear()
+        self._cached_bytes = 0
+        self._zip.close()
@@ -0,0 +1,289 @@
+"""
+이미지 정규화 단계
+
+이미지 노드는 ``maxWidth`` 500으로 표시되지만 스캔한 그림처럼 해상도가 큰 원본을
+그대로 저장하고 base64로 포함하면 결과 크기와 편집기 로딩 시간이 크게 늘어납니다.
+section 파싱 전에 문서의 이미지를 모아 표시 너비로 줄이고 WebP 또는 최적화한 PNG로
+다시 인코딩하며, 이미지가 많으면 작업자 프로세스 풀에서 나누어 처리합니다.
+
+정규화 결과는 원본 내용 해시(SHA-256)와 정규화 설정으로 만든 이름으로 캐시 디렉토리에
+저장하므로 같은 이미지와 설정은 여러 문서와 여러 실행에 걸쳐 한 번만 처리합니다.
+다시 인코딩한 결과가 원본보다 크면 원본을 그대로 사용합니다. 이미지 디코딩과
+인코딩에는 Pillow가 필요하며, 설치되어 있지 않으면 정규화하지 않습니다.
+
+캐시 경로:
+    ``<cache_dir>/<해시 앞 2자리>/<해시>_<너비>w_q<품질>_v<버전>.<형식>``
+"""
+
+import hashlib
+import io
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from kp_parser.utils.image_source import ImageSource
+from kp_parser.utils.logger import logger
+from kp_parser.utils.vector_image import read_converted
+
+try:
+    from PIL import Image, ImageOps
+except ImportError:  # pragma: no cover - Pillow가 없는 환경
+    Image = None
+
+# 이미지 노드의 표시 최대 너비 (정규화 기본 너비)
+DISPLAY_MAX_WIDTH = 500
+
+# 정규화 출력 형식
+FORMAT_WEBP = "webp"
+FORMAT_PNG = "png"
+IMAGE_FORMATS = (FORMAT_WEBP, FORMAT_PNG)
+
+# 정규화 대상 확장자 (Pillow로 디코딩할 수 있는 래스터 이미지)
+RASTER_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp")
+
+# 정규화한 이미지 파일 이름에 붙이는 접미사 (원본과 같은 폴더에 저장해도 겹치지 않음)
+NORMALIZED_SUFFIX = "_display"
+
+# 정규화 방식이 바뀌면 올려서 이전 캐시를 사용하지 않도록 함
+IMAGE_NORMALIZER_VERSION = 1
+
+
+def normalized_href(image_meta: Dict[str, Any]) -> Optional[str]:
+    """정규화한 이미지의 저장 경로 (원본 경로에 접미사를 붙이고 확장자를 바꿈, 없으면 None)"""
+    normalized = image_meta.get("normalized")
+    if not normalized:
+        return None
+    stem: str = os.path.splitext(image_meta["path"])[0]
+    extension: str = os.path.splitext(normalized["path"])[-1]
+    return stem + NORMALIZED_SUFFIX + extension
+
+
+def read_normalized(image_meta: Dict[str, Any]) -> Optional[Tuple[str, bytes]]:
+    """이미지 정보에 기록된 정규화 결과를 읽습니다.
+
+    Args:
+        image_meta: content.hpf 이미지 정보 (``ImageNormalizer.normalize_images`` 결과)
+
+    Returns:
+        Optional[Tuple[str, bytes]]: (정규화한 이미지 경로, 이미지 데이터).
+            정규화 결과가 없거나 읽을 수 없으면 None
+    """
+    normalized = image_meta.get("normalized")
+    href = normalized_href(image_meta)
+    if not normalized or href is None:
+        return None
+    try:
+        with open(normalized["path"], "rb") as f:
+            data = f.read()
+    except OSError as e:
+        logger.warning(
+            f"정규화한 이미지를 읽을 수 없어 원본을 사용합니다: {normalized['path']} - {e}"
+        )
+        return None
+    return href, data
+
+
+def normalize_image(
+    data: bytes, max_width: int, image_format: str, quality: int
+) -> Optional[Tuple[bytes, int, int]]:
+    """이미지 하나를 표시 너비로 줄이고 다시 인코딩합니다 (작업자 프로세스에서 실행).
+
+    Args:
+        data: 원본 이미지 데이터
+        max_width: 최대 너비 (픽셀, 이보다 좁은 이미지는 크기를 유지)
+        image_format: 출력 형식 ("webp", "png")
+        quality: WebP 품질 (1-100)
+
+    Returns:
+        Optional[Tuple[bytes, int, int]]: (인코딩한 데이터, 너비, 높이).
+            디코딩할 수 없거나 애니메이션 이미지이면 None
+    """
+    try:
+        with Image.open(io.BytesIO(data)) as image:
+            if getattr(image, "is_animated", False):
+                return None
+            # JPEG 회전 정보를 픽셀에 반영
+            image = ImageOps.exif_transpose(image)
+            if image.width > max_width:
+                height = max(1, round(image.height * max_width / image.width))
+                image = image.resize((max_width, height), Image.LANCZOS)
+
+            output = io.BytesIO()
+            if image_format == FORMAT_WEBP:
+                if image.mode not in ("RGB", "RGBA"):
+                    has_alpha = (
+                        image.mode in ("LA", "PA") or "transparency" in image.info
+                    )
+                    image = image.convert("RGBA" if has_alpha else "RGB")
+                image.save(output, "WEBP", quality=quality, method=4)
+            else:
+                if image.mode not in ("1", "L", "LA", "P", "RGB", "RGBA"):
+                    image = image.convert("RGBA")
+                image.save(output, "PNG", optimize=True)
+            return output.getvalue(), image.width, image.height
+    except (OSError, ValueError, Image.DecompressionBombError) as e:
+        logger.debug(f"이미지를 정규화할 수 없습니다: {e}")
+        return None
+
+
+def _normalize_task(
+    args: Tuple[bytes, int, str, int]
+) -> Optional[Tuple[bytes, int, int]]:
+    return normalize_image(*args)
+
+
+class ImageNormalizer:
+    """이미지를 표시 너비로 줄여 다시 인코딩하고 원본 해시와 설정 기준으로 캐시"""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_width: int = DISPLAY_MAX_WIDTH,
+        image_format: str = FORMAT_WEBP,
+        quality: int = 80,
+        workers: int = 1,
+    ):
+        """초기화
+
+        Args:
+            cache_dir: 정규화 결과 캐시 디렉토리
+            max_width: 최대 너비 (픽셀)
+            image_format: 출력 형식 ("webp", "png")
+            quality: WebP 품질 (1-100, PNG는 무손실이므로 사용하지 않음)
+            workers: 이미지를 나누어 처리할 작업자 프로세스 수 (1이면 현재 프로세스에서 처리)
+
+        Raises:
+            ValueError: 지원하지 않는 형식이거나 너비, 품질, 작업자 수가 범위를 벗어난 경우
+        """
+        if image_format not in IMAGE_FORMATS:
+            raise ValueError(f"지원하지 않는 이미지 형식입니다: {image_format}")
+        if max_width < 1:
+            raise ValueError(f"이미지 너비는 1 이상이어야 합니다: {max_width}")
+        if not 1 <= quality <= 100:
+            raise ValueError(f"이미지 품질은 1에서 100 사이여야 합니다: {quality}")
+        if workers < 1:
+            raise ValueError(f"정규화 작업자 수는 1 이상이어야 합니다: {workers}")
+        self.cache_dir = cache_dir
+        self.max_width = max_width
+        self.image_format = image_format
+        self.quality = quality if image_format == FORMAT_WEBP else 0
+        self.workers = workers
+
+    def settings(self) -> Dict[str, Any]:
+        """결과에 영향을 주는 설정 (증분 파싱 지문과 파싱 결과 캐시 키에 포함)"""
+        return {
+            "version": IMAGE_NORMALIZER_VERSION,
+            "max_width": self.max_width,
+            "format": self.image_format,
+            "quality": self.quality,
+        }
+
+    def _cache_path(self, digest: str) -> str:
+        name = (
+            f"{digest}_{self.max_width}w_q{self.quality}"
+            f"_v{IMAGE_NORMALIZER_VERSION}.{self.image_format}"
+        )
+        return os.path.join(self.cache_dir, digest[:2], name)
+
+    def _store(self, digest: str, data: bytes) -> None:
+        """정규화 결과를 캐시에 저장 (임시 파일에 쓴 뒤 이름을 바꿈)"""
+        path = self._cache_path(digest)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _normalize_pending(
+        self, pending: Dict[str, bytes]
+    ) -> Dict[str, Optional[Tuple[bytes, int, int]]]:
+        """캐시에 없는 이미지를 정규화 (작업자 수가 1보다 크면 프로세스 풀 사용)"""
+        digests = list(pending)
+        tasks = [
+            (pending[digest], self.max_width, self.image_format, self.quality)
+            for digest in digests
+        ]
+        if self.workers > 1 and len(tasks) > 1:
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(tasks))
+            ) as executor:
+                results = list(executor.map(_normalize_task, tasks, chunksize=4))
+        else:
+            results = [_normalize_task(task) for task in tasks]
+        return dict(zip(digests, results))
+
+    def normalize_images(
+        self, image_info: Dict[str, Any], image_source: ImageSource
+    ) -> Dict[str, Any]:
+        """문서의 래스터 이미지를 모두 정규화하고 결과를 기록한 이미지 정보를 반환합니다.
+
+        WMF/EMF 변환 결과가 있으면 변환한 PNG를 정규화합니다. 정규화한 이미지의 정보에는
+        ``normalized``(path: 캐시된 이미지 경로, hash: 원본 해시)가 추가되며, section
+        파서는 이 이미지를 표시용으로 사용하고 원본도 함께 저장합니다.
+
+        Args:
+            image_info: 이미지 id별 이미지 정보
+            image_source: 이미지 원본을 읽을 이미지 소스
+
+        Returns:
+            Dict[str, Any]: 정규화 결과를 반영한 이미지 정보
+        """
+        if Image is None:
+            logger.warning("Pillow가 설치되어 있지 않아 이미지를 정규화하지 않습니다.")
+            return image_info
+
+        normalized_info = dict(image_info)
+        # 해시별 원본 데이터와 해시를 참조하는 이미지 (id, 원본 크기)
+        pending: Dict[str, bytes] = {}
+        targets: List[Tuple[str, str, int]] = []
+        for image_id, image_meta in image_info.items():
+            loaded = read_converted(image_meta)
+            if loaded is None:
+                href = image_meta.get("path") or ""
+                if os.path.splitext(href)[-1].lower() not in RASTER_EXTENSIONS:
+                    continue
+                data = image_source.read(href)
+                if data is None:
+                    continue
+            else:
+                data = loaded[1]
+            digest = hashlib.sha256(data).hexdigest()
+            targets.append((image_id, digest, len(data)))
+            if digest not in pending and not os.path.exists(self._cache_path(digest)):
+                pending[digest] = data
+
+        results = self._normalize_pending(pending) if pending else {}
+        for digest, result in results.items():
+            if result is not None:
+                self._store(digest, result[0])
+
+        normalized = 0
+        for image_id, digest, original_size in targets:
+            cache_path = self._cache_path(digest)
+            if digest in results and results[digest] is None:
+                continue
+            try:
+                size = os.path.getsize(cache_path)
+            except OSError:
+                continue
+            # 다시 인코딩해도 작아지지 않으면 원본 사용
+            if size >= original_size:
+                continue
+            normalized_info[image_id] = {
+                **image_info[image_id],
+                "normalized": {"path": cache_path, "hash": digest},
+            }
+            normalized += 1
+
+        logger.info(
+            f"이미지 정규화: 대상 {len(targets)}개 중 {normalized}개 "
+            f"(새로 처리 {len(pending)}개)"
+        )
+        return normalized_info
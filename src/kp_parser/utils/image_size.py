@@ -0,0 +1,149 @@
+"""
+이미지 크기 확인
+
+이미지 노드의 너비와 높이를 채우기 위해 픽셀을 디코딩하지 않고 파일 앞부분의
+헤더만 읽어 크기를 확인합니다. PNG, GIF, BMP, WebP는 고정 위치에서, JPEG는 SOF
+마커까지 세그먼트를 건너뛰며, WMF(placeable 헤더)와 EMF는 기록된 그림 영역을
+화면 픽셀로 환산하여 크기를 얻습니다.
+
+HWPX의 크기(hp:sz, hp:orgSz)는 HWPUNIT(1/7200인치) 단위이므로 화면 픽셀(96 DPI)로
+환산하는 함수도 함께 제공합니다.
+"""
+
+import struct
+from typing import Optional, Tuple
+
+# 1인치당 HWPUNIT과 화면 픽셀
+HWPUNIT_PER_INCH = 7200
+PIXELS_PER_INCH = 96
+
+# JPEG 프레임 시작(SOF) 마커 (DHT 0xC4, JPG 0xC8, DAC 0xCC 제외)
+_JPEG_SOF_MARKERS = frozenset(
+    (0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF)
+)
+# 길이 필드가 없는 JPEG 마커 (TEM, RST0-7)
+_JPEG_STANDALONE_MARKERS = frozenset((0x01, *range(0xD0, 0xD8)))
+
+_WMF_PLACEABLE_KEY = b"\xd7\xcd\xc6\x9a"
+# EMF 프레임(rclFrame)의 단위 (0.01mm)
+_EMF_FRAME_PER_INCH = 2540
+
+
+def hwpunit_to_pixels(value: int) -> int:
+    """HWPUNIT 길이를 화면 픽셀(96 DPI)로 환산합니다."""
+    return round(value * PIXELS_PER_INCH / HWPUNIT_PER_INCH)
+
+
+def _png_size(data: bytes) -> Optional[Tuple[int, int]]:
+    if data[12:16] != b"IHDR" or len(data) < 24:
+        return None
+    return struct.unpack(">II", data[16:24])
+
+
+def _gif_size(data: bytes) -> Optional[Tuple[int, int]]:
+    if len(data) < 10:
+        return None
+    return struct.unpack("<HH", data[6:10])
+
+
+def _bmp_size(data: bytes) -> Optional[Tuple[int, int]]:
+    if len(data) < 26:
+        return None
+    (header_size,) = struct.unpack("<I", data[14:18])
+    if header_size == 12:
+        # OS/2 BITMAPCOREHEADER
+        return struct.unpack("<HH", data[18:22])
+    width, height = struct.unpack("<ii", data[18:26])
+    # 높이가 음수면 위에서 아래로 저장된 비트맵
+    return abs(width), abs(height)
+
+
+def _webp_size(data: bytes) -> Optional[Tuple[int, int]]:
+    chunk = data[12:16]
+    if chunk == b"VP8 " and len(data) >= 30:
+        width, height = struct.unpack("<HH", data[26:30])
+        return width & 0x3FFF, height & 0x3FFF
+    if chunk == b"VP8L" and len(data) >= 25:
+        (bits,) = struct.unpack("<I", data[21:25])
+        return (bits & 0x3FFF) + 1, ((bits >> 14) & 0x3FFF) + 1
+    if chunk == b"VP8X" and len(data) >= 30:
+        width = int.from_bytes(data[24:27], "little") + 1
+        height = int.from_bytes(data[27:30], "little") + 1
+        return width, height
+    return None
+
+
+def _jpeg_size(data: bytes) -> Optional[Tuple[int, int]]:
+    pos = 2
+    size = len(data)
+    while pos + 4 <= size:
+        if data[pos] != 0xFF:
+            return None
+        marker = data[pos + 1]
+        if marker == 0xFF:
+            # 채움 바이트
+            pos += 1
+            continue
+        if marker in _JPEG_STANDALONE_MARKERS:
+            pos += 2
+            continue
+        (length,) = struct.unpack(">H", data[pos + 2 : pos + 4])
+        if marker in _JPEG_SOF_MARKERS:
+            if pos + 9 > size:
+                return None
+            height, width = struct.unpack(">HH", data[pos + 5 : pos + 9])
+            return width, height
+        if marker == 0xDA:
+            # 프레임 정보 없이 이미지 데이터가 시작됨
+            return None
+        pos += 2 + length
+    return None
+
+
+def _wmf_size(data: bytes) -> Optional[Tuple[int, int]]:
+    if len(data) < 16:
+        return None
+    left, top, right, bottom, units_per_inch = struct.unpack("<hhhhH", data[6:16])
+    if not units_per_inch:
+        return None
+    scale = PIXELS_PER_INCH / units_per_inch
+    return round(abs(right - left) * scale), round(abs(bottom - top) * scale)
+
+
+def _emf_size(data: bytes) -> Optional[Tuple[int, int]]:
+    if len(data) < 44 or data[40:44] != b" EMF":
+        return None
+    left, top, right, bottom = struct.unpack("<iiii", data[24:40])
+    scale = PIXELS_PER_INCH / _EMF_FRAME_PER_INCH
+    return round(abs(right - left) * scale), round(abs(bottom - top) * scale)
+
+
+def sniff_image_size(data: bytes) -> Optional[Tuple[int, int]]:
+    """이미지 헤더에서 (너비, 높이)를 픽셀 단위로 읽습니다.
+
+    Args:
+        data: 이미지 데이터 (헤더를 포함하는 앞부분만 있어도 됨)
+
+    Returns:
+        Optional[Tuple[int, int]]: (너비, 높이). 지원하지 않는 형식이거나 헤더가 손상되어
+            크기를 알 수 없으면 None
+    """
+    if data[:8] == b"\x89PNG\r\n\x1a\n":
+        size = _png_size(data)
+    elif data[:6] in (b"GIF87a", b"GIF89a"):
+        size = _gif_size(data)
+    elif data[:2] == b"\xff\xd8":
+        size = _jpeg_size(data)
+    elif data[:2] == b"BM":
+        size = _bmp_size(data)
+    elif data[:4] == b"RIFF" and data[8:12] == b"WEBP":
+        size = _webp_size(data)
+    elif data[:4] == _WMF_PLACEABLE_KEY:
+        size = _wmf_size(data)
+    elif data[:4] == b"\x01\x00\x00\x00":
+        size = _emf_size(data)
+    else:
+        size = None
+    if size is None or not size[0] or not size[1]:
+        return None
+    return size
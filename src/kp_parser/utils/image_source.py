@@ -0,0 +1,83 @@
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Mapping, Optional
+
+from kp_parser.utils.file_utils import HwpxPackage
+from kp_parser.utils.logger import logger
+
+
+class ImageSource(ABC):
+    """이미지 원본 바이트를 제공하는 기본 클래스
+
+    content.hpf의 이미지 경로(href)를 받아 해당 이미지 데이터를 반환합니다.
+    """
+
+    @abstractmethod
+    def read(self, href: str) -> Optional[bytes]:
+        """이미지 데이터를 읽습니다.
+
+        Args:
+            href: content.hpf에 기록된 이미지 경로 (예: "BinData/image1.png")
+
+        Returns:
+            Optional[bytes]: 이미지 데이터 (찾을 수 없으면 None)
+        """
+
+
+class PackageImageSource(ImageSource):
+    """열려 있는 .hwpx 패키지에서 이미지를 읽는 이미지 소스
+
+    ``extract_hwpx_content``의 결과(메모리) 또는 ``HwpxPackage``(zip 스트림)처럼
+    BinData/ 경로를 키로 갖는 매핑을 그대로 사용하므로 디스크에 압축을 풀 필요가
+    없습니다. ``HwpxPackage``에서는 캐시를 거치지 않고 읽으므로 이미지 데이터가
+    문서 처리가 끝날 때까지 메모리에 남지 않습니다.
+    """
+
+    def __init__(self, content_map: Mapping[str, Any]):
+        """초기화
+
+        Args:
+            content_map: 파일 경로를 키로 하는 .hwpx 내용
+        """
+        self.content_map = content_map
+
+    def read(self, href: str) -> Optional[bytes]:
+        name = f"BinData/{os.path.basename(href)}"
+        if isinstance(self.content_map, HwpxPackage):
+            data = (
+                self.content_map.read_bytes(name) if name in self.content_map else None
+            )
+        else:
+            data = self.content_map.get(name)
+        if not isinstance(data, bytes):
+            logger.error(f"패키지에서 이미지를 찾을 수 없습니다: {href}")
+            return None
+        return data
+
+
+class DirectoryImageSource(ImageSource):
+    """압축 해제된 BinData 디렉토리에서 이미지를 읽는 이미지 소스"""
+
+    def __init__(self, base_dir: str = "data/tmp/BinData"):
+        """초기화
+
+        Args:
+            base_dir: BinData 파일들이 있는 디렉토리
+        """
+        self.base_dir = base_dir
+
+    def read(self, href: str) -> Optional[bytes]:
+        source_path = os.path.join(self.base_dir, os.path.basename(href))
+        if not os.path.exists(source_path):
+            logger.error(f"이미지 파일을 찾을 수 없습니다: {source_path}")
+            return None
+
+        with open(source_path, "rb") as img_f:
+            return img_f.read()
+
+
+class EmptyImageSource(ImageSource):
+    """이미지를 제공하지 않는 이미지 소스 (이미지 소스를 지정하지 않은 경우에 사용)"""
+
+    def read(self, href: str) -> Optional[bytes]:
+        return None
@@ -0,0 +1,187 @@
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Set
+
+from kp_parser.utils.async_writer import AsyncWriter
+from kp_parser.utils.logger import logger
+
+if sys.platform == "win32":
+    import msvcrt
+else:
+    import fcntl
+
+
+@contextmanager
+def _file_lock(lock_path: str) -> Iterator[None]:
+    """잠금 파일을 잡은 동안만 실행 (다른 프로세스가 잡고 있으면 놓을 때까지 대기)"""
+    with open(lock_path, "a+b") as lock_file:
+        if sys.platform == "win32":
+            lock_file.seek(0)
+            msvcrt.locking(lock_file.fileno(), msvcrt.LK_LOCK, 1)
+        else:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if sys.platform == "win32":
+                lock_file.seek(0)
+                msvcrt.locking(lock_file.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+class ImageStore:
+    """내용 해시(SHA-256)를 키로 이미지를 저장하는 이미지 저장소
+
+    같은 이미지는 여러 의약품이나 여러 문서에서 참조되더라도 한 번만 기록합니다.
+    저장된 이미지 목록(저장소 경로별 해시와 크기)은 ``index.json``에 보관되어 다음
+    실행에서도 이미 저장된 이미지는 다시 쓰지 않습니다. 같은 내용이라도 확장자가
+    다르면 다른 파일로 저장합니다.
+
+    저장 경로: ``<root_dir>/<해시 앞 2자리>/<해시><확장자>``
+    """
+
+    INDEX_FILE = "index.json"
+    LOCK_FILE = "index.json.lock"
+
+    def __init__(self, root_dir: str):
+        """초기화
+
+        Args:
+            root_dir: 이미지 저장소 디렉토리
+        """
+        self.root_dir = root_dir
+        self.index_path = os.path.join(root_dir, self.INDEX_FILE)
+        self._index: Dict[str, Dict[str, Any]] = self._load_index()
+        # 이번 실행에서 디스크에 있음을 확인한 저장소 경로
+        self._verified: Set[str] = set()
+        self._dirty = False
+
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """저장된 이미지 목록을 불러옵니다."""
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index: Dict[str, Dict[str, Any]] = json.load(f)
+            # 해시를 키로 경로를 담던 이전 형식의 항목은 저장소 경로를 키로 바꿈
+            return {
+                entry.get("path", key): {
+                    "hash": entry.get("hash", key),
+                    "size": entry.get("size"),
+                }
+                for key, entry in index.items()
+            }
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(
+                f"이미지 저장소 색인을 읽을 수 없습니다: {self.index_path} - {e}"
+            )
+            return {}
+
+    def relpath(self, digest: str, extension: str) -> str:
+        """해시에 해당하는 저장소 내부 상대 경로를 반환합니다.
+
+        Args:
+            digest: 이미지 SHA-256 해시
+            extension: 확장자 (예: ".png")
+
+        Returns:
+            str: 저장소 디렉토리 기준 상대 경로
+        """
+        return f"{digest[:2]}/{digest}{extension}"
+
+    def entry(self, data: bytes, extension: str) -> Dict[str, Any]:
+        """이미지를 저장하지 않고 저장할 때의 항목만 만듭니다.
+
+        Args:
+            data: 이미지 데이터
+            extension: 확장자 (예: ".png")
+
+        Returns:
+            Dict[str, Any]: hash, path(저장소 기준 상대 경로), size를 담은 항목
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        return {
+            "hash": digest,
+            "path": self.relpath(digest, extension),
+            "size": len(data),
+        }
+
+    def put(
+        self, data: bytes, extension: str, writer: Optional[AsyncWriter] = None
+    ) -> Dict[str, Any]:
+        """이미지를 저장합니다. 이미 저장된 이미지면 쓰지 않습니다.
+
+        Args:
+            data: 이미지 데이터
+            extension: 확장자 (예: ".png")
+            writer: 파일 쓰기를 맡길 백그라운드 쓰기 단계 (None이면 바로 저장)
+
+        Returns:
+            Dict[str, Any]: hash, path(저장소 기준 상대 경로), size를 담은 항목
+        """
+        entry = self.entry(data, extension)
+        relpath = entry["path"]
+
+        # 같은 내용이라도 확장자가 다르면 경로가 다르므로 경로 기준으로 확인
+        if relpath not in self._verified:
+            target_path = os.path.join(self.root_dir, relpath)
+            if relpath in self._index and os.path.exists(target_path):
+                logger.debug(f"이미 저장된 이미지: {relpath}")
+            else:
+                if writer is not None:
+                    writer.submit(self._write, target_path, data)
+                else:
+                    self._write(target_path, data)
+                self._index[relpath] = {"hash": entry["hash"], "size": len(data)}
+                self._dirty = True
+                logger.debug(f"이미지 저장 완료: {target_path}")
+            self._verified.add(relpath)
+
+        return entry
+
+    def _write(self, target_path: str, data: bytes) -> None:
+        """임시 파일에 쓴 뒤 이름을 바꿔 중간 상태의 파일이 보이지 않도록 저장"""
+        target_dir = os.path.dirname(target_path)
+        os.makedirs(target_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=target_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as out_f:
+                out_f.write(data)
+            os.replace(tmp_path, target_path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def save(self) -> None:
+        """이미지 목록을 index.json에 기록합니다.
+
+        배치 작업자처럼 다른 프로세스가 같은 저장소를 쓰는 경우를 위해 잠금 파일을
+        잡은 채 디스크의 목록을 다시 읽어 합친 뒤 기록하므로, 동시에 저장해도 다른
+        프로세스가 기록한 항목이 사라지지 않습니다.
+        """
+        if not self._dirty:
+            return
+
+        os.makedirs(self.root_dir, exist_ok=True)
+        with _file_lock(os.path.join(self.root_dir, self.LOCK_FILE)):
+            index = self._load_index()
+            index.update(self._index)
+            self._index = index
+
+            fd, tmp_path = tempfile.mkstemp(dir=self.root_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(index, f, ensure_ascii=False, indent=2, sort_keys=True)
+                os.replace(tmp_path, self.index_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+        self._dirty = False
+        logger.info(f"이미지 저장소 색인 저장: {self.index_path} ({len(index)}개)")
@@ -0,0 +1,200 @@
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from typing import Any, Dict, List, Mapping, Optional, Set
+from xml.etree import ElementTree
+
+from kp_parser.utils.image_source import ImageSource
+from kp_parser.utils.logger import logger
+from kp_parser.utils.output_utils import drug_folder_name
+from kp_parser.utils.xml_backend import XmlBackend, get_xml_backend
+
+
+class IncrementalManifest:
+    """의약품별 지문(fingerprint)으로 변경된 의약품만 다시 빌드하는 증분 파싱 목록
+
+    의약품 지문은 해당 의약품 문단의 원본 XML, 메타데이터, 문단이 참조하는
+    스타일 정보와 이미지 내용 해시, 파서 설정을 합쳐 계산합니다. 지문이 이전
+    실행과 같고 결과 폴더가 남아 있는 의약품은 빌드와 저장을 건너뛰고, 이번
+    실행에서 나타나지 않은 의약품의 결과 폴더는 삭제합니다.
+
+    목록 파일: ``<output_dir>/manifest.json`` (폴더명별 지문과 메타데이터)
+    """
+
+    MANIFEST_FILE = "manifest.json"
+
+    def __init__(
+        self,
+        output_dir: str,
+        style_info: Mapping[str, Any],
+        image_info: Dict[str, Any],
+        image_source: ImageSource,
+        settings: Optional[Dict[str, Any]] = None,
+        backend: Optional[XmlBackend] = None,
+    ):
+        """초기화
+
+        Args:
+            output_dir: 의약품별 결과 폴더가 저장되는 출력 디렉토리
+            style_info: header.xml에서 추출한 스타일 정보
+            image_info: content.hpf에서 추출한 이미지 id별 이미지 정보
+            image_source: 이미지 내용 해시 계산에 사용할 이미지 소스
+            settings: 결과에 영향을 주는 파서 설정 (바뀌면 모든 의약품을 다시 빌드)
+            backend: 문단 직렬화에 사용할 XML 백엔드 (문단을 만든 백엔드, None이면 기본값)
+        """
+        self.output_dir = output_dir
+        self.manifest_path = os.path.join(output_dir, self.MANIFEST_FILE)
+        self.style_info = style_info
+        self.image_info = image_info
+        self.image_source = image_source
+        self.backend = backend or get_xml_backend()
+        self._settings = json.dumps(
+            settings or {}, ensure_ascii=False, sort_keys=True
+        ).encode("utf-8")
+        self._previous: Dict[str, Dict[str, Any]] = self._load()
+        self._current: Dict[str, Dict[str, Any]] = {}
+        # 이미지 id별 내용 해시 (같은 이미지를 여러 번 읽지 않도록)
+        self._image_hashes: Dict[str, str] = {}
+        self.rebuilt = 0
+        self.skipped = 0
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """이전 실행의 목록을 불러옵니다."""
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                drugs: Dict[str, Dict[str, Any]] = json.load(f).get("drugs", {})
+                return drugs
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError, AttributeError) as e:
+            logger.warning(
+                f"증분 파싱 목록을 읽을 수 없습니다: {self.manifest_path} - {e}"
+            )
+            return {}
+
+    def _image_hash(self, img_id: str) -> str:
+        """이미지 id에 해당하는 이미지 내용 해시를 반환 (없으면 빈 문자열)"""
+        if img_id not in self._image_hashes:
+            digest = ""
+            href = self.image_info.get(img_id, {}).get("path")
+            if href:
+                data = self.image_source.read(href)
+                if data is not None:
+                    digest = hashlib.sha256(data).hexdigest()
+            self._image_hashes[img_id] = digest
+        return self._image_hashes[img_id]
+
+    def fingerprint(
+        self, metadata: Dict[str, Any], paragraphs: List[ElementTree.Element]
+    ) -> str:
+        """의약품 지문을 계산합니다.
+
+        Args:
+            metadata: 의약품 메타데이터 (chapter, section, title, subtitle, order)
+            paragraphs: 의약품의 일반 문단 목록
+
+        Returns:
+            str: SHA-256 지문
+        """
+        digest = hashlib.sha256(self._settings)
+        digest.update(
+            json.dumps(metadata, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        )
+
+        char_pr_ids: Set[str] = set()
+        img_ids: Set[str] = set()
+        for p in paragraphs:
+            digest.update(self.backend.tostring(p))
+            for elem in p.iter():
+                char_pr_id = elem.get("charPrIDRef")
+                if char_pr_id:
+                    char_pr_ids.add(char_pr_id)
+                img_id = elem.get("binaryItemIDRef")
+                if img_id:
+                    img_ids.add(img_id)
+
+        # 문단이 참조하는 스타일과 이미지 내용만 지문에 포함
+        styles = {
+            char_pr_id: self.style_info.get(f"charPr-{char_pr_id}")
+            for char_pr_id in char_pr_ids
+        }
+        digest.update(
+            json.dumps(styles, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        )
+        for img_id in sorted(img_ids):
+            digest.update(f"{img_id}:{self._image_hash(img_id)}".encode("utf-8"))
+
+        return digest.hexdigest()
+
+    def drug_filter(
+        self, metadata: Dict[str, Any], paragraphs: List[ElementTree.Element]
+    ) -> bool:
+        """의약품을 다시 빌드해야 하는지 반환 (``SectionXmlParser.iter_sections``의 drug_filter)
+
+        Args:
+            metadata: 의약품 메타데이터
+            paragraphs: 의약품의 일반 문단 목록
+
+        Returns:
+            bool: 지문이 바뀌었거나 결과 폴더가 없으면 True (남아 있던 결과 폴더는 삭제)
+        """
+        folder_name = drug_folder_name(metadata.get("title"))
+        fingerprint = self.fingerprint(metadata, paragraphs)
+
+        # 이번 실행에서 같은 폴더를 이미 썼다면 (같은 이름의 의약품) 항상 다시 저장
+        seen = folder_name in self._current
+        self._current[folder_name] = {"fingerprint": fingerprint, **metadata}
+
+        previous = self._previous.get(folder_name)
+        if (
+            not seen
+            and previous is not None
+            and previous.get("fingerprint") == fingerprint
+            and os.path.exists(os.path.join(self.output_dir, folder_name, "data.json"))
+        ):
+            self.skipped += 1
+            return False
+
+        # 이전 실행의 이미지가 남지 않도록 결과 폴더를 비운 뒤 다시 저장
+        if not seen:
+            folder_path = os.path.join(self.output_dir, folder_name)
+            if os.path.isdir(folder_path):
+                shutil.rmtree(folder_path)
+
+        self.rebuilt += 1
+        return True
+
+    def remove_stale(self) -> List[str]:
+        """이전 실행에는 있었지만 이번 실행에서 사라진 의약품의 결과 폴더를 삭제합니다.
+
+        Returns:
+            List[str]: 삭제한 폴더명 목록
+        """
+        removed = []
+        for folder_name in sorted(set(self._previous) - set(self._current)):
+            folder_path = os.path.join(self.output_dir, folder_name)
+            if os.path.isdir(folder_path):
+                shutil.rmtree(folder_path)
+                logger.info(f"사라진 의약품 결과 삭제: {folder_path}")
+            removed.append(folder_name)
+        return removed
+
+    def save(self) -> None:
+        """이번 실행의 목록을 manifest.json에 기록합니다."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.output_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(
+                {"drugs": self._current},
+                f,
+                ensure_ascii=False,
+                indent=2,
+                sort_keys=True,
+            )
+        os.replace(tmp_path, self.manifest_path)
+        logger.info(
+            f"증분 파싱 목록 저장: {self.manifest_path} "
+            f"(다시 빌드 {self.rebuilt}개, 변경 없음 {self.skipped}개)"
+        )
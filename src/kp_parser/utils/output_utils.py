@@ -0,0 +1,325 @@
+"""
+파싱 결과 저장 유틸리티
+"""
+
+import os
+import re
+import sqlite3
+import tempfile
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+
+from kp_parser.utils.async_writer import AsyncWriter
+from kp_parser.utils.profiler import count, timed
+from kp_parser.utils.serializer import JsonSerializer
+
+
+def sanitize_filename(name: str) -> str:
+    """윈도우나 리눅스에서 파일/폴더 이름에 쓸 수 없는 문자 제거 및 기호 주변 공백 제거"""
+    # 먼저 파일명에 사용할 수 없는 문자를 언더스코어로 변경
+    name = re.sub(r'[\\/*?:"<>|]', "_", name)
+    # 문자 사이의 하이픈과 가운뎃점 주변 공백 제거 (기호는 유지)
+    name = re.sub(r"(\S)\s*([-·])\s*(\S)", r"\1\2\3", name)
+    return name.strip()
+
+
+def drug_folder_name(title: Optional[str]) -> str:
+    """의약품 결과와 이미지를 저장할 폴더 이름 (제목이 없으면 "untitled")"""
+    return sanitize_filename(title or "untitled")
+
+
+# 출력 형식
+OUTPUT_FORMAT_FOLDER = "folder"  # 의약품별 폴더에 metadata.json, data.json 저장
+OUTPUT_FORMAT_JSONL = "jsonl"  # 의약품 하나를 한 줄로 담은 JSON Lines 파일 하나
+OUTPUT_FORMAT_SQLITE = "sqlite"  # drugs 테이블을 담은 SQLite 데이터베이스 하나
+OUTPUT_FORMATS = (OUTPUT_FORMAT_FOLDER, OUTPUT_FORMAT_JSONL, OUTPUT_FORMAT_SQLITE)
+
+# 단일 파일 출력 형식의 파일 이름
+JSONL_FILE = "drugs.jsonl"
+SQLITE_FILE = "drugs.sqlite"
+
+
+def _metadata(item: Dict[str, Any]) -> Dict[str, Any]:
+    """의약품 레코드에서 메타데이터만 추출"""
+    return {
+        "chapter": item.get("chapter"),
+        "section": item.get("section"),
+        "title": item.get("title"),
+        "subtitle": item.get("subtitle"),
+        "order": item.get("order"),
+    }
+
+
+def _remove_if_empty(path: str) -> None:
+    """실패한 문서의 빈 출력 디렉토리가 남지 않도록 제거"""
+    try:
+        os.rmdir(path)
+    except OSError:
+        pass
+
+
+class OutputSink(ABC):
+    """의약품 레코드를 받아 저장하는 출력 대상
+
+    ``with`` 문으로 사용하면 정상 종료 시 ``close``로 저장을 마무리하고, 예외가
+    발생하면 ``abort``로 쓰던 내용을 버립니다.
+    """
+
+    def __init__(self, output_dir: str, serializer: Optional[JsonSerializer] = None):
+        """초기화
+
+        Args:
+            output_dir: 출력 디렉토리
+            serializer: JSON 직렬화 도구 (None이면 압축 형식)
+        """
+        self.output_dir = output_dir
+        self.serializer = serializer or JsonSerializer()
+        self.count = 0
+        # 모든 의약품이 함께 쓰는 내용 래퍼 (children만 의약품마다 바꿔 끼움)
+        self._root: Dict[str, Any] = {
+            "direction": "ltr",
+            "format": "",
+            "indent": 0,
+            "type": "root",
+            "version": 1,
+            "children": [],
+        }
+        self._content = {"root": self._root}
+
+    def content(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """의약품 내용을 root 래퍼로 감싸 반환 (다음 의약품을 쓰기 전까지만 유효)"""
+        self._root["children"] = item.get("content", [])
+        return self._content
+
+    @abstractmethod
+    def write(self, item: Dict[str, Any]) -> None:
+        """의약품 레코드 하나를 저장합니다."""
+
+    def close(self) -> None:
+        """저장을 마무리합니다."""
+
+    def abort(self) -> None:
+        """오류로 중단된 경우 쓰던 내용을 정리합니다."""
+
+    def __enter__(self) -> "OutputSink":
+        return self
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+class FolderSink(OutputSink):
+    """의약품별 폴더에 metadata.json, data.json(, images.json)을 저장"""
+
+    def write(self, item: Dict[str, Any]) -> None:
+        # 의약품명으로 폴더명 생성
+        folder_name = drug_folder_name(item.get("title"))
+        folder_path = os.path.join(self.output_dir, folder_name)
+        os.makedirs(folder_path, exist_ok=True)
+
+        # 메타데이터 저장
+        self.serializer.dump(
+            _metadata(item), os.path.join(folder_path, "metadata.json")
+        )
+
+        # 내용 저장
+        self.serializer.dump(self.content(item), os.path.join(folder_path, "data.json"))
+
+        # 이미지 저장소를 사용한 경우 참조한 이미지 목록 저장
+        if "images" in item:
+            self.serializer.dump(
+                item["images"], os.path.join(folder_path, "images.json")
+            )
+
+        self.count += 1
+
+
+class JsonlSink(OutputSink):
+    """모든 의약품을 ``<output_dir>/drugs.jsonl`` 한 파일에 한 줄씩 저장
+
+    각 줄은 메타데이터 필드와 data(data.json과 같은 내용), 이미지 저장소를 사용한
+    경우 images를 담습니다. 임시 파일에 쓴 뒤 정상 종료 시 이름을 바꾸므로, 중간에
+    실패하면 이전 파일이 그대로 남습니다.
+    """
+
+    def __init__(self, output_dir: str, serializer: Optional[JsonSerializer] = None):
+        # 한 줄에 하나씩 담아야 하므로 들여쓰기 옵션은 무시하고 압축 형식으로 저장
+        if serializer is not None and serializer.pretty:
+            serializer = JsonSerializer(use_orjson=serializer.use_orjson)
+        super().__init__(output_dir, serializer)
+        os.makedirs(output_dir, exist_ok=True)
+        self.path = os.path.join(output_dir, JSONL_FILE)
+        fd, self._tmp_path = tempfile.mkstemp(dir=output_dir, suffix=".tmp")
+        self._file = os.fdopen(fd, "wb")
+
+    def write(self, item: Dict[str, Any]) -> None:
+        record = _metadata(item)
+        record["data"] = self.content(item)
+        if "images" in item:
+            record["images"] = item["images"]
+        data = self.serializer.dumps(record)
+        self._file.write(data)
+        self._file.write(b"\n")
+        count("bytes_written", len(data) + 1)
+        self.count += 1
+
+    def close(self) -> None:
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        self._file.close()
+        os.remove(self._tmp_path)
+        _remove_if_empty(self.output_dir)
+
+
+class SqliteSink(OutputSink):
+    """모든 의약품을 ``<output_dir>/drugs.sqlite``의 drugs 테이블에 저장
+
+    content 열에는 data.json과 같은 내용을, images 열에는 이미지 저장소를 사용한
+    경우 참조한 이미지 목록을 JSON 바이트로 저장합니다. (section, title, order)
+    인덱스로 조회할 수 있습니다. 임시 파일에 쓴 뒤 정상 종료 시 이름을 바꿉니다.
+    """
+
+    SCHEMA = (
+        "CREATE TABLE drugs ("
+        "id INTEGER PRIMARY KEY, "
+        "chapter TEXT, "
+        "section TEXT, "
+        "title TEXT, "
+        "subtitle TEXT, "
+        '"order" INTEGER, '
+        "content BLOB NOT NULL, "
+        "images BLOB)",
+        'CREATE INDEX drugs_section_title_order ON drugs (section, title, "order")',
+    )
+    # 한 번에 넣을 행 수
+    BATCH_SIZE = 500
+
+    def __init__(self, output_dir: str, serializer: Optional[JsonSerializer] = None):
+        super().__init__(output_dir, serializer)
+        os.makedirs(output_dir, exist_ok=True)
+        self.path = os.path.join(output_dir, SQLITE_FILE)
+        fd, self._tmp_path = tempfile.mkstemp(dir=output_dir, suffix=".tmp")
+        os.close(fd)
+        # 백그라운드 쓰기 단계의 스레드에서 기록할 수 있도록 함 (한 번에 한 스레드만 사용)
+        self._conn = sqlite3.connect(self._tmp_path, check_same_thread=False)
+        # 임시 파일이므로 저널 없이 쓰고, 완성된 뒤 이름을 바꿈
+        self._conn.execute("PRAGMA journal_mode = OFF")
+        self._conn.execute("PRAGMA synchronous = OFF")
+        for statement in self.SCHEMA:
+            self._conn.execute(statement)
+        self._rows: List[Tuple[Any, ...]] = []
+
+    def write(self, item: Dict[str, Any]) -> None:
+        images = item.get("images")
+        content = self.serializer.dumps(self.content(item))
+        images_data = self.serializer.dumps(images) if images is not None else None
+        self._rows.append(
+            (
+                item.get("chapter"),
+                item.get("section"),
+                item.get("title"),
+                item.get("subtitle"),
+                item.get("order"),
+                content,
+                images_data,
+            )
+        )
+        count("bytes_written", len(content) + len(images_data or b""))
+        self.count += 1
+        if len(self._rows) >= self.BATCH_SIZE:
+            self._flush()
+
+    def _flush(self) -> None:
+        self._conn.executemany(
+            "INSERT INTO drugs "
+            '(chapter, section, title, subtitle, "order", content, images) '
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            self._rows,
+        )
+        self._rows = []
+
+    def close(self) -> None:
+        self._flush()
+        self._conn.commit()
+        self._conn.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        self._conn.close()
+        os.remove(self._tmp_path)
+        _remove_if_empty(self.output_dir)
+
+
+# 출력 형식별 출력 대상
+_SINKS: Dict[str, Type[OutputSink]] = {
+    OUTPUT_FORMAT_FOLDER: FolderSink,
+    OUTPUT_FORMAT_JSONL: JsonlSink,
+    OUTPUT_FORMAT_SQLITE: SqliteSink,
+}
+
+
+def open_sink(
+    output_format: str,
+    output_dir: str,
+    serializer: Optional[JsonSerializer] = None,
+) -> OutputSink:
+    """출력 형식에 해당하는 출력 대상을 엽니다.
+
+    Args:
+        output_format: 출력 형식 ("folder", "jsonl", "sqlite")
+        output_dir: 출력 디렉토리
+        serializer: JSON 직렬화 도구 (None이면 압축 형식)
+
+    Returns:
+        OutputSink: 출력 대상
+
+    Raises:
+        ValueError: 지원하지 않는 출력 형식인 경우
+    """
+    if output_format not in _SINKS:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {output_format}")
+    return _SINKS[output_format](output_dir, serializer)
+
+
+def save_parsed_data(
+    output_dir: str,
+    parsed_data: Iterable[Dict[str, Any]],
+    serializer: Optional[JsonSerializer] = None,
+    output_format: str = OUTPUT_FORMAT_FOLDER,
+    writer: Optional[AsyncWriter] = None,
+) -> int:
+    """파싱된 데이터를 출력 형식에 맞게 저장 (기본값: 각 의약품별 폴더)
+
+    제너레이터가 주어지면 의약품이 파싱되는 대로 바로 저장합니다. writer가 주어지면
+    저장은 백그라운드 스레드에서 진행되어 다음 의약품의 파싱과 겹쳐 실행됩니다.
+
+    Args:
+        output_dir (str): 출력 디렉토리
+        parsed_data (Iterable[Dict[str, Any]]): 파싱된 데이터
+        serializer (Optional[JsonSerializer]): JSON 직렬화 도구 (None이면 압축 형식)
+        output_format (str): 출력 형식 ("folder", "jsonl", "sqlite")
+        writer (Optional[AsyncWriter]): 저장을 맡길 백그라운드 쓰기 단계 (None이면 바로 저장)
+
+    Returns:
+        int: 저장한 의약품 수
+    """
+    with open_sink(output_format, output_dir, serializer) as sink:
+        # 측정 중이면 의약품 하나를 저장하는 시간을 기록
+        write = timed("save_parsed_data", sink.write)
+        if writer is None:
+            for item in parsed_data:
+                write(item)
+        else:
+            try:
+                for item in parsed_data:
+                    writer.submit(write, item)
+            finally:
+                # 출력 대상을 닫거나 버리기 전에 남은 쓰기를 마침
+                writer.wait()
+            writer.flush()
+    return sink.count
@@ -0,0 +1,225 @@
+"""
+문서 파싱 결과 캐시
+
+입력 .hwpx 파일 내용 해시, 파싱 규칙 해시, 패키지 버전과 파서 설정으로 만든 키별로
+header.xml 스타일 정보, content.hpf 이미지 정보, 의약품 레코드를 디스크에 저장합니다.
+바뀌지 않은 문서를 다시 파싱할 때는 XML을 파싱하지 않고 저장된 레코드를 그대로
+사용합니다.
+
+캐시 항목: ``<cache_dir>/<키>.jsonl``
+    첫 줄은 ``{"style_info": ..., "image_info": ...}``, 이후 한 줄에 의약품 레코드 하나
+
+캐시 디렉토리 전체 크기가 상한을 넘으면 가장 오래 사용하지 않은 항목부터 삭제합니다
+(LRU, 파일 수정 시각을 마지막 사용 시각으로 사용).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+from kp_parser.utils.logger import logger
+from kp_parser.utils.serializer import JsonSerializer
+
+# 파일 해시 계산 시 한 번에 읽을 크기
+_READ_CHUNK = 1024 * 1024
+
+
+def file_sha256(path: str) -> str:
+    """파일 내용의 SHA-256 해시를 반환합니다."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(_READ_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class CacheEntryWriter:
+    """캐시 항목 하나를 임시 파일에 기록하고, ``commit`` 시 캐시에 추가
+
+    ``set_document_info``로 스타일 정보와 이미지 정보를 먼저 기록한 뒤 의약품
+    레코드를 ``add``로 하나씩 기록합니다.
+    """
+
+    def __init__(self, cache: "ParseCache", key: str):
+        self._cache = cache
+        self._serializer = cache.serializer
+        self.path = cache.entry_path(key)
+        os.makedirs(cache.cache_dir, exist_ok=True)
+        fd, self._tmp_path = tempfile.mkstemp(dir=cache.cache_dir, suffix=".tmp")
+        self._file = os.fdopen(fd, "wb")
+        self._has_info = False
+
+    def _write(self, obj: Any) -> None:
+        self._file.write(self._serializer.dumps(obj))
+        self._file.write(b"\n")
+
+    def set_document_info(
+        self, style_info: Mapping[str, Any], image_info: Dict[str, Any]
+    ) -> None:
+        """문서의 스타일 정보와 이미지 정보를 기록합니다. (레코드보다 먼저 한 번만)"""
+        if self._has_info:
+            raise ValueError("문서 정보는 한 번만 기록할 수 있습니다.")
+        self._write({"style_info": dict(style_info), "image_info": image_info})
+        self._has_info = True
+
+    def add(self, record: Dict[str, Any]) -> None:
+        """의약품 레코드 하나를 기록합니다."""
+        if not self._has_info:
+            raise ValueError("의약품 레코드보다 문서 정보를 먼저 기록해야 합니다.")
+        self._write(record)
+
+    def commit(self) -> None:
+        """기록을 마치고 캐시에 추가한 뒤 크기 상한에 맞게 오래된 항목을 삭제합니다."""
+        if not self._has_info:
+            # 파싱할 section이 없던 문서
+            self.set_document_info({}, {})
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+        logger.info(f"파싱 결과 캐시 저장: {self.path}")
+        self._cache.evict()
+
+    def discard(self) -> None:
+        """기록하던 내용을 버립니다. (파싱이 중간에 실패한 경우)"""
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+
+class ParseCache:
+    """문서별 파싱 결과를 저장하는 디스크 캐시 (크기 상한, LRU 삭제)"""
+
+    ENTRY_SUFFIX = ".jsonl"
+
+    def __init__(self, cache_dir: str, max_bytes: int = 1024 * 1024 * 1024):
+        """초기화
+
+        Args:
+            cache_dir: 캐시 디렉토리
+            max_bytes: 캐시 디렉토리 전체 크기 상한 (바이트)
+
+        Raises:
+            ValueError: max_bytes가 0 이하인 경우
+        """
+        if max_bytes <= 0:
+            raise ValueError(f"캐시 크기 상한은 0보다 커야 합니다: {max_bytes}")
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.serializer = JsonSerializer()
+
+    def key(self, hwpx_path: str, rules_digest: str, settings: Dict[str, Any]) -> str:
+        """캐시 키를 계산합니다.
+
+        Args:
+            hwpx_path: .hwpx 파일 경로 (내용 해시 계산)
+            rules_digest: 파싱 규칙 해시
+            settings: 결과에 영향을 주는 파서 설정 (패키지 버전 포함)
+
+        Returns:
+            str: SHA-256 캐시 키
+        """
+        digest = hashlib.sha256(file_sha256(hwpx_path).encode("ascii"))
+        digest.update(rules_digest.encode("ascii"))
+        digest.update(
+            json.dumps(settings, ensure_ascii=False, sort_keys=True).encode("utf-8")
+        )
+        return digest.hexdigest()
+
+    def entry_path(self, key: str) -> str:
+        """캐시 키에 해당하는 항목 파일 경로"""
+        return os.path.join(self.cache_dir, f"{key}{self.ENTRY_SUFFIX}")
+
+    def load(
+        self, key: str
+    ) -> Optional[Tuple[Dict[str, Any], Dict[str, Any], Iterator[Dict[str, Any]]]]:
+        """캐시 항목을 엽니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            Optional[Tuple[Dict[str, Any], Dict[str, Any], Iterator[Dict[str, Any]]]]:
+                (스타일 정보, 이미지 정보, 의약품 레코드 이터레이터). 항목이 없거나
+                읽을 수 없으면 None
+        """
+        path = self.entry_path(key)
+        try:
+            f = open(path, "rb")
+        except FileNotFoundError:
+            return None
+
+        try:
+            header = self.serializer.loads(f.readline())
+            style_info = header["style_info"]
+            image_info = header["image_info"]
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            f.close()
+            logger.warning(f"파싱 결과 캐시를 읽을 수 없어 삭제합니다: {path} - {e}")
+            self._remove(path)
+            return None
+
+        # 마지막 사용 시각 갱신 (LRU)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        logger.info(f"파싱 결과 캐시 사용: {path}")
+        return style_info, image_info, self._iter_records(f)
+
+    def _iter_records(self, f: Any) -> Iterator[Dict[str, Any]]:
+        """항목 파일의 의약품 레코드를 한 줄씩 읽어 생성"""
+        with f:
+            for line in f:
+                yield self.serializer.loads(line)
+
+    def open_entry(self, key: str) -> CacheEntryWriter:
+        """새 캐시 항목 기록을 시작합니다.
+
+        Args:
+            key: 캐시 키
+
+        Returns:
+            CacheEntryWriter: 문서 정보와 의약품 레코드를 기록할 항목
+        """
+        return CacheEntryWriter(self, key)
+
+    def _remove(self, path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def evict(self) -> List[str]:
+        """캐시 전체 크기가 상한 이하가 되도록 가장 오래 사용하지 않은 항목부터 삭제합니다.
+
+        Returns:
+            List[str]: 삭제한 항목 파일 경로 목록
+        """
+        entries = []
+        try:
+            names = os.listdir(self.cache_dir)
+        except FileNotFoundError:
+            return []
+        for name in names:
+            if not name.endswith(self.ENTRY_SUFFIX):
+                continue
+            path = os.path.join(self.cache_dir, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # 다른 프로세스가 먼저 삭제한 경우
+                continue
+            entries.append((stat.st_mtime_ns, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = []
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+            removed.append(path)
+        if removed:
+            logger.info(f"파싱 결과 캐시 정리: {len(removed)}개 항목 삭제")
+        return removed
@@ -0,0 +1,309 @@
+"""
+단계별 성능 측정
+
+문서 하나를 처리하는 동안 단계별 시간(압축 해제, header/content.hpf 파싱, 이미지
+처리, 결과 저장 등), 계수(문단, run, 이미지, 읽고 쓴 바이트 수), 의약품별 파싱
+시간을 모아 보고서로 만듭니다. 필요하면 cProfile 함수별 통계와 tracemalloc 메모리
+할당 위치도 함께 기록합니다.
+
+측정 지점은 모듈 함수(``timer``, ``count``, ``timed``)와 데코레이터(``profiled``)로
+기록하며, ``profiling``으로 측정을 시작하지 않은 동안에는 활성 측정기 확인 한 번으로
+끝나므로 파싱 속도에 거의 영향을 주지 않습니다. 측정기는 프로세스마다 하나이므로 작업자 프로세스에서 처리한
+section이나 문단의 시간과 계수는 포함되지 않습니다.
+"""
+
+import cProfile
+import functools
+import io
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from typing import (
+    Any,
+    Callable,
+    ContextManager,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+# 측정하지 않을 때 사용하는 빈 문맥 관리자
+_NULL_TIMER = nullcontext()
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class Profiler:
+    """단계별 시간과 계수, 의약품별 파싱 시간을 모으는 측정기"""
+
+    def __init__(self, cprofile: bool = False, memory: bool = False, top: int = 20):
+        """초기화
+
+        Args:
+            cprofile: True면 cProfile로 함수별 통계를 함께 수집
+            memory: True면 tracemalloc으로 메모리 할당 위치를 함께 수집
+            top: 보고서에 남길 가장 느린 의약품, 함수, 할당 위치 수
+        """
+        self.cprofile = cprofile
+        self.memory = memory
+        self.top = top
+        # 단계별 [호출 수, 전체 시간, 최대 시간]
+        self.stages: Dict[str, List[float]] = {}
+        self.counters: Dict[str, int] = {}
+        # 의약품별 (파싱 시간, 제목, order)
+        self.drugs: List[Any] = []
+        self.elapsed = 0.0
+        self._start_time = 0.0
+        # 백그라운드 쓰기 스레드에서도 기록하므로 잠금 사용
+        self._lock = threading.Lock()
+        self._profile: Optional[cProfile.Profile] = None
+        self._memory_report: Optional[Dict[str, Any]] = None
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """단계의 실행 시간을 기록합니다."""
+        with self._lock:
+            stage = self.stages.get(name)
+            if stage is None:
+                self.stages[name] = [1, seconds, seconds]
+            else:
+                stage[0] += 1
+                stage[1] += seconds
+                if seconds > stage[2]:
+                    stage[2] = seconds
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """``with`` 블록의 실행 시간을 단계 시간으로 기록합니다."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - start)
+
+    def count(self, name: str, value: int = 1) -> None:
+        """계수를 더합니다."""
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def add_drug(self, title: Optional[str], order: Any, seconds: float) -> None:
+        """의약품 하나의 파싱 시간을 기록합니다."""
+        self.drugs.append((seconds, title, order))
+
+    def start(self) -> None:
+        """측정을 시작합니다. (cProfile, tracemalloc 포함)"""
+        self._start_time = time.perf_counter()
+        if self.memory:
+            tracemalloc.start()
+        if self.cprofile:
+            self._profile = cProfile.Profile()
+            self._profile.enable()
+
+    def stop(self) -> None:
+        """측정을 마칩니다."""
+        if self._profile is not None:
+            self._profile.disable()
+        if self.memory and tracemalloc.is_tracing():
+            snapshot = tracemalloc.take_snapshot()
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            self._memory_report = {
+                "current_bytes": current,
+                "peak_bytes": peak,
+                "top": [
+                    {
+                        "location": str(stat.traceback),
+                        "size": stat.size,
+                        "count": stat.count,
+                    }
+                    for stat in snapshot.statistics("lineno")[: self.top]
+                ],
+            }
+        self.elapsed = time.perf_counter() - self._start_time
+
+    def dump_stats(self, path: str) -> None:
+        """cProfile 통계를 pstats 파일로 저장합니다. (snakeviz 등으로 확인)"""
+        if self._profile is not None:
+            self._profile.dump_stats(path)
+
+    def _cprofile_report(self) -> List[Dict[str, Any]]:
+        """누적 시간 기준 상위 함수 목록"""
+        stats = pstats.Stats(self._profile, stream=io.StringIO())
+        rows = []
+        for (filename, line, function), (
+            _,
+            calls,
+            total,
+            cumulative,
+            _,
+        ) in stats.stats.items():  # type: ignore[attr-defined]
+            rows.append(
+                {
+                    "function": f"{filename}:{line}({function})",
+                    "calls": calls,
+                    "total": round(total, 6),
+                    "cumulative": round(cumulative, 6),
+                }
+            )
+        rows.sort(key=lambda row: row["cumulative"], reverse=True)
+        return rows[: self.top]
+
+    def report(self) -> Dict[str, Any]:
+        """측정 결과를 JSON으로 저장할 수 있는 딕셔너리로 반환합니다.
+
+        Returns:
+            Dict[str, Any]: elapsed(전체 시간), stages(단계별 호출 수, 전체/최대 시간, 전체
+                시간 순), counters, drugs(의약품 수, 파싱 시간 합계, 가장 느린 의약품),
+                cprofile(상위 함수), memory(최대/현재 할당량, 상위 할당 위치)
+        """
+        slowest = sorted(self.drugs, key=lambda drug: drug[0], reverse=True)
+        report: Dict[str, Any] = {
+            "elapsed": round(self.elapsed, 6),
+            "stages": {
+                name: {"calls": calls, "total": round(total, 6), "max": round(peak, 6)}
+                for name, (calls, total, peak) in sorted(
+                    self.stages.items(), key=lambda item: item[1][1], reverse=True
+                )
+            },
+            "counters": dict(sorted(self.counters.items())),
+            "drugs": {
+                "count": len(self.drugs),
+                "total": round(sum(drug[0] for drug in self.drugs), 6),
+                "slowest": [
+                    {"title": title, "order": order, "seconds": round(seconds, 6)}
+                    for seconds, title, order in slowest[: self.top]
+                ],
+            },
+        }
+        if self._profile is not None:
+            report["cprofile"] = self._cprofile_report()
+        if self._memory_report is not None:
+            report["memory"] = self._memory_report
+        return report
+
+
+# 현재 프로세스에서 측정 중인 측정기 (측정하지 않으면 None)
+_active: Optional[Profiler] = None
+
+
+def active_profiler() -> Optional[Profiler]:
+    """측정 중인 측정기 (측정하지 않으면 None)"""
+    return _active
+
+
+@contextmanager
+def profiling(profiler: Optional[Profiler]) -> Iterator[Optional[Profiler]]:
+    """``with`` 블록 동안 측정기를 활성화합니다. profiler가 None이면 측정하지 않습니다."""
+    global _active
+    if profiler is None:
+        yield None
+        return
+    previous = _active
+    _active = profiler
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+        _active = previous
+
+
+def timer(name: str) -> ContextManager[Any]:
+    """단계 시간을 기록하는 문맥 관리자 (측정하지 않으면 빈 문맥 관리자)"""
+    if _active is None:
+        return _NULL_TIMER
+    return _active.timer(name)
+
+
+def count(name: str, value: int = 1) -> None:
+    """계수를 더합니다. (측정하지 않으면 무시)"""
+    if _active is not None:
+        _active.count(name, value)
+
+
+def count_paragraph(runs: int) -> None:
+    """문단 하나와 그 문단의 run 수를 더합니다. (측정하지 않으면 무시)"""
+    if _active is not None:
+        _active.count("paragraphs")
+        _active.count("runs", runs)
+
+
+def timed(name: str, fn: _F) -> _F:
+    """호출 시간을 단계 시간으로 기록하는 함수를 반환 (측정하지 않으면 fn 그대로)"""
+    profiler = _active
+    if profiler is None:
+        return fn
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            profiler.add_time(name, time.perf_counter() - start)
+
+    return wrapper  # type: ignore[return-value]
+
+
+def profiled(name: str) -> Callable[[_F], _F]:
+    """함수의 호출 시간을 단계 시간으로 기록하는 데코레이터 (측정 여부는 호출할 때 확인)"""
+
+    def decorator(fn: _F) -> _F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            profiler = _active
+            if profiler is None:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                profiler.add_time(name, time.perf_counter() - start)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+def combine_reports(results: List[Dict[str, Any]], top: int = 20) -> Dict[str, Any]:
+    """문서별 처리 결과의 측정 결과를 하나의 보고서로 합칩니다.
+
+    Args:
+        results: ``parse_hwpx_file`` 처리 결과 목록 (profile이 없는 결과는 제외)
+        top: 남길 가장 느린 의약품 수
+
+    Returns:
+        Dict[str, Any]: stages, counters(문서 전체 합계), slowest_drugs(문서 전체에서 가장
+            느린 의약품), documents(문서별 측정 결과)
+    """
+    stages: Dict[str, Dict[str, Any]] = {}
+    counters: Dict[str, int] = {}
+    drugs: List[Dict[str, Any]] = []
+    documents = []
+    for result in results:
+        report = result.get("profile")
+        if report is None:
+            continue
+        documents.append({"input_file": result["input_file"], **report})
+        for name, stage in report["stages"].items():
+            total = stages.setdefault(name, {"calls": 0, "total": 0.0, "max": 0.0})
+            total["calls"] += stage["calls"]
+            total["total"] = round(total["total"] + stage["total"], 6)
+            total["max"] = max(total["max"], stage["max"])
+        for name, value in report["counters"].items():
+            counters[name] = counters.get(name, 0) + value
+        drugs.extend(
+            {"document": result["input_file"], **drug}
+            for drug in report["drugs"]["slowest"]
+        )
+    drugs.sort(key=lambda drug: drug["seconds"], reverse=True)
+    names = sorted(stages, key=lambda name: float(stages[name]["total"]), reverse=True)
+    return {
+        "stages": {name: stages[name] for name in names},
+        "counters": dict(sorted(counters.items())),
+        "slowest_drugs": drugs[:top],
+        "documents": documents,
+    }
@@ -0,0 +1,83 @@
+"""
+JSON 직렬화
+
+orjson이 설치되어 있으면 orjson을, 없으면 표준 라이브러리 json을 사용합니다.
+두 구현 모두 키 순서를 그대로 유지하고 한글을 이스케이프하지 않으므로, 같은
+입력에 대해 항상 같은 바이트를 출력합니다.
+"""
+
+import json
+from typing import Any
+
+from kp_parser.utils.profiler import count
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson이 없는 환경
+    orjson = None  # type: ignore[assignment]
+
+
+class JsonSerializer:
+    """JSON 직렬화 도구
+
+    기본값은 공백 없는 압축 형식이며, pretty를 지정하면 2칸 들여쓰기로 출력합니다.
+    """
+
+    def __init__(self, pretty: bool = False, use_orjson: bool = True):
+        """초기화
+
+        Args:
+            pretty: True면 2칸 들여쓰기 (디버그용), False면 압축 형식
+            use_orjson: False면 orjson이 설치되어 있어도 표준 라이브러리 json 사용
+        """
+        self.pretty = pretty
+        self.use_orjson = use_orjson and orjson is not None
+        if self.use_orjson:
+            self._option = orjson.OPT_INDENT_2 if pretty else 0
+        elif pretty:
+            self._encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+        else:
+            self._encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+    @property
+    def name(self) -> str:
+        """사용 중인 구현 이름 ("orjson" 또는 "json")"""
+        return "orjson" if self.use_orjson else "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        """객체를 UTF-8 JSON 바이트로 직렬화합니다.
+
+        Args:
+            obj: 직렬화할 객체
+
+        Returns:
+            bytes: JSON 바이트
+        """
+        if self.use_orjson:
+            return orjson.dumps(obj, option=self._option)
+        return self._encoder.encode(obj).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        """JSON 바이트를 객체로 역직렬화합니다.
+
+        Args:
+            data: JSON 바이트
+
+        Returns:
+            Any: 역직렬화한 객체
+        """
+        if self.use_orjson:
+            return orjson.loads(data)
+        return json.loads(data)
+
+    def dump(self, obj: Any, path: str) -> None:
+        """객체를 JSON 파일로 저장합니다.
+
+        Args:
+            obj: 직렬화할 객체
+            path: 저장할 파일 경로
+        """
+        data = self.dumps(obj)
+        with open(path, "wb") as f:
+            f.write(data)
+        count("bytes_written", len(data))
@@ -0,0 +1,395 @@
+"""
+벡터 이미지(WMF/EMF) 변환 단계
+
+브라우저에서 표시할 수 없는 WMF/EMF 이미지를 section 파싱 전에 문서 단위로 모아
+PNG로 변환합니다. 여러 파일을 LibreOffice(soffice) 한 번의 실행에 묶어 넘겨 프로세스
+시작 비용을 줄이고, 묶음들은 작업자 스레드마다 별도 사용자 프로필을 쓰는 soffice로
+동시에 변환합니다.
+
+변환 결과는 원본 내용 해시(SHA-256)를 키로 캐시 디렉토리에 저장하므로 같은 이미지는
+여러 문서와 여러 실행에 걸쳐 한 번만 변환합니다. soffice가 실행되었는데도 결과 파일이
+만들어지지 않은 이미지는 실패 기록을 남겨 다음 실행에서 다시 시도하지 않으며
+(``retry_failed``로 다시 시도), soffice를 찾을 수 없거나 실행하지 못했거나 제한 시간을
+넘긴 경우처럼 이미지와 관계없는 실패는 기록하지 않고 다음 실행에서 다시 변환합니다.
+문서별 변환 결과는 ``ConversionReport``로 정리하여 JSON 파일로 저장합니다.
+
+캐시 경로:
+    변환 결과 ``<cache_dir>/<해시 앞 2자리>/<해시>.png``
+    실패 기록 ``<cache_dir>/<해시 앞 2자리>/<해시>.failed``
+"""
+
+import hashlib
+import os
+import queue
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from kp_parser.utils.image_source import ImageSource
+from kp_parser.utils.logger import logger
+from kp_parser.utils.serializer import JsonSerializer
+
+# 변환 대상 확장자
+VECTOR_EXTENSIONS = (".wmf", ".emf")
+
+# 변환 결과 확장자
+CONVERTED_EXTENSION = ".png"
+
+# 문서별 변환 결과 보고서 파일 이름 (출력 디렉토리 아래)
+REPORT_FILE = "vector_images.json"
+
+# 변환 결과 상태
+STATUS_CONVERTED = "converted"  # 이번 실행에서 변환
+STATUS_CACHED = "cached"  # 캐시된 변환 결과 사용
+STATUS_FAILED = "failed"  # 변환 실패 (캐시된 실패 기록 포함)
+
+# 실패 원인으로 남길 soffice 출력 길이
+_ERROR_TAIL = 500
+
+
+def read_converted(image_meta: Dict[str, Any]) -> Optional[Tuple[str, bytes]]:
+    """이미지 정보에 기록된 변환 결과를 읽습니다.
+
+    Args:
+        image_meta: content.hpf 이미지 정보 (``VectorImageConverter.convert_images`` 결과)
+
+    Returns:
+        Optional[Tuple[str, bytes]]: (확장자를 바꾼 이미지 경로, PNG 데이터).
+            변환 결과가 없거나 읽을 수 없으면 None
+    """
+    converted = image_meta.get("converted")
+    if not converted:
+        return None
+    try:
+        with open(converted["path"], "rb") as f:
+            data = f.read()
+    except OSError as e:
+        logger.warning(
+            f"변환된 이미지를 읽을 수 없어 원본을 사용합니다: {converted['path']} - {e}"
+        )
+        return None
+    href = os.path.splitext(image_meta["path"])[0] + CONVERTED_EXTENSION
+    return href, data
+
+
+class ConversionReport:
+    """문서 하나의 벡터 이미지 변환 결과"""
+
+    def __init__(self, document: str):
+        """초기화
+
+        Args:
+            document: 문서(.hwpx) 경로
+        """
+        self.document = document
+        self.images: List[Dict[str, Any]] = []
+
+    def add(
+        self,
+        image_id: str,
+        href: str,
+        status: str,
+        digest: Optional[str] = None,
+        error: Optional[str] = None,
+    ) -> None:
+        """이미지 하나의 변환 결과를 기록합니다."""
+        self.images.append(
+            {
+                "id": image_id,
+                "href": href,
+                "hash": digest,
+                "status": status,
+                "error": error,
+            }
+        )
+
+    def summary(self) -> Dict[str, int]:
+        """상태별 이미지 수"""
+        counts = {STATUS_CONVERTED: 0, STATUS_CACHED: 0, STATUS_FAILED: 0}
+        for image in self.images:
+            counts[image["status"]] += 1
+        return counts
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "document": self.document,
+            "summary": self.summary(),
+            "images": self.images,
+        }
+
+    def save(self, path: str) -> None:
+        """보고서를 JSON 파일로 저장합니다."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        JsonSerializer(pretty=True).dump(self.to_dict(), path)
+
+
+class VectorImageConverter:
+    """WMF/EMF 이미지를 soffice로 묶어서 PNG로 변환하고 내용 해시 기준으로 캐시"""
+
+    def __init__(
+        self,
+        cache_dir: str,
+        workers: int = 1,
+        batch_size: int = 50,
+        timeout: float = 600.0,
+        soffice: Optional[str] = None,
+        retry_failed: bool = False,
+    ):
+        """초기화
+
+        Args:
+            cache_dir: 변환 결과 캐시 디렉토리
+            workers: 동시에 실행할 soffice 프로세스 수
+            batch_size: soffice 한 번에 넘길 최대 파일 수
+            timeout: soffice 한 번의 실행 제한 시간 (초)
+            soffice: soffice 실행 파일 경로 (None이면 PATH에서 soffice, libreoffice 순으로 찾음)
+            retry_failed: True면 이전에 실패한 이미지도 다시 변환
+
+        Raises:
+            ValueError: workers 또는 batch_size가 1보다 작은 경우
+        """
+        if workers < 1:
+            raise ValueError(f"변환 작업자 수는 1 이상이어야 합니다: {workers}")
+        if batch_size < 1:
+            raise ValueError(f"변환 묶음 크기는 1 이상이어야 합니다: {batch_size}")
+        self.cache_dir = cache_dir
+        self.workers = workers
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.soffice = soffice or shutil.which("soffice") or shutil.which("libreoffice")
+        self.retry_failed = retry_failed
+
+    def _cache_path(self, digest: str, extension: str) -> str:
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}{extension}")
+
+    def _read_failure(self, digest: str) -> Optional[str]:
+        """캐시된 실패 기록 (없으면 None)"""
+        if self.retry_failed:
+            return None
+        try:
+            with open(self._cache_path(digest, ".failed"), encoding="utf-8") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    def _store(self, digest: str, source_path: str) -> None:
+        """변환 결과를 캐시로 옮김 (같은 파일시스템 안에서 이름만 바꿈)"""
+        target_path = self._cache_path(digest, CONVERTED_EXTENSION)
+        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+        os.replace(source_path, target_path)
+        failed_path = self._cache_path(digest, ".failed")
+        if os.path.exists(failed_path):
+            os.remove(failed_path)
+
+    def _store_failure(self, digest: str, error: str) -> None:
+        failed_path = self._cache_path(digest, ".failed")
+        os.makedirs(os.path.dirname(failed_path), exist_ok=True)
+        with open(failed_path, "w", encoding="utf-8") as f:
+            f.write(error)
+
+    def _run_soffice(
+        self, soffice: str, profile_dir: str, out_dir: str, input_paths: List[str]
+    ) -> Tuple[Optional[str], bool]:
+        """soffice 한 번으로 여러 파일을 변환
+
+        Returns:
+            Tuple[Optional[str], bool]: (실패 원인, 실행 오류 여부). 성공하면 원인은 None.
+                soffice를 실행하지 못했거나 제한 시간을 넘긴 경우 실행 오류로 봅니다.
+        """
+        command = [
+            soffice,
+            # 동시에 실행하는 soffice가 서로의 프로필을 잠그지 않도록 작업자별 프로필 사용
+            f"-env:UserInstallation=file://{os.path.abspath(profile_dir)}",
+            "--headless",
+            "--norestore",
+            "--convert-to",
+            CONVERTED_EXTENSION[1:],
+            "--outdir",
+            out_dir,
+            *input_paths,
+        ]
+        try:
+            completed = subprocess.run(
+                command,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                timeout=self.timeout,
+            )
+        except subprocess.TimeoutExpired:
+            return f"변환 제한 시간 초과 ({self.timeout}초)", True
+        except OSError as e:
+            return f"soffice 실행 실패: {e}", True
+        if completed.returncode != 0:
+            output = completed.stdout.decode("utf-8", "replace")[-_ERROR_TAIL:]
+            return f"soffice 종료 코드 {completed.returncode}: {output}", False
+        return None, False
+
+    def _convert_batch(
+        self,
+        soffice: str,
+        batch: List[Tuple[str, str, bytes]],
+        profiles: "queue.Queue[str]",
+    ) -> Tuple[Dict[str, Optional[str]], bool]:
+        """묶음 하나를 변환
+
+        Returns:
+            Tuple[Dict[str, Optional[str]], bool]: (해시별 실패 원인(성공하면 None),
+                soffice 실행 오류 여부)
+        """
+        profile_dir = profiles.get()
+        work_dir = tempfile.mkdtemp(prefix="convert_", dir=self.cache_dir)
+        try:
+            input_paths = []
+            for digest, extension, data in batch:
+                input_path = os.path.join(work_dir, f"{digest}{extension}")
+                with open(input_path, "wb") as f:
+                    f.write(data)
+                input_paths.append(input_path)
+
+            out_dir = os.path.join(work_dir, "out")
+            run_error, transient = self._run_soffice(
+                soffice, profile_dir, out_dir, input_paths
+            )
+
+            errors: Dict[str, Optional[str]] = {}
+            for digest, _, _ in batch:
+                output_path = os.path.join(out_dir, f"{digest}{CONVERTED_EXTENSION}")
+                if os.path.isfile(output_path) and os.path.getsize(output_path) > 0:
+                    self._store(digest, output_path)
+                    errors[digest] = None
+                else:
+                    errors[digest] = (
+                        run_error or "변환 결과 파일이 만들어지지 않았습니다."
+                    )
+            return errors, transient
+        finally:
+            shutil.rmtree(work_dir, ignore_errors=True)
+            profiles.put(profile_dir)
+
+    def _convert_pending(
+        self, pending: Dict[str, Tuple[str, bytes]]
+    ) -> Tuple[Dict[str, Optional[str]], Set[str]]:
+        """캐시에 없는 이미지를 묶음으로 나누어 작업자 풀에서 변환
+
+        Returns:
+            Tuple[Dict[str, Optional[str]], Set[str]]: (해시별 실패 원인(성공하면 None),
+                실패 기록을 남기지 않을 해시 (soffice 실행 오류로 실패))
+        """
+        soffice = self.soffice
+        if soffice is None:
+            logger.warning(
+                "soffice(LibreOffice)를 찾을 수 없어 WMF/EMF 이미지를 변환하지 않습니다."
+            )
+            error = "soffice(LibreOffice)를 찾을 수 없습니다."
+            return {digest: error for digest in pending}, set(pending)
+
+        items = [(digest, ext, data) for digest, (ext, data) in pending.items()]
+        # 작업자 수보다 묶음이 적지 않도록 묶음 크기를 조정
+        size = min(self.batch_size, max(1, -(-len(items) // self.workers)))
+        batches = [items[i : i + size] for i in range(0, len(items), size)]
+
+        # 동시에 실행되는 soffice마다 별도 사용자 프로필 (다른 문서의 변환과도 겹치지 않음)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        profile_root = tempfile.mkdtemp(prefix="profiles_", dir=self.cache_dir)
+        profiles: "queue.Queue[str]" = queue.Queue()
+        for i in range(min(self.workers, len(batches))):
+            profiles.put(os.path.join(profile_root, str(i)))
+
+        errors: Dict[str, Optional[str]] = {}
+        transient: Set[str] = set()
+        try:
+            with ThreadPoolExecutor(max_workers=profiles.qsize()) as executor:
+                for batch_errors, run_failed in executor.map(
+                    lambda batch: self._convert_batch(soffice, batch, profiles), batches
+                ):
+                    errors.update(batch_errors)
+                    if run_failed:
+                        transient.update(batch_errors)
+        finally:
+            shutil.rmtree(profile_root, ignore_errors=True)
+        return errors, transient
+
+    def convert_images(
+        self,
+        image_info: Dict[str, Any],
+        image_source: ImageSource,
+        document: str = "",
+    ) -> Tuple[Dict[str, Any], ConversionReport]:
+        """문서의 WMF/EMF 이미지를 모두 변환하고 변환 결과를 기록한 이미지 정보를 반환합니다.
+
+        변환에 성공한 이미지의 정보에는 ``converted``(path: 캐시된 PNG 경로, hash: 원본
+        해시)가 추가되며, section 파서는 원본 대신 이 PNG를 사용합니다.
+
+        Args:
+            image_info: 이미지 id별 이미지 정보
+            image_source: 이미지 원본을 읽을 이미지 소스
+            document: 보고서에 기록할 문서 경로
+
+        Returns:
+            Tuple[Dict[str, Any], ConversionReport]: (변환 결과를 반영한 이미지 정보, 변환 보고서)
+        """
+        report = ConversionReport(document)
+        # 해시별 (확장자, 데이터)와 해시를 참조하는 이미지 (id, href)
+        pending: Dict[str, Tuple[str, bytes]] = {}
+        targets: List[Tuple[str, str, str]] = []
+        converted_info = dict(image_info)
+
+        for image_id, image_meta in image_info.items():
+            href = image_meta.get("path") or ""
+            extension = os.path.splitext(href)[-1].lower()
+            if extension not in VECTOR_EXTENSIONS:
+                continue
+            data = image_source.read(href)
+            if data is None:
+                report.add(
+                    image_id,
+                    href,
+                    STATUS_FAILED,
+                    error="원본 이미지를 찾을 수 없습니다.",
+                )
+                continue
+            digest = hashlib.sha256(data).hexdigest()
+            targets.append((image_id, href, digest))
+            if digest in pending:
+                continue
+            if os.path.exists(self._cache_path(digest, CONVERTED_EXTENSION)):
+                continue
+            failure = self._read_failure(digest)
+            if failure is None:
+                pending[digest] = (extension, data)
+
+        if not targets and not report.images:
+            return converted_info, report
+
+        errors, transient = self._convert_pending(pending) if pending else ({}, set())
+        for digest, error in errors.items():
+            # soffice가 실행되었는데 결과가 없는 이미지만 실패 기록 (실행 오류는 다시 시도)
+            if error is not None and digest not in transient:
+                self._store_failure(digest, error)
+
+        for image_id, href, digest in targets:
+            cache_path = self._cache_path(digest, CONVERTED_EXTENSION)
+            if digest in errors and errors[digest] is not None:
+                report.add(image_id, href, STATUS_FAILED, digest, errors[digest])
+            elif os.path.exists(cache_path):
+                status = STATUS_CONVERTED if digest in errors else STATUS_CACHED
+                converted_info[image_id] = {
+                    **image_info[image_id],
+                    "converted": {"path": cache_path, "hash": digest},
+                }
+                report.add(image_id, href, status, digest)
+            else:
+                report.add(
+                    image_id, href, STATUS_FAILED, digest, self._read_failure(digest)
+                )
+
+        summary = report.summary()
+        logger.info(
+            f"벡터 이미지 변환: 변환 {summary[STATUS_CONVERTED]}개, "
+            f"캐시 {summary[STATUS_CACHED]}개, 실패 {summary[STATUS_FAILED]}개"
+        )
+        return converted_info, report
@@ -0,0 +1,171 @@
+"""
+XML 파싱 백엔드
+
+표준 라이브러리 xml.etree.ElementTree(stdlib)와 lxml(C 구현의 파서, iterparse,
+컴파일된 XPath) 중 하나를 선택합니다. 두 백엔드의 요소는 같은 ElementTree
+API(tag, get, iter, 자식 순회 등)를 제공하므로 파서 코드는 백엔드에 관계없이
+동작합니다.
+
+lxml은 DOM 생성은 빠르지만 Python에서 요소에 접근할 때마다 프록시 객체를
+만들기 때문에, 문단을 요소 단위로 순회하는 section 파싱 전체로는 stdlib가 더
+빠를 수 있습니다. 기본값은 stdlib이며 ``benchmarks/bench_xml_backend.py``로
+문서별로 비교할 수 있습니다.
+"""
+
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from xml.etree import ElementTree
+
+from kp_parser.utils.config_utils import to_clark
+
+try:
+    from lxml import etree as lxml_etree
+except ImportError:  # pragma: no cover - lxml이 없는 환경
+    lxml_etree = None
+
+# 백엔드 이름
+BACKEND_AUTO = "auto"  # lxml이 있으면 lxml, 없으면 stdlib
+BACKEND_LXML = "lxml"
+BACKEND_STDLIB = "stdlib"
+XML_BACKENDS = (BACKEND_AUTO, BACKEND_LXML, BACKEND_STDLIB)
+
+# 요소에서 경로에 해당하는 하위 요소 목록을 찾는 함수
+Finder = Callable[[Any], List[Any]]
+
+
+class XmlBackend:
+    """표준 라이브러리 xml.etree.ElementTree 백엔드"""
+
+    name = BACKEND_STDLIB
+    # 잘못된 XML을 파싱할 때 발생하는 예외
+    parse_errors: Tuple[type, ...] = (ElementTree.ParseError,)
+
+    def __reduce__(self) -> Tuple[Callable[..., "XmlBackend"], Tuple[str]]:
+        # 작업자 프로세스로 보낼 때는 이름만 전달하고 그 프로세스의 백엔드를 사용
+        return get_xml_backend, (self.name,)
+
+    def fromstring(self, data: Union[str, bytes]) -> Any:
+        """XML 문자열/바이트를 파싱하여 루트 요소를 반환합니다."""
+        return ElementTree.fromstring(data)
+
+    def parse(self, source: Union[str, IO[bytes]]) -> Any:
+        """파일 경로 또는 바이너리 스트림을 파싱하여 루트 요소를 반환합니다."""
+        return ElementTree.parse(source).getroot()
+
+    def iterparse(
+        self, source: Union[str, IO[bytes]], events: Tuple[str, ...] = ("end",)
+    ) -> Iterator[Tuple[str, Any]]:
+        """XML을 점진적으로 파싱하며 (이벤트, 요소)를 생성합니다."""
+        return ElementTree.iterparse(source, events=events)
+
+    def tostring(self, elem: Any) -> bytes:
+        """요소를 XML 바이트로 직렬화합니다."""
+        return ElementTree.tostring(elem)
+
+    def compile_findall(self, path: str, namespaces: Dict[str, str]) -> Finder:
+        """접두사를 사용한 경로(예: ".//hh:charPr")를 미리 변환한 검색 함수를 반환합니다.
+
+        Args:
+            path: 경로
+            namespaces: 접두사별 네임스페이스 URI
+
+        Returns:
+            Finder: 요소를 받아 하위 요소 목록을 반환하는 함수
+        """
+        clark_path = to_clark(path, namespaces)
+        return lambda elem: elem.findall(clark_path)
+
+    def load_root(self, source: Any) -> Any:
+        """요소는 그대로, XML 문자열/바이트와 스트림은 파싱하여 루트 요소를 반환합니다."""
+        if ElementTree.iselement(source):
+            return source
+        if isinstance(source, (str, bytes)):
+            return self.fromstring(source)
+        return self.parse(source)
+
+
+class LxmlBackend(XmlBackend):
+    """lxml 백엔드 (C 구현 파서, iterparse, 컴파일된 XPath)
+
+    표준 라이브러리와 같은 트리가 되도록 주석과 처리 명령은 제거하고, 큰 문서도
+    파싱할 수 있도록 huge_tree를 사용합니다.
+    """
+
+    name = BACKEND_LXML
+
+    def __init__(self) -> None:
+        if lxml_etree is None:
+            raise ValueError("lxml이 설치되어 있지 않습니다.")
+        self.parse_errors = (lxml_etree.XMLSyntaxError, ElementTree.ParseError)
+        self._parser = lxml_etree.XMLParser(
+            huge_tree=True, remove_comments=True, remove_pis=True
+        )
+
+    def fromstring(self, data: Union[str, bytes]) -> Any:
+        # lxml은 인코딩 선언이 있는 str을 받지 않으므로 바이트로 변환
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return lxml_etree.fromstring(data, self._parser)
+
+    def parse(self, source: Union[str, IO[bytes]]) -> Any:
+        return lxml_etree.parse(source, self._parser).getroot()
+
+    def iterparse(
+        self, source: Union[str, IO[bytes]], events: Tuple[str, ...] = ("end",)
+    ) -> Iterator[Tuple[str, Any]]:
+        parsed: Iterator[Tuple[str, Any]] = lxml_etree.iterparse(
+            source,
+            events=events,
+            huge_tree=True,
+            remove_comments=True,
+            remove_pis=True,
+        )
+        return parsed
+
+    def tostring(self, elem: Any) -> bytes:
+        if not isinstance(elem, lxml_etree._Element):
+            return ElementTree.tostring(elem)
+        data: bytes = lxml_etree.tostring(elem)
+        return data
+
+    def compile_findall(self, path: str, namespaces: Dict[str, str]) -> Finder:
+        xpath = lxml_etree.XPath(path, namespaces=namespaces)
+        clark_path = to_clark(path, namespaces)
+
+        def find(elem: Any) -> List[Any]:
+            # 다른 백엔드에서 만든 요소가 들어오면 경로 검색으로 대신함
+            found: List[Any] = (
+                xpath(elem)
+                if isinstance(elem, lxml_etree._Element)
+                else elem.findall(clark_path)
+            )
+            return found
+
+        return find
+
+
+# 이름별 백엔드 (프로세스당 하나씩 생성)
+_BACKENDS: Dict[str, XmlBackend] = {}
+
+
+def get_xml_backend(name: Optional[str] = None) -> XmlBackend:
+    """이름에 해당하는 XML 백엔드를 반환합니다.
+
+    Args:
+        name: "auto", "lxml", "stdlib" 중 하나. None이면 "stdlib"
+            ("auto"는 lxml이 설치되어 있으면 lxml, 아니면 stdlib)
+
+    Returns:
+        XmlBackend: XML 백엔드
+
+    Raises:
+        ValueError: 지원하지 않는 이름이거나 lxml이 설치되어 있지 않은데 lxml을 지정한 경우
+    """
+    name = name or BACKEND_STDLIB
+    if name not in XML_BACKENDS:
+        raise ValueError(f"지원하지 않는 XML 백엔드입니다: {name}")
+    if name == BACKEND_AUTO:
+        name = BACKEND_LXML if lxml_etree is not None else BACKEND_STDLIB
+
+    if name not in _BACKENDS:
+        _BACKENDS[name] = LxmlBackend() if name == BACKEND_LXML else XmlBackend()
+    return _BACKENDS[name]
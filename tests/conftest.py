@@ -0,0 +1,33 @@
+"""
+테스트 공용 fixture
+
+benchmarks/hwpx_generator.py로 원본 문서 없이 합성 .hwpx 문서를 만들어 사용합니다.
+"""
+
+import os
+from typing import Dict
+
+import pytest
+from hwpx_generator import DocumentSpec, generate_hwpx
+
+# 테스트에 사용할 작은 합성 문서 (section 3개에 의약품 12개, 그림, 수식, 표 포함)
+SAMPLE_SPEC = DocumentSpec(sections=3, drugs=12, paragraphs=4)
+
+
+def read_tree(directory: str) -> Dict[str, bytes]:
+    """디렉토리 아래 모든 파일의 상대 경로별 내용"""
+    files = {}
+    for dirpath, _, filenames in os.walk(directory):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            with open(path, "rb") as f:
+                files[os.path.relpath(path, directory)] = f.read()
+    return files
+
+
+@pytest.fixture(scope="session")
+def sample_hwpx(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """합성 .hwpx 문서 경로"""
+    path = str(tmp_path_factory.mktemp("input") / "sample.hwpx")
+    generate_hwpx(path, SAMPLE_SPEC)
+    return path
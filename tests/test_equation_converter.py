@@ -0,0 +1,67 @@
+"""한글 수식 스크립트 LaTeX 변환 테스트"""
+
+import pytest
+
+from kp_parser.core.equation_converter import equation_node, hwp_to_latex, tokenize
+
+
+@pytest.mark.parametrize(
+    "script, latex",
+    [
+        ("a over b", r"\frac{a}{b}"),
+        ("1 over 2 x", r"\frac{1}{2} x"),
+        ("x ^{2} + y ^{2} = r ^{2}", "x^{2} + y^{2} = r^{2}"),
+        ("sqrt {b ^{2} - 4ac}", r"\sqrt{b^{2} - 4 ac}"),
+        ("sum _{i=1} ^{n} x_i", r"\sum_{i = 1}^{n} x_{i}"),
+        ("alpha LEQ beta", r"\alpha \leq \beta"),
+        ("matrix{a & b # c & d}", r"\begin{matrix} a & b \\ c & d \end{matrix}"),
+        ("left ( a right )", r"\left( a \right)"),
+        ('"농도"', r"\text{농도}"),
+    ],
+)
+def test_hwp_to_latex(script, latex):
+    assert hwp_to_latex(script) == latex
+
+
+@pytest.mark.parametrize(
+    "script, latex",
+    [
+        # 글꼴 키워드는 첨자와 명령의 인자 자리에서 다음 항목 하나에 적용
+        ("x^rm{A}", r"x^{\mathrm{A}}"),
+        ("sqrt rm x", r"\sqrt{\mathrm{x}}"),
+        ("rm{H_2 O}", r"\mathrm{H_{2} O}"),
+        # 첨자 앞의 부호는 첨자에 포함
+        ("10^-3", "10^{-3}"),
+        # 기호 키워드는 대문자만 인식
+        ("x in A", "x in A"),
+        ("A IN B", r"A \in B"),
+        # 단어 하나로 된 첨자는 함수 이름으로 바꾸지 않음
+        ("C_{max}", "C_{max}"),
+        ("C_{max} TIMES 0.5", r"C_{max} \times 0.5"),
+        ("x^{sin x}", r"x^{\sin x}"),
+    ],
+)
+def test_hwp_to_latex_operands(script, latex):
+    assert hwp_to_latex(script) == latex
+
+
+def test_malformed_script_does_not_raise():
+    assert hwp_to_latex("") == ""
+    assert hwp_to_latex("a over") == r"\frac{a}{}"
+    assert hwp_to_latex("left ( {x") == r"\left( {x} \right."
+
+
+def test_tokenize_skips_whitespace():
+    tokens = tokenize("a  over\tb")
+
+    assert [token[1] for token in tokens] == ["a", "over", "b"]
+
+
+def test_equation_node():
+    assert equation_node(" a over b ") == {
+        "equation": r"\frac{a}{b}",
+        "inline": True,
+        "type": "equation",
+        "version": 1,
+    }
+    assert equation_node("   ") is None
@@ -0,0 +1,80 @@
+"""header.xml 스타일 표(StyleTable) 테스트"""
+
+from hwpx_generator import HH
+
+from kp_parser.core.header_xml_parser import (
+    FORMAT_BOLD,
+    FORMAT_ITALIC,
+    FORMAT_SUBSCRIPT,
+    FORMAT_SUPERSCRIPT,
+    FORMAT_UNDERLINE,
+    HeaderXmlParser,
+    StyleTable,
+)
+
+# charPr 0: 서식 없음, 1: 굵게, 2: 기울임 + 밑줄, 3: 아래첨자, 4: 굵게 + 위첨자
+HEADER_XML = (
+    f'<?xml version="1.0" encoding="UTF-8"?><hh:head xmlns:hh="{HH}"><hh:refList>'
+    "<hh:charProperties>"
+    '<hh:charPr id="0" height="1000"><hh:underline type="NONE"/></hh:charPr>'
+    '<hh:charPr id="1" height="1000"><hh:bold/><hh:underline type="NONE"/></hh:charPr>'
+    '<hh:charPr id="2" height="1000"><hh:italic/><hh:underline type="BOTTOM"/>'
+    "</hh:charPr>"
+    '<hh:charPr id="3" height="1000"><hh:subscript/><hh:underline type="NONE"/>'
+    "</hh:charPr>"
+    '<hh:charPr id="4" height="1000"><hh:bold/><hh:superscript/>'
+    '<hh:underline type="NONE"/></hh:charPr>'
+    "</hh:charProperties><hh:styles>"
+    '<hh:style id="0" type="PARA" name="바탕글" engName="Normal" paraPrIDRef="0" '
+    'charPrIDRef="0" nextStyleIDRef="0" langID="1042" lockForm="0"/>'
+    "</hh:styles></hh:refList></hh:head>"
+)
+
+
+def test_char_pr_formats():
+    table = HeaderXmlParser().parse(HEADER_XML)
+
+    assert table.formats == [
+        0,
+        FORMAT_BOLD,
+        FORMAT_ITALIC | FORMAT_UNDERLINE,
+        FORMAT_SUBSCRIPT,
+        FORMAT_BOLD | FORMAT_SUPERSCRIPT,
+    ]
+    assert table["charPr-2"] == {
+        "bold": False,
+        "italic": True,
+        "underline": True,
+        "format": 0,
+    }
+    assert table["style-0"]["name"] == "바탕글"
+
+
+def test_text_format_lookup():
+    table = StyleTable(
+        {
+            "charPr-0": {"bold": True, "italic": True, "format": FORMAT_SUPERSCRIPT},
+            "charPr-3": {"underline": True},
+            "style-0": {"name": "바탕글"},
+        }
+    )
+
+    assert table.text_format("0") == FORMAT_BOLD | FORMAT_ITALIC | FORMAT_SUPERSCRIPT
+    assert table.text_format("3") == FORMAT_UNDERLINE
+    # 정의되지 않은 id와 잘못된 id는 서식 없음
+    assert table.text_format("1") == 0
+    assert table.text_format("9") == 0
+    assert table.text_format("-1") == 0
+    assert table.text_format(None) == 0
+    assert table.text_format("abc") == 0
+    assert len(table) == 3
+    assert StyleTable.of(table) is table
+
+
+def test_parse_reuses_table_for_same_header():
+    parser = HeaderXmlParser()
+    table = parser.parse(HEADER_XML)
+
+    # 같은 내용이면 문자열이든 바이트든 다시 파싱하지 않고 같은 스타일 표를 반환
+    assert HeaderXmlParser().parse(HEADER_XML.encode("utf-8")) is table
+    assert parser.parse(HEADER_XML.replace('id="4"', 'id="5"')) is not table
@@ -0,0 +1,39 @@
+"""이미지 저장소 테스트"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from kp_parser.utils.image_store import ImageStore
+
+
+def _put_and_save(args):
+    root, worker = args
+    store = ImageStore(root)
+    for i in range(10):
+        store.put(f"{worker}-{i}".encode("utf-8"), ".png")
+        store.save()
+
+
+def test_concurrent_saves_keep_every_entry(tmp_path):
+    # 배치 작업자들이 같은 저장소의 index.json을 동시에 갱신
+    root = str(tmp_path / "images")
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        list(executor.map(_put_and_save, [(root, worker) for worker in range(8)]))
+
+    assert len(ImageStore(root)._index) == 8 * 10
+
+
+def test_same_data_with_other_extension_is_stored_separately(tmp_path):
+    root = str(tmp_path / "images")
+    store = ImageStore(root)
+
+    png = store.put(b"image", ".png")
+    jpg = store.put(b"image", ".jpg")
+    store.save()
+
+    assert png["hash"] == jpg["hash"]
+    assert png["path"] != jpg["path"]
+    for stored in (png, jpg):
+        with open(os.path.join(root, stored["path"]), "rb") as f:
+            assert f.read() == b"image"
+    assert sorted(ImageStore(root)._index) == sorted([png["path"], jpg["path"]])
@@ -0,0 +1,69 @@
+"""JSONL, SQLite 출력 형식 테스트"""
+
+import json
+import os
+import sqlite3
+
+from conftest import SAMPLE_SPEC
+
+from kp_parser.pipeline import parse_hwpx_file
+from kp_parser.utils.output_utils import JSONL_FILE, SQLITE_FILE, JsonlSink
+from kp_parser.utils.serializer import JsonSerializer
+
+# 합성 문서의 의약품 제목 (문서 순서)
+EXPECTED_TITLES = [f"의약품{i}" for i in range(SAMPLE_SPEC.drugs)]
+
+
+def test_jsonl_rows_in_document_order(sample_hwpx, tmp_path):
+    result = parse_hwpx_file(sample_hwpx, str(tmp_path), output_format="jsonl")
+    assert result["status"] == "ok", result["error"]
+
+    with open(os.path.join(str(tmp_path), JSONL_FILE), encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+
+    assert result["drugs"] == len(records) == SAMPLE_SPEC.drugs
+    assert [record["title"] for record in records] == EXPECTED_TITLES
+    assert all(record["data"]["root"]["children"] for record in records)
+    # 단일 파일 형식은 이미지 저장소를 사용하므로 의약품별 폴더를 만들지 않음
+    assert sorted(os.listdir(str(tmp_path))) == [JSONL_FILE, "images"]
+
+
+def test_sqlite_rows_in_document_order(sample_hwpx, tmp_path):
+    # 백그라운드 쓰기 스레드에서 행을 넣어도 순서가 유지됨
+    result = parse_hwpx_file(
+        sample_hwpx, str(tmp_path), output_format="sqlite", write_queue=2
+    )
+    assert result["status"] == "ok", result["error"]
+
+    conn = sqlite3.connect(os.path.join(str(tmp_path), SQLITE_FILE))
+    try:
+        rows = conn.execute(
+            'SELECT title, section, "order", content FROM drugs ORDER BY id'
+        ).fetchall()
+    finally:
+        conn.close()
+
+    assert result["drugs"] == len(rows) == SAMPLE_SPEC.drugs
+    assert [row[0] for row in rows] == EXPECTED_TITLES
+    # section마다 order가 1부터 이어짐
+    per_section = SAMPLE_SPEC.drugs // SAMPLE_SPEC.sections
+    orders = list(range(1, per_section + 1)) * SAMPLE_SPEC.sections
+    assert [row[2] for row in rows] == orders
+    assert [row[1] for row in rows[::per_section]] == [
+        f"제{k + 1}장 분류{k + 1}" for k in range(SAMPLE_SPEC.sections)
+    ]
+    assert all(json.loads(row[3])["root"]["children"] for row in rows)
+
+
+def test_jsonl_keeps_serializer_but_forces_compact_output(tmp_path):
+    serializer = JsonSerializer(pretty=True, use_orjson=False)
+    sink = JsonlSink(str(tmp_path), serializer)
+    sink.write({"title": "의약품0", "content": [{"type": "text"}]})
+    sink.close()
+
+    assert sink.serializer.name == "json"
+    assert not sink.serializer.pretty
+    with open(os.path.join(str(tmp_path), JSONL_FILE), encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    assert len(lines) == 1
+    assert json.loads(lines[0])["title"] == "의약품0"
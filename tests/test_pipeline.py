@@ -0,0 +1,221 @@
+"""parse_hwpx_file 병렬 파싱, 캐시, 증분 파싱, run_batch 테스트"""
+
+import os
+
+import pytest
+from conftest import SAMPLE_SPEC, read_tree
+from hwpx_generator import generate_hwpx
+
+import kp_parser.pipeline
+from kp_parser.pipeline import parse_hwpx_file, run_batch
+
+
+def test_batch_matches_single_document_runs(sample_hwpx, tmp_path):
+    other_hwpx = str(tmp_path / "other.hwpx")
+    generate_hwpx(other_hwpx, SAMPLE_SPEC._replace(drugs=6))
+    broken_hwpx = str(tmp_path / "broken.hwpx")
+    with open(broken_hwpx, "wb") as f:
+        f.write(b"not a zip file")
+
+    batch_dir = str(tmp_path / "batch")
+    results = run_batch([sample_hwpx, broken_hwpx, other_hwpx], batch_dir, workers=2)
+
+    # 입력 순서대로 결과를 반환하고, 실패한 문서가 있어도 나머지는 처리
+    assert [result["input_file"] for result in results] == [
+        sample_hwpx,
+        broken_hwpx,
+        other_hwpx,
+    ]
+    assert [result["status"] for result in results] == ["ok", "error", "ok"]
+    for hwpx_path in (sample_hwpx, other_hwpx):
+        stem = os.path.splitext(os.path.basename(hwpx_path))[0]
+        single_dir = str(tmp_path / "single" / stem)
+        assert parse_hwpx_file(hwpx_path, single_dir)["status"] == "ok"
+        assert read_tree(os.path.join(batch_dir, stem)) == read_tree(single_dir)
+
+
+@pytest.fixture(scope="module")
+def sequential_output(sample_hwpx, tmp_path_factory):
+    """순차 파싱 결과 (다른 실행 방식과 비교할 기준)"""
+    output_dir = str(tmp_path_factory.mktemp("sequential"))
+    result = parse_hwpx_file(sample_hwpx, output_dir)
+    assert result["status"] == "ok", result["error"]
+    assert result["drugs"] == SAMPLE_SPEC.drugs
+    return read_tree(output_dir)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"section_workers": 3},
+        {"stream": True},
+        {"section_workers": 2, "stream": True},
+        {"paragraph_workers": 2, "chunk_paragraphs": 5},
+        {"paragraph_workers": 3, "chunk_paragraphs": 1, "stream": True},
+        {"write_queue": 4},
+        {"write_queue": 1, "section_workers": 3},
+    ],
+    ids=[
+        "section_workers",
+        "stream",
+        "section_workers_stream",
+        "paragraph_workers",
+        "paragraph_workers_stream",
+        "write_queue",
+        "write_queue_section_workers",
+    ],
+)
+def test_parallel_output_matches_sequential(
+    sample_hwpx, sequential_output, tmp_path, options
+):
+    result = parse_hwpx_file(sample_hwpx, str(tmp_path), **options)
+
+    assert result["status"] == "ok", result["error"]
+    assert read_tree(str(tmp_path)) == sequential_output
+
+
+def test_cached_output_matches_sequential(
+    sample_hwpx, sequential_output, tmp_path, monkeypatch
+):
+    cache_dir = str(tmp_path / "cache")
+    miss = parse_hwpx_file(sample_hwpx, str(tmp_path / "miss"), cache_dir=cache_dir)
+    assert miss["status"] == "ok", miss["error"]
+    assert read_tree(str(tmp_path / "miss")) == sequential_output
+    assert len(os.listdir(cache_dir)) == 1
+
+    # 캐시 적중 시에는 XML을 파싱하지 않음
+    def fail(*args, **kwargs):
+        raise AssertionError("캐시된 문서를 다시 파싱했습니다.")
+
+    monkeypatch.setattr(kp_parser.pipeline, "_iter_document_drugs", fail)
+    hit = parse_hwpx_file(sample_hwpx, str(tmp_path / "hit"), cache_dir=cache_dir)
+    assert hit["status"] == "ok", hit["error"]
+    assert read_tree(str(tmp_path / "hit")) == sequential_output
+
+
+def test_incremental_skips_unchanged_and_removes_deleted(tmp_path):
+    hwpx_path = str(tmp_path / "doc.hwpx")
+    output_dir = str(tmp_path / "out")
+    # section이 하나면 뒤쪽 의약품을 줄여도 앞쪽 의약품의 문단은 그대로
+    spec = SAMPLE_SPEC._replace(sections=1, drugs=6)
+    generate_hwpx(hwpx_path, spec)
+
+    first = parse_hwpx_file(hwpx_path, output_dir, incremental=True)
+    assert first["drugs"] == 6
+    data_path = os.path.join(output_dir, "의약품0", "data.json")
+    mtime = os.stat(data_path).st_mtime_ns
+
+    second = parse_hwpx_file(hwpx_path, output_dir, incremental=True)
+    assert second["status"] == "ok", second["error"]
+    assert second["drugs"] == 0
+    assert os.stat(data_path).st_mtime_ns == mtime
+
+    generate_hwpx(hwpx_path, spec._replace(drugs=4))
+    third = parse_hwpx_file(hwpx_path, output_dir, incremental=True)
+    assert third["status"] == "ok", third["error"]
+    assert third["drugs"] == 0
+    assert sorted(
+        name for name in os.listdir(output_dir) if name != "manifest.json"
+    ) == [f"의약품{i}" for i in range(4)]
+
+
+def test_incremental_rebuild_matches_full_parse(tmp_path):
+    hwpx_path = str(tmp_path / "doc.hwpx")
+    output_dir = str(tmp_path / "out")
+    # 모든 본문 문단에 그림을 넣고 seed를 바꿔 의약품마다 참조하는 그림을 바꿈
+    spec = SAMPLE_SPEC._replace(sections=1, drugs=4, image_every=1)
+    generate_hwpx(hwpx_path, spec)
+    assert parse_hwpx_file(hwpx_path, output_dir, incremental=True)["drugs"] == 4
+
+    generate_hwpx(hwpx_path, spec._replace(seed=1))
+    result = parse_hwpx_file(hwpx_path, output_dir, incremental=True)
+    assert result["status"] == "ok", result["error"]
+    full_dir = str(tmp_path / "full")
+    assert parse_hwpx_file(hwpx_path, full_dir)["status"] == "ok"
+
+    # 다시 빌드한 의약품 폴더에 이전 실행의 그림이 남지 않음
+    tree = read_tree(output_dir)
+    del tree["manifest.json"]
+    assert tree == read_tree(full_dir)
+
+
+def test_incremental_rejects_single_file_format(sample_hwpx, tmp_path):
+    result = parse_hwpx_file(
+        sample_hwpx, str(tmp_path), incremental=True, output_format="jsonl"
+    )
+
+    assert result["status"] == "error"
+    assert result["error"].startswith("ValueError")
+
+
+def test_batch_keeps_same_named_documents_apart(sample_hwpx, tmp_path):
+    # 다른 디렉토리의 같은 이름 문서, 그리고 바뀐 이름과 겹치는 문서
+    paths = [
+        str(tmp_path / "a" / "doc.hwpx"),
+        str(tmp_path / "b" / "doc.hwpx"),
+        str(tmp_path / "c" / "doc_2.hwpx"),
+    ]
+    for i, path in enumerate(paths):
+        os.makedirs(os.path.dirname(path))
+        generate_hwpx(path, SAMPLE_SPEC._replace(drugs=3 + i))
+
+    batch_dir = str(tmp_path / "batch")
+    results = run_batch(paths, batch_dir, workers=2)
+
+    assert [os.path.basename(result["output_dir"]) for result in results] == [
+        "doc",
+        "doc_3",
+        "doc_2",
+    ]
+    assert [result["drugs"] for result in results] == [3, 4, 5]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"section_workers": 3},
+        {"paragraph_workers": 2, "chunk_paragraphs": 1},
+        {"section_workers": 3, "output_format": "jsonl"},
+        {"paragraph_workers": 2, "chunk_paragraphs": 1, "output_format": "jsonl"},
+    ],
+    ids=[
+        "section_workers",
+        "paragraph_workers",
+        "section_workers_store",
+        "paragraph_workers_store",
+    ],
+)
+def test_parallel_skips_images_outside_drugs(tmp_path, options):
+    # 첫 제목 앞의 문단과 부제목 문단의 그림은 어느 의약품에도 속하지 않음
+    hwpx_path = str(tmp_path / "doc.hwpx")
+    generate_hwpx(
+        hwpx_path,
+        SAMPLE_SPEC._replace(image_every=0, preface=3, subtitle_images=True),
+    )
+    output_format = options.get("output_format", "folder")
+    sequential_dir = str(tmp_path / "sequential")
+    parallel_dir = str(tmp_path / "parallel")
+
+    sequential = parse_hwpx_file(hwpx_path, sequential_dir, output_format=output_format)
+    parallel = parse_hwpx_file(hwpx_path, parallel_dir, **options)
+
+    assert sequential["status"] == "ok", sequential["error"]
+    assert parallel["status"] == "ok", parallel["error"]
+    assert read_tree(parallel_dir) == read_tree(sequential_dir)
+
+
+def test_batch_document_named_like_extract_dir(sample_hwpx, tmp_path):
+    # 디버그 모드의 압축 해제 폴더와 이름이 같은 문서
+    path = str(tmp_path / "in" / ".extract.hwpx")
+    os.makedirs(os.path.dirname(path))
+    generate_hwpx(path, SAMPLE_SPEC._replace(drugs=3))
+
+    batch_dir = str(tmp_path / "batch")
+    results = run_batch([sample_hwpx, path], batch_dir, workers=2, debug=True)
+
+    assert [result["status"] for result in results] == ["ok", "ok"]
+    assert os.path.basename(results[1]["output_dir"]) == ".extract_2"
+    assert sorted(os.listdir(os.path.join(batch_dir, ".extract"))) == [
+        ".extract_2",
+        "sample",
+    ]